@@ -32,6 +32,7 @@ class AdvancedMultiTimeframeAI:
                     '15m': {...},
                     '1h': {...}
                 }
+                as built by MarketDataFetcher.get_multi_timeframe_data()
         
         Returns:
             Decision dictionary with action, confidence, and analysis
@@ -74,32 +75,32 @@ You are an expert multi-timeframe cryptocurrency trader analyzing BTCUSDT.
 MULTI-TIMEFRAME ANALYSIS:
 
 📊 1-MINUTE TIMEFRAME (Scalping Entry):
-- Price: ${market_data_multi['1m'].get('price', 0):,.2f}
-- RSI: {market_data_multi['1m'].get('rsi', 50):.1f}
-- EMA(9): ${market_data_multi['1m'].get('ema_fast', 0):,.2f}
-- EMA(21): ${market_data_multi['1m'].get('ema_slow', 0):,.2f}
-- Volume Ratio: {market_data_multi['1m'].get('volume_ratio', 1.0):.2f}x
-- Trend: {market_data_multi['1m'].get('trend', 'NEUTRAL')}
-- ATR: ${market_data_multi['1m'].get('atr', 0):.2f}
+- Price: ${market_data_multi['1m'].price:,.2f}
+- RSI: {market_data_multi['1m'].rsi:.1f}
+- EMA(9): ${market_data_multi['1m'].ema_fast:,.2f}
+- EMA(21): ${market_data_multi['1m'].ema_slow:,.2f}
+- Volume Ratio: {market_data_multi['1m'].volume_ratio:.2f}x
+- Trend: {market_data_multi['1m'].trend}
+- ATR: ${market_data_multi['1m'].atr:.2f}
 
 📊 5-MINUTE TIMEFRAME (Short-term Context):
-- Price: ${market_data_multi['5m'].get('price', 0):,.2f}
-- RSI: {market_data_multi['5m'].get('rsi', 50):.1f}
-- Trend: {market_data_multi['5m'].get('trend', 'NEUTRAL')}
-- EMA Cross: {"Bullish" if market_data_multi['5m'].get('ema_fast', 0) > market_data_multi['5m'].get('ema_slow', 0) else "Bearish"}
-- Volume: {market_data_multi['5m'].get('volume_ratio', 1.0):.2f}x
+- Price: ${market_data_multi['5m'].price:,.2f}
+- RSI: {market_data_multi['5m'].rsi:.1f}
+- Trend: {market_data_multi['5m'].trend}
+- EMA Cross: {"Bullish" if market_data_multi['5m'].ema_fast > market_data_multi['5m'].ema_slow else "Bearish"}
+- Volume: {market_data_multi['5m'].volume_ratio:.2f}x
 
 📊 15-MINUTE TIMEFRAME (Medium-term Direction):
-- Price: ${market_data_multi['15m'].get('price', 0):,.2f}
-- RSI: {market_data_multi['15m'].get('rsi', 50):.1f}
-- Trend: {market_data_multi['15m'].get('trend', 'NEUTRAL')}
-- Price Position: {"Above EMAs" if market_data_multi['15m'].get('price', 0) > market_data_multi['15m'].get('ema_slow', 0) else "Below EMAs"}
+- Price: ${market_data_multi['15m'].price:,.2f}
+- RSI: {market_data_multi['15m'].rsi:.1f}
+- Trend: {market_data_multi['15m'].trend}
+- Price Position: {"Above EMAs" if market_data_multi['15m'].price > market_data_multi['15m'].ema_slow else "Below EMAs"}
 
 📊 1-HOUR TIMEFRAME (Overall Bias):
-- Price: ${market_data_multi['1h'].get('price', 0):,.2f}
-- RSI: {market_data_multi['1h'].get('rsi', 50):.1f}
-- Trend: {market_data_multi['1h'].get('trend', 'NEUTRAL')}
-- Major Trend: {"BULLISH" if market_data_multi['1h'].get('ema_fast', 0) > market_data_multi['1h'].get('ema_slow', 0) else "BEARISH"}
+- Price: ${market_data_multi['1h'].price:,.2f}
+- RSI: {market_data_multi['1h'].rsi:.1f}
+- Trend: {market_data_multi['1h'].trend}
+- Major Trend: {"BULLISH" if market_data_multi['1h'].ema_fast > market_data_multi['1h'].ema_slow else "BEARISH"}
 
 ADVANCED DECISION RULES:
 
@@ -150,7 +151,7 @@ RESPOND IN EXACT JSON FORMAT (no markdown, pure JSON):
 {{
     "action": "BUY" or "SELL" or "HOLD",
     "confidence": 0.0 to 1.0,
-    "entry_price": {market_data_multi['1m'].get('price', 0)},
+    "entry_price": {market_data_multi['1m'].price},
     "stop_loss": number,
     "take_profit": number,
     "timeframe_alignment": {{
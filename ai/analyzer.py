@@ -7,7 +7,13 @@ import json
 import logging
 from typing import Dict, Optional
 from google import genai
-from config.settings import AI_MODEL, AI_MAX_RETRIES, AI_TIMEOUT, TRADING_CONFIG
+from market.snapshot import MarketSnapshot
+from ai.decision_cache import DecisionCache
+from ai.prefilter import PreFilter
+from config.settings import (
+    AI_MODEL, AI_MAX_RETRIES, AI_TIMEOUT, TRADING_CONFIG, ORDER_BOOK_TOP_N, DECISION_CACHE_ENABLED,
+    PREFILTER_ENABLED
+)
 
 logger = logging.getLogger(__name__)
 
@@ -15,29 +21,54 @@ logger = logging.getLogger(__name__)
 class GeminiAnalyzer:
     """Handles AI analysis using Google Gemini API"""
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, decision_cache: Optional[DecisionCache] = None,
+                 prefilter: Optional[PreFilter] = None):
         """
         Initialize Gemini analyzer
         
         Args:
             api_key: Google Gemini API key
+            decision_cache: Reuses decisions for an unchanged market state
+                (defaults to a private cache when DECISION_CACHE_ENABLED)
+            prefilter: Answers HOLD locally when there is no setup
+                (defaults to a private one when PREFILTER_ENABLED)
         """
         self.client = genai.Client(api_key=api_key)
         self.model = AI_MODEL
         self.max_retries = AI_MAX_RETRIES
         self.timeout = AI_TIMEOUT
+        if decision_cache is None and DECISION_CACHE_ENABLED:
+            decision_cache = DecisionCache()
+        self.decision_cache = decision_cache
+        if prefilter is None and PREFILTER_ENABLED:
+            prefilter = PreFilter()
+        self.prefilter = prefilter
     
-    def analyze_market(self, market_data: Dict) -> Dict:
+    def analyze_market(self, market_data: MarketSnapshot) -> Dict:
         """
         Analyze market data using Gemini AI and generate trading decision
         
         Args:
-            market_data: Dictionary containing market data and indicators
+            market_data: Market snapshot with indicators
         
         Returns:
             Dictionary with trading action, confidence, and price levels
         """
         try:
+            if self.prefilter is not None:
+                screened = self.prefilter.screen(market_data)
+                if screened is not None:
+                    return screened
+            
+            if self.decision_cache is not None:
+                cached = self.decision_cache.get(market_data)
+                if cached is not None:
+                    logger.info(
+                        f"♻️ Cached AI Decision: {cached['action']} "
+                        f"(Confidence: {cached['confidence']:.2%}, {cached['cache_age']:.0f}s old)"
+                    )
+                    return cached
+            
             prompt = self._build_analysis_prompt(market_data)
             
             for attempt in range(self.max_retries):
@@ -54,6 +85,8 @@ class GeminiAnalyzer:
                         f"(Confidence: {ai_decision['confidence']:.2%})"
                     )
                     
+                    if self.decision_cache is not None:
+                        self.decision_cache.put(market_data, ai_decision)
                     return ai_decision
                     
                 except Exception as e:
@@ -67,22 +100,49 @@ class GeminiAnalyzer:
             return self._fallback_decision()
     
     @staticmethod
-    def _build_analysis_prompt(market_data: Dict) -> str:
+    def _build_analysis_prompt(market_data: MarketSnapshot) -> str:
         """Build analysis prompt for Gemini AI"""
+        order_book = ""
+        if market_data.book_imbalance is not None:
+            order_book = (
+                f"\n- Order Book: spread {market_data.spread_bps:.2f} bps, "
+                f"top-{ORDER_BOOK_TOP_N} imbalance {market_data.book_imbalance:+.2f}, "
+                f"microprice ${market_data.microprice:.2f}"
+            )
+        elif market_data.spread_bps is not None:
+            order_book = f"\n- Spread: {market_data.spread_bps:.2f} bps"
+        
+        regime = f"\n- Volatility Regime: {market_data.regime}" if market_data.regime else ""
+        
+        order_flow = ""
+        if market_data.candle_delta is not None:
+            order_flow = f"\n- Order Flow: candle volume delta {market_data.candle_delta:+.4f}"
+            if market_data.buy_ratio is not None:
+                order_flow += f", aggressive buys {market_data.buy_ratio:.0%}"
+            order_flow += f", {market_data.trade_rate:.1f} trades/s"
+            if market_data.activity_ratio is not None:
+                order_flow += f" ({market_data.activity_ratio:.1f}x normal)"
+            if market_data.trigger == 'trade_burst':
+                order_flow += " - ACTIVITY BURST, candle still open"
+        
         return f"""
 You are an expert cryptocurrency scalping trader. Analyze this market data and make a trading decision.
 
 MARKET DATA:
 - Symbol: {TRADING_CONFIG['symbol']}
-- Current Price: ${market_data['price']:.2f}
-- RSI: {market_data['rsi']:.2f}
-- Fast EMA (9): ${market_data['ema_fast']:.2f}
-- Slow EMA (21): ${market_data['ema_slow']:.2f}
-- ATR: ${market_data['atr']:.2f}
-- Current Volume: {market_data['volume']:.0f}
-- Average Volume: {market_data['avg_volume']:.0f}
-- Volume Ratio: {market_data['volume_ratio']:.2f}x
-- Trend: {market_data['trend']}
+- Current Price: ${market_data.price:.2f}
+- RSI: {market_data.rsi:.2f}
+- Fast EMA (9): ${market_data.ema_fast:.2f}
+- Slow EMA (21): ${market_data.ema_slow:.2f}
+- ATR: ${market_data.atr:.2f}
+- Bollinger Bands ({TRADING_CONFIG['bb_period']}, {TRADING_CONFIG['bb_std_dev']}): ${market_data.bb_lower:.2f} / ${market_data.bb_middle:.2f} / ${market_data.bb_upper:.2f}
+- MACD: {market_data.macd:.4f} (signal {market_data.macd_signal:.4f}, histogram {market_data.macd_hist:.4f})
+- VWAP: ${market_data.vwap:.2f}
+- Stochastic %K/%D: {market_data.stoch_k:.1f} / {market_data.stoch_d:.1f}{order_book}{order_flow}
+- Current Volume: {market_data.volume:.0f}
+- Average Volume: {market_data.avg_volume:.0f}
+- Volume Ratio: {market_data.volume_ratio:.2f}x
+- Trend: {market_data.trend}{regime}
 
 TRADING RULES:
 1. BUY when: Fast EMA crosses above Slow EMA, RSI < {TRADING_CONFIG['rsi_overbought']}, volume > average, bullish trend
@@ -95,7 +155,7 @@ Respond in EXACT JSON format (no markdown):
 {{
     "action": "BUY" or "SELL" or "HOLD",
     "confidence": 0.0 to 1.0,
-    "entry_price": {market_data['price']},
+    "entry_price": {market_data.price},
     "stop_loss": price level,
     "take_profit": price level,
     "reasoning": "brief explanation"
@@ -14,6 +14,8 @@ from ai.autonomous_trader import AutonomousAITrader
 from ai.backup_services import BackupAIService
 from trading.executor import TradeExecutor
 from market.data_fetcher import MarketDataFetcher
+from market.bus import TRIGGER_MONITOR
+from market.snapshot import MarketSnapshot
 from config.settings import (
     AUTONOMOUS_MODE, ENABLE_BACKUP_APIS,
     GEMINI_API_KEY, OPENAI_API_KEY, ANTHROPIC_API_KEY,
@@ -33,21 +35,20 @@ class FullyAutonomousTrader:
     """
     
     def __init__(self, market_fetcher: MarketDataFetcher, 
-                 trade_executor: TradeExecutor):
+                 trade_executor: TradeExecutor, market_bus=None):
         """
         Initialize autonomous trader
         
         Args:
             market_fetcher: Market data fetcher
             trade_executor: Trade executor
+            market_bus: Optional MarketDataBus to consume snapshots from
+                instead of fetching on our own timer
         """
         self.market_fetcher = market_fetcher
+        self.market_bus = market_bus
         self.trade_executor = trade_executor
         
-        # Initialize Gemini autonomous AI
-        logger.info("🤖 Initializing autonomous AI trader...")
-        self.ai_trader = AutonomousAITrader(GEMINI_API_KEY)
-        
         # Initialize backup services
         self.backup_service = None
         if ENABLE_BACKUP_APIS:
@@ -55,6 +56,10 @@ class FullyAutonomousTrader:
             self.backup_service = BackupAIService()
             self._setup_backup_services()
         
+        # Initialize Gemini autonomous AI (hedged with the backups when slow)
+        logger.info("🤖 Initializing autonomous AI trader...")
+        self.ai_trader = AutonomousAITrader(GEMINI_API_KEY, backup_service=self.backup_service)
+        
         # Trading state
         self.is_running = False
         self.stop_event = Event()
@@ -139,14 +144,24 @@ class FullyAutonomousTrader:
         logger.info("AUTONOMOUS TRADING LOOP STARTED")
         logger.info("═" * 60)
         
+        subscription = self.market_bus.subscribe('autonomous_trader') if self.market_bus else None
+        
         while self.is_running and not self.stop_event.is_set():
             try:
-                # Step 1: Fetch market data
-                market_data = self.market_fetcher.get_market_data()
+                # Step 1: Fetch market data (or take the shared bus snapshot)
+                if subscription:
+                    market_data = subscription.get(timeout=TRADING_CONFIG['check_interval'] * 2)
+                else:
+                    market_data = self.market_fetcher.get_market_data()
                 
                 if not market_data:
                     logger.warning("⚠️ Could not fetch market data, waiting...")
-                    time.sleep(TRADING_CONFIG['check_interval'])
+                    if not subscription:
+                        time.sleep(TRADING_CONFIG['check_interval'])
+                    continue
+                
+                # Dead market cadence: no analysis this cycle
+                if market_data.trigger == TRIGGER_MONITOR:
                     continue
                 
                 # Step 2: Get AI decision (AUTONOMOUS)
@@ -180,16 +195,20 @@ class FullyAutonomousTrader:
                 # Log decision to audit trail
                 self._log_autonomous_decision(decision, market_data)
                 
-                # Wait before next check
-                time.sleep(TRADING_CONFIG['check_interval'])
+                # Wait before next check (the bus paces subscribers itself)
+                if not subscription:
+                    time.sleep(TRADING_CONFIG['check_interval'])
                 
             except Exception as e:
                 logger.error(f"❌ Autonomous loop error: {e}")
                 # Fallback to technical analysis only
                 self._safe_fallback()
                 time.sleep(TRADING_CONFIG['check_interval'] * 2)
+        
+        if subscription:
+            self.market_bus.unsubscribe(subscription)
     
-    def _auto_execute_trade(self, decision: Dict, market_data: Dict) -> Dict:
+    def _auto_execute_trade(self, decision: Dict, market_data: MarketSnapshot) -> Dict:
         """
         Automatically execute trade without human approval
         
@@ -237,7 +256,10 @@ class FullyAutonomousTrader:
         
         if self.backup_service:
             try:
-                market_data = self.market_fetcher.get_market_data()
+                if self.market_bus and self.market_bus.latest:
+                    market_data = self.market_bus.latest
+                else:
+                    market_data = self.market_fetcher.get_market_data()
                 
                 if market_data:
                     logger.info("🔄 Trying backup AI service...")
@@ -267,7 +289,7 @@ class FullyAutonomousTrader:
             except Exception as e:
                 logger.error(f"❌ Fallback error: {e}")
     
-    def _log_autonomous_decision(self, decision: Dict, market_data: Dict,
+    def _log_autonomous_decision(self, decision: Dict, market_data: MarketSnapshot,
                                  is_fallback: bool = False) -> None:
         """Log autonomous decision for audit trail"""
         try:
@@ -280,9 +302,9 @@ class FullyAutonomousTrader:
                 'entry_price': decision['entry_price'],
                 'stop_loss': decision['stop_loss'],
                 'take_profit': decision['take_profit'],
-                'market_price': market_data['price'],
-                'market_rsi': market_data['rsi'],
-                'market_trend': market_data['trend'],
+                'market_price': market_data.price,
+                'market_rsi': market_data.rsi,
+                'market_trend': market_data.trend,
                 'execution_status': decision.get('execution', {}).get('status'),
                 'reasoning': decision['reasoning'],
                 'is_fallback': is_fallback,
@@ -308,6 +330,19 @@ class FullyAutonomousTrader:
             'backup_services_status': (
                 self.backup_service.get_status()
                 if self.backup_service else None
+            ),
+            'decision_cache': (
+                self.ai_trader.decision_cache.get_stats()
+                if self.ai_trader.decision_cache else None
+            ),
+            'prefilter': (
+                self.ai_trader.prefilter.get_stats()
+                if self.ai_trader.prefilter else None
+            ),
+            'conversation_memory': self.ai_trader.memory.get_stats(),
+            'hedging': (
+                self.backup_service.get_hedge_stats()
+                if self.backup_service else None
             )
         }
     
@@ -7,16 +7,27 @@ Direct AI decision-making without human intervention
 import json
 import logging
 import time
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 from datetime import datetime
 from google import genai
+from google.genai import types
+from market.snapshot import MarketSnapshot
+from ai.decision_cache import DecisionCache
+from ai.prefilter import PreFilter
+from ai.conversation_memory import ConversationMemory
+from ai.backup_services import BackupAIService
 from config.settings import (
     AI_MODEL, AI_MAX_RETRIES, AI_TIMEOUT, TRADING_CONFIG,
-    GEMINI_API_KEY
+    GEMINI_API_KEY, DECISION_CACHE_ENABLED, PREFILTER_ENABLED, AI_FAST_MODE, AI_HEDGED_REQUESTS
 )
 
 logger = logging.getLogger(__name__)
 
+# Fields each response type must contain
+DECISION_FIELDS = ('action', 'confidence', 'entry_price', 'stop_loss', 'take_profit', 'reasoning')
+REFINEMENT_FIELDS = ('refined_action', 'refined_confidence')
+VALIDATION_FIELDS = ('approval',)
+
 
 class AutonomousAITrader:
     """
@@ -27,22 +38,44 @@ class AutonomousAITrader:
     - No human intervention required
     """
     
-    def __init__(self, primary_api_key: str, backup_api_key: Optional[str] = None):
+    def __init__(self, primary_api_key: str, backup_api_key: Optional[str] = None,
+                 decision_cache: Optional[DecisionCache] = None,
+                 prefilter: Optional[PreFilter] = None, fast_mode: bool = AI_FAST_MODE,
+                 backup_service: Optional[BackupAIService] = None,
+                 hedged: bool = AI_HEDGED_REQUESTS):
         """
         Initialize autonomous AI trader
         
         Args:
             primary_api_key: Gemini API key (primary)
             backup_api_key: Backup API key (OpenAI, Anthropic, etc.)
+            decision_cache: Reuses validated decisions for an unchanged market
+                state (defaults to a private cache when DECISION_CACHE_ENABLED)
+            prefilter: Answers HOLD locally when there is no setup
+                (defaults to a private one when PREFILTER_ENABLED)
+            fast_mode: Ask for analysis, refinement and self-assessment in
+                one model call and check the risk rules locally instead of
+                three sequential calls
+            backup_service: Other providers to race against Gemini on the
+                analysis call
+            hedged: Fire backup providers when Gemini is slow instead of
+                only after it failed
         """
-        self.primary_client = genai.Client(api_key=primary_api_key)
-        self.backup_api_key = backup_api_key
         self.model = AI_MODEL
         self.max_retries = AI_MAX_RETRIES
         self.timeout = AI_TIMEOUT
+        # Bounded so a slow call cannot hold a hedge worker indefinitely
+        self.primary_client = genai.Client(
+            api_key=primary_api_key,
+            http_options=types.HttpOptions(timeout=int(self.timeout * 1000))
+        )
+        self.backup_api_key = backup_api_key
+        self.backup_service = backup_service
+        self.hedged = hedged
+        self.fast_mode = fast_mode
         
-        # Conversation history for multi-turn discussions
-        self.conversation_history: List[Dict] = []
+        # Token-budgeted conversation for multi-turn discussions
+        self.memory = ConversationMemory()
         
         # Decision audit trail
         self.decision_log: List[Dict] = []
@@ -51,7 +84,17 @@ class AutonomousAITrader:
         self.current_market_state = None
         self.last_decision = None
         
-    def analyze_and_execute(self, market_data: Dict, execute: bool = True) -> Dict:
+        # Validated decisions by quantized market state
+        if decision_cache is None and DECISION_CACHE_ENABLED:
+            decision_cache = DecisionCache()
+        self.decision_cache = decision_cache
+        
+        # Local screening before any model call
+        if prefilter is None and PREFILTER_ENABLED:
+            prefilter = PreFilter()
+        self.prefilter = prefilter
+        
+    def analyze_and_execute(self, market_data: MarketSnapshot, execute: bool = True) -> Dict:
         """
         Full autonomous analysis and execution
         
@@ -63,27 +106,37 @@ class AutonomousAITrader:
             Decision with execution status
         """
         try:
-            # Step 1: Initial analysis
-            logger.info("🤖 Starting autonomous AI analysis...")
-            initial_analysis = self._initial_analysis(market_data)
-            
-            # Step 2: Multi-turn refinement
-            logger.info("💭 Refining analysis through AI conversation...")
-            refined_decision = self._refine_decision(initial_analysis, market_data)
-            
-            # Step 3: Risk validation
-            logger.info("⚠️ Validating risk parameters...")
-            risk_validated = self._validate_risk(refined_decision, market_data)
+            # Step 0: Local screening, then a decision for the same market state
+            final_decision = None
+            if self.prefilter is not None:
+                final_decision = self.prefilter.screen(market_data)
+            if final_decision is None and self.decision_cache is not None:
+                final_decision = self.decision_cache.get(market_data)
+                if final_decision is not None:
+                    logger.info(
+                        f"♻️ Reusing cached decision: {final_decision['action']} "
+                        f"({final_decision['cache_age']:.0f}s old)"
+                    )
             
-            # Step 4: Confidence verification
-            logger.info("✅ Verifying confidence levels...")
-            final_decision = self._verify_confidence(risk_validated)
+            if final_decision is None:
+                # Steps 1-4: Model analysis
+                final_decision = self._model_decision(market_data)
+                
+                # Rule-based backup decisions are not worth keeping
+                if self.decision_cache is not None and not final_decision.get('using_backup'):
+                    self.decision_cache.put(market_data, final_decision)
             
             # Step 5: Log decision
             self._log_decision(final_decision, market_data)
             
-            # Step 6: Execute if approved
-            if execute and final_decision['action'] != 'HOLD':
+            # Step 6: Execute if approved (a cached decision was already acted on
+            # when it was made; re-entering on it would skip the model)
+            if final_decision.get('cached') and final_decision['action'] != 'HOLD':
+                final_decision['execution'] = {
+                    'status': 'HOLD_NO_EXECUTION',
+                    'reason': 'Cached decision - not executed again'
+                }
+            elif execute and final_decision['action'] != 'HOLD':
                 final_decision['execution'] = {
                     'status': 'READY_FOR_EXECUTION',
                     'timestamp': datetime.now().isoformat(),
@@ -103,32 +156,81 @@ class AutonomousAITrader:
             logger.error(f"❌ Autonomous analysis error: {e}")
             return self._fallback_decision('ERROR', str(e))
     
-    def _initial_analysis(self, market_data: Dict) -> Dict:
+    def _model_decision(self, market_data: MarketSnapshot) -> Dict:
         """
-        Phase 1: Initial AI analysis
+        Ask the model for a decision and verify its confidence
+        
+        Fast mode makes one call and checks the risk rules locally; otherwise
+        the analysis is refined and risk-validated over three calls.
         """
-        try:
-            prompt = self._build_initial_prompt(market_data)
+        if self.fast_mode:
+            # Steps 1-3 in one round trip
+            logger.info("⚡ Starting single-call AI analysis...")
+            analysis = self._fast_analysis(market_data)
             
+            logger.info("⚠️ Checking risk rules locally...")
+            risk_validated = self._check_risk_rules(analysis)
+        else:
+            # Step 1: Initial analysis
+            logger.info("🤖 Starting autonomous AI analysis...")
+            initial_analysis = self._initial_analysis(market_data)
+            
+            # Step 2: Multi-turn refinement
+            logger.info("💭 Refining analysis through AI conversation...")
+            refined_decision = self._refine_decision(initial_analysis, market_data)
+            
+            # Step 3: Risk validation
+            logger.info("⚠️ Validating risk parameters...")
+            risk_validated = self._validate_risk(refined_decision, market_data)
+        
+        # Step 4: Confidence verification
+        logger.info("✅ Verifying confidence levels...")
+        return self._verify_confidence(risk_validated)
+    
+    def _generate_decision(self, prompt: str, market_data: MarketSnapshot) -> Tuple[Dict, str]:
+        """
+        Send an analysis prompt, hedged across the backup providers if enabled
+        
+        Returns:
+            Parsed decision and the reply text that produced it
+        """
+        if not (self.hedged and self.backup_service is not None):
             response = self.primary_client.models.generate_content(
                 model=self.model,
                 contents=prompt
             )
+            return self._parse_response(response.text), response.text
+        
+        replies = {}
+        
+        def ask_gemini() -> Dict:
+            response = self.primary_client.models.generate_content(
+                model=self.model,
+                contents=prompt
+            )
+            replies['gemini'] = response.text
+            return self._parse_response(response.text)
+        
+        decision = self.backup_service.get_hedged_analysis(market_data, primary=ask_gemini, prompt=prompt)
+        if decision is None:
+            raise RuntimeError("No AI provider returned a decision")
+        if decision['source'] == 'gemini':
+            return decision, replies['gemini']
+        return decision, json.dumps(decision)
+    
+    def _initial_analysis(self, market_data: MarketSnapshot) -> Dict:
+        """
+        Phase 1: Initial AI analysis
+        """
+        try:
+            prompt = self._build_initial_prompt(market_data)
+            self.memory.track_prompt(prompt)
             
-            analysis = self._parse_response(response.text)
+            analysis, reply = self._generate_decision(prompt, market_data)
             
             # Add to conversation history
-            self.conversation_history.append({
-                'role': 'user',
-                'content': prompt,
-                'timestamp': datetime.now().isoformat()
-            })
-            
-            self.conversation_history.append({
-                'role': 'ai',
-                'content': response.text,
-                'timestamp': datetime.now().isoformat()
-            })
+            self.memory.add('user', prompt)
+            self.memory.add('ai', reply)
             
             logger.info(f"📊 Initial analysis: {analysis['action']} ({analysis['confidence']:.2%})")
             
@@ -141,7 +243,33 @@ class AutonomousAITrader:
                 return self._backup_analysis(market_data)
             raise
     
-    def _refine_decision(self, initial: Dict, market_data: Dict) -> Dict:
+    def _fast_analysis(self, market_data: MarketSnapshot) -> Dict:
+        """
+        Fast mode Phases 1-2: analysis and refinement in one model call
+        """
+        try:
+            prompt = self._build_fast_prompt(market_data)
+            self.memory.track_prompt(prompt)
+            
+            result, reply = self._generate_decision(prompt, market_data)
+            
+            analysis = self._merge_refinement(result, result)
+            
+            self.memory.add('user', prompt)
+            self.memory.add('ai', reply)
+            
+            logger.info(f"⚡ Single-call analysis: {analysis['action']} ({analysis['confidence']:.2%})")
+            
+            return analysis
+            
+        except Exception as e:
+            logger.error(f"Fast analysis error: {e}")
+            if self.backup_api_key:
+                logger.info("🔄 Switching to backup API...")
+                return self._backup_analysis(market_data)
+            raise
+    
+    def _refine_decision(self, initial: Dict, market_data: MarketSnapshot) -> Dict:
         """
         Phase 2: Multi-turn conversation to refine decision
         Ask AI follow-up questions
@@ -175,44 +303,37 @@ Provide a refined decision in JSON format with:
             # Get refinement from AI
             response = self.primary_client.models.generate_content(
                 model=self.model,
-                contents=self.conversation_history + [{
-                    'parts': [{'text': refinement_prompt}]
-                }]
+                contents=self.memory.build_contents(refinement_prompt)
             )
             
-            refinement = self._parse_response(response.text)
+            refinement = self._parse_response(response.text, REFINEMENT_FIELDS)
             
             # Add to conversation
-            self.conversation_history.append({
-                'role': 'user',
-                'content': refinement_prompt,
-                'timestamp': datetime.now().isoformat()
-            })
-            
-            self.conversation_history.append({
-                'role': 'ai',
-                'content': response.text,
-                'timestamp': datetime.now().isoformat()
-            })
+            self.memory.add('user', refinement_prompt)
+            self.memory.add('ai', response.text)
             
             logger.info(f"💭 Refined decision: {refinement.get('refined_action', initial['action'])} "
                        f"({refinement.get('refined_confidence', initial['confidence']):.2%})")
             
-            # Merge with initial analysis
-            return {
-                **initial,
-                'action': refinement.get('refined_action', initial['action']),
-                'confidence': refinement.get('refined_confidence', initial['confidence']),
-                'key_factors': refinement.get('key_factors', []),
-                'risks': refinement.get('risks', []),
-                'probability_profit': refinement.get('probability_profit', 0.5)
-            }
+            return self._merge_refinement(initial, refinement)
             
         except Exception as e:
             logger.warning(f"Refinement error: {e}, using initial analysis")
             return initial
     
-    def _validate_risk(self, decision: Dict, market_data: Dict) -> Dict:
+    @staticmethod
+    def _merge_refinement(initial: Dict, refinement: Dict) -> Dict:
+        """Apply refined_* fields over an initial analysis"""
+        return {
+            **initial,
+            'action': refinement.get('refined_action', initial['action']),
+            'confidence': refinement.get('refined_confidence', initial['confidence']),
+            'key_factors': refinement.get('key_factors', []),
+            'risks': refinement.get('risks', []),
+            'probability_profit': refinement.get('probability_profit', 0.5)
+        }
+    
+    def _validate_risk(self, decision: Dict, market_data: MarketSnapshot) -> Dict:
         """
         Phase 3: Validate risk parameters
         Ensure decision complies with risk management rules
@@ -249,12 +370,10 @@ Respond with JSON:
             
             response = self.primary_client.models.generate_content(
                 model=self.model,
-                contents=self.conversation_history + [{
-                    'parts': [{'text': risk_prompt}]
-                }]
+                contents=self.memory.build_contents(risk_prompt)
             )
             
-            validation = self._parse_response(response.text)
+            validation = self._parse_response(response.text, VALIDATION_FIELDS)
             
             logger.info(f"⚠️ Risk validation: {validation.get('approval', 'UNKNOWN')} "
                        f"(Safety: {validation.get('safety_score', 0):.2%})")
@@ -271,6 +390,67 @@ Respond with JSON:
             logger.warning(f"Risk validation error: {e}")
             return {**decision, 'risk_validated': False, 'safety_score': 0}
     
+    def _check_risk_rules(self, decision: Dict) -> Dict:
+        """
+        Fast mode Phase 3: the risk validation rules, evaluated locally
+        
+        Fills the same fields as ``_validate_risk``; the safety score is the
+        share of rules passed and any failed rule rejects the trade.
+        """
+        action = decision['action']
+        if action == 'HOLD':
+            return {
+                **decision,
+                'risk_validated': True,
+                'approval_status': 'APPROVE',
+                'safety_score': 1.0,
+                'suggested_adjustments': {}
+            }
+        
+        try:
+            entry = float(decision['entry_price'])
+            stop = float(decision['stop_loss'])
+            target = float(decision['take_profit'])
+            probability = float(decision.get('probability_profit', 0.5))
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Risk check error: {e}")
+            return {**decision, 'risk_validated': False, 'safety_score': 0}
+        
+        risk = entry - stop if action == 'BUY' else stop - entry
+        reward = target - entry if action == 'BUY' else entry - target
+        min_reward_risk = TRADING_CONFIG['min_reward_risk']
+        
+        failures = []
+        adjustments = {}
+        if risk <= 0 or reward <= 0:
+            failures.append(f"stop/target on the wrong side of entry for {action}")
+        else:
+            if reward / risk < min_reward_risk:
+                failures.append(f"reward/risk {reward / risk:.2f} below {min_reward_risk}")
+                adjustments['take_profit'] = (
+                    entry + risk * min_reward_risk if action == 'BUY' else entry - risk * min_reward_risk
+                )
+            if entry > 0 and risk / entry > TRADING_CONFIG['risk_per_trade']:
+                failures.append(f"stop {risk / entry:.2%} away exceeds {TRADING_CONFIG['risk_per_trade']:.0%} risk")
+        if probability < TRADING_CONFIG['min_win_probability']:
+            failures.append(f"win probability {probability:.0%} below {TRADING_CONFIG['min_win_probability']:.0%}")
+        
+        rules = 4
+        safety_score = (rules - len(failures)) / rules
+        approval = 'REJECT' if failures else 'APPROVE'
+        
+        logger.info(f"⚠️ Risk rules: {approval} (Safety: {safety_score:.2%})"
+                    + (f" - {'; '.join(failures)}" if failures else ""))
+        
+        return {
+            **decision,
+            'risk_validated': not failures,
+            'approval_status': approval,
+            'safety_score': safety_score,
+            'suggested_adjustments': adjustments,
+            'risk_reason': '; '.join(failures) or 'All risk rules met'
+        }
+    
     def _verify_confidence(self, decision: Dict) -> Dict:
         """
         Phase 4: Final confidence verification
@@ -298,18 +478,18 @@ Respond with JSON:
         
         return decision
     
-    def _log_decision(self, decision: Dict, market_data: Dict) -> None:
+    def _log_decision(self, decision: Dict, market_data: MarketSnapshot) -> None:
         """Log AI decision for audit trail"""
         log_entry = {
             'timestamp': datetime.now().isoformat(),
             'decision': decision,
             'market_data': {
-                'price': market_data.get('price'),
-                'rsi': market_data.get('rsi'),
-                'trend': market_data.get('trend'),
-                'volume_ratio': market_data.get('volume_ratio')
+                'price': market_data.price,
+                'rsi': market_data.rsi,
+                'trend': market_data.trend,
+                'volume_ratio': market_data.volume_ratio
             },
-            'conversation_turns': len(self.conversation_history),
+            'conversation_turns': self.memory.summarized_turns + len(self.memory.turns),
             'ai_reasoning': decision.get('reasoning', 'N/A')
         }
         
@@ -323,21 +503,70 @@ Respond with JSON:
         except Exception as e:
             logger.warning(f"Could not log decision: {e}")
     
-    def _build_initial_prompt(self, market_data: Dict) -> str:
+    def _build_initial_prompt(self, market_data: MarketSnapshot) -> str:
         """Build comprehensive initial analysis prompt"""
+        return self._build_market_brief(market_data) + f"""
+RESPOND IN VALID JSON (no markdown, no code blocks):
+{{
+    "action": "BUY"|"SELL"|"HOLD",
+    "confidence": 0.60,
+    "entry_price": {market_data.price},
+    "stop_loss": {market_data.price - market_data.atr},
+    "take_profit": {market_data.price + market_data.atr * 2},
+    "reasoning": "Clear explanation of decision",
+    "market_structure": "trending|ranging|volatile",
+    "next_resistance": 0,
+    "next_support": 0,
+    "signal_strength": "weak|moderate|strong"
+}}
+"""
+    
+    def _build_fast_prompt(self, market_data: MarketSnapshot) -> str:
+        """Build the single-call prompt: analysis, self-critique and profit probability"""
+        return self._build_market_brief(market_data) + f"""
+BEFORE ANSWERING, CHALLENGE YOUR OWN ANALYSIS:
+1. What are the KEY FACTORS supporting this decision?
+2. What RISKS or CONTRADICTIONS exist?
+3. Should the confidence be ADJUSTED?
+4. What is the probability of this trade being PROFITABLE?
+Report the decision AFTER this review as refined_action / refined_confidence.
+
+RISK RULES (checked automatically after your answer):
+- Reward/risk of at least {TRADING_CONFIG['min_reward_risk']}:1 between take profit and stop loss
+- Stop loss no further than {TRADING_CONFIG['risk_per_trade']*100}% from entry
+- Winning probability of at least {TRADING_CONFIG['min_win_probability']:.0%}
+
+RESPOND IN VALID JSON (no markdown, no code blocks):
+{{
+    "action": "BUY"|"SELL"|"HOLD",
+    "confidence": 0.60,
+    "entry_price": {market_data.price},
+    "stop_loss": {market_data.price - market_data.atr},
+    "take_profit": {market_data.price + market_data.atr * 2},
+    "reasoning": "Clear explanation of decision",
+    "market_structure": "trending|ranging|volatile",
+    "refined_action": "BUY"|"SELL"|"HOLD",
+    "refined_confidence": 0.0-1.0,
+    "key_factors": ["supporting factor", ...],
+    "risks": ["risk factor", ...],
+    "probability_profit": 0.0-1.0
+}}
+"""
+    
+    def _build_market_brief(self, market_data: MarketSnapshot) -> str:
+        """Market state, task and trading rules shared by the analysis prompts"""
         return f"""
 You are an EXPERT autonomous cryptocurrency trading AI with years of professional trading experience.
 
 CURRENT MARKET STATE:
 - Symbol: {TRADING_CONFIG['symbol']}
-- Price: ${market_data['price']:.2f}
-- RSI(14): {market_data['rsi']:.2f}
-- EMA(9): ${market_data.get('ema_fast', 0):.2f}
-- EMA(21): ${market_data.get('ema_slow', 0):.2f}
-- ATR: ${market_data.get('atr', 0):.2f}
-- Volume: {market_data['volume']:.0f} (Ratio: {market_data.get('volume_ratio', 1):.2f}x)
-- Trend: {market_data['trend']}
-- Signal Strength: {market_data.get('signal_strength', 'UNKNOWN')}
+- Price: ${market_data.price:.2f}
+- RSI(14): {market_data.rsi:.2f}
+- EMA(9): ${market_data.ema_fast:.2f}
+- EMA(21): ${market_data.ema_slow:.2f}
+- ATR: ${market_data.atr:.2f}
+- Volume: {market_data.volume:.0f} (Ratio: {market_data.volume_ratio:.2f}x)
+- Trend: {market_data.trend}
 
 YOUR TASK:
 1. ANALYZE current market structure and momentum
@@ -354,24 +583,16 @@ TRADING RULES (STRICT):
 - Min Confidence for trade: 60%
 - Min Risk/Reward: 1:2
 - Max leverage: 2:1
-
-RESPOND IN VALID JSON (no markdown, no code blocks):
-{{
-    "action": "BUY"|"SELL"|"HOLD",
-    "confidence": 0.60,
-    "entry_price": {market_data['price']},
-    "stop_loss": {market_data['price'] - market_data.get('atr', 10)},
-    "take_profit": {market_data['price'] + market_data.get('atr', 10) * 2},
-    "reasoning": "Clear explanation of decision",
-    "market_structure": "trending|ranging|volatile",
-    "next_resistance": 0,
-    "next_support": 0,
-    "signal_strength": "weak|moderate|strong"
-}}
 """
     
-    def _parse_response(self, response_text: str) -> Dict:
-        """Parse AI response with robust error handling"""
+    def _parse_response(self, response_text: str, required: tuple = DECISION_FIELDS) -> Dict:
+        """
+        Parse AI response with robust error handling
+        
+        Args:
+            response_text: Model output (optionally in a markdown code block)
+            required: Fields the response must contain
+        """
         try:
             # Clean markdown if present
             if '```json' in response_text:
@@ -383,7 +604,6 @@ RESPOND IN VALID JSON (no markdown, no code blocks):
             result = json.loads(response_text)
             
             # Validate critical fields
-            required = ['action', 'confidence', 'entry_price', 'stop_loss', 'take_profit', 'reasoning']
             for field in required:
                 if field not in result:
                     logger.error(f"Missing required field: {field}")
@@ -398,7 +618,7 @@ RESPOND IN VALID JSON (no markdown, no code blocks):
             logger.error(f"Parse error: {e}")
             raise
     
-    def _backup_analysis(self, market_data: Dict) -> Dict:
+    def _backup_analysis(self, market_data: MarketSnapshot) -> Dict:
         """
         Fallback to backup API when primary fails
         Can integrate OpenAI, Anthropic, or other services
@@ -409,11 +629,11 @@ RESPOND IN VALID JSON (no markdown, no code blocks):
         # For now, use simple technical analysis
         
         # Simple fallback: Use technical indicators only
-        price = market_data['price']
-        rsi = market_data['rsi']
-        ema_fast = market_data.get('ema_fast', price)
-        ema_slow = market_data.get('ema_slow', price)
-        atr = market_data.get('atr', price * 0.01)
+        price = market_data.price
+        rsi = market_data.rsi
+        ema_fast = market_data.ema_fast
+        ema_slow = market_data.ema_slow
+        atr = market_data.atr
         
         # Rule-based decision
         if ema_fast > ema_slow and rsi < 70:
@@ -452,9 +672,14 @@ RESPOND IN VALID JSON (no markdown, no code blocks):
             }
         }
     
+    @property
+    def conversation_history(self) -> List[Dict]:
+        """Verbatim turns still in the memory window"""
+        return self.memory.get_history()
+    
     def get_conversation_history(self) -> List[Dict]:
-        """Get full conversation history for audit/review"""
-        return self.conversation_history
+        """Get the recent conversation (older turns live in the memory summary)"""
+        return self.memory.get_history()
     
     def get_decision_log(self) -> List[Dict]:
         """Get all logged decisions"""
@@ -462,7 +687,7 @@ RESPOND IN VALID JSON (no markdown, no code blocks):
     
     def clear_conversation(self) -> None:
         """Clear conversation history for new analysis"""
-        self.conversation_history = []
+        self.memory.clear()
         logger.info("🗑️ Conversation history cleared")
 
 
@@ -473,7 +698,7 @@ class GeminiAnalyzer:
     def __init__(self, api_key: str):
         self.trader = AutonomousAITrader(api_key)
     
-    def analyze_market(self, market_data: Dict) -> Dict:
+    def analyze_market(self, market_data: MarketSnapshot) -> Dict:
         """Simple analysis without full autonomy"""
         decision = self.trader.analyze_and_execute(market_data, execute=False)
         
@@ -484,5 +709,6 @@ class GeminiAnalyzer:
             'entry_price': decision['entry_price'],
             'stop_loss': decision['stop_loss'],
             'take_profit': decision['take_profit'],
-            'reasoning': decision['reasoning']
+            'reasoning': decision['reasoning'],
+            'cached': decision.get('cached', False)
         }
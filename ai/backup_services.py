@@ -6,10 +6,22 @@ Automatic fallback when primary service fails
 
 import json
 import logging
+import statistics
+import time
 import requests
-from typing import Dict, Optional
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import partial
+from threading import Lock
+from typing import Callable, Dict, Optional
 from datetime import datetime
-from config.settings import TRADING_CONFIG
+from market.snapshot import MarketSnapshot
+from ai.prefilter import PreFilter
+from config.settings import (
+    TRADING_CONFIG, PREFILTER_ENABLED, AI_PROVIDER_TIMEOUT, AI_HEDGED_REQUESTS, AI_HEDGE_DELAY,
+    AI_HEDGE_DEFAULT_DELAY, AI_HEDGE_LATENCY_PERCENTILE, AI_HEDGE_LATENCY_WINDOW,
+    AI_HEDGE_MIN_SAMPLES, AI_HEDGE_TIMEOUT, AI_HEDGE_MAX_WORKERS
+)
 
 logger = logging.getLogger(__name__)
 
@@ -17,11 +29,41 @@ logger = logging.getLogger(__name__)
 class BackupAIService:
     """Multi-service AI backup system"""
     
-    def __init__(self):
-        """Initialize backup services"""
+    def __init__(self, prefilter: Optional[PreFilter] = None, hedged: bool = AI_HEDGED_REQUESTS,
+                 hedge_delay: Optional[float] = AI_HEDGE_DELAY,
+                 provider_timeout: float = AI_PROVIDER_TIMEOUT):
+        """
+        Initialize backup services
+        
+        Args:
+            prefilter: Answers HOLD locally when there is no setup
+                (defaults to a private one when PREFILTER_ENABLED)
+            hedged: Race the services in ``get_analysis`` instead of trying
+                them one after another
+            hedge_delay: Fixed seconds before the next provider is fired
+                (None: each provider's observed p95 answer latency)
+            provider_timeout: Seconds before a single provider request is
+                given up, so abandoned calls cannot hold hedge workers
+        """
         self.services = {}
         self.priority_order = []
         self.last_used = None
+        if prefilter is None and PREFILTER_ENABLED:
+            prefilter = PreFilter()
+        self.prefilter = prefilter
+        
+        # Hedged requests
+        self.hedged = hedged
+        self.hedge_delay = hedge_delay
+        self.provider_timeout = provider_timeout
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = Lock()
+        self._in_flight = 0  # Provider calls submitted and not finished
+        self._latencies: Dict[str, deque] = {}  # provider -> recent answer latencies (s)
+        self.hedge_stats = {
+            'requests': 0, 'hedged': 0, 'no_decision': 0, 'abandoned': 0,
+            'hedges_skipped_busy': 0, 'wins': {}
+        }
         
     def add_service(self, name: str, api_key: str, service_type: str, priority: int = 1) -> None:
         """
@@ -51,7 +93,7 @@ class BackupAIService:
         
         logger.info(f"✅ Backup service added: {name} (Priority: {priority})")
     
-    def get_analysis(self, market_data: Dict, max_attempts: int = 3) -> Optional[Dict]:
+    def get_analysis(self, market_data: MarketSnapshot, max_attempts: int = 3) -> Optional[Dict]:
         """
         Try all services in priority order until one succeeds
         
@@ -62,6 +104,14 @@ class BackupAIService:
         Returns:
             Analysis decision or None if all fail
         """
+        if self.prefilter is not None:
+            screened = self.prefilter.screen(market_data)
+            if screened is not None:
+                return screened
+        
+        if self.hedged:
+            return self.get_hedged_analysis(market_data, max_providers=max_attempts)
+        
         attempts = 0
         
         for service_name in self.priority_order:
@@ -77,24 +127,7 @@ class BackupAIService:
             try:
                 logger.info(f"🔄 Trying backup service: {service_name}")
                 
-                if service['type'] == 'openai':
-                    result = self._analyze_with_openai(
-                        market_data,
-                        service['api_key']
-                    )
-                elif service['type'] == 'anthropic':
-                    result = self._analyze_with_anthropic(
-                        market_data,
-                        service['api_key']
-                    )
-                elif service['type'] == 'together':
-                    result = self._analyze_with_together(
-                        market_data,
-                        service['api_key']
-                    )
-                else:
-                    logger.warning(f"Unknown service type: {service['type']}")
-                    continue
+                result = self._dispatch(service, market_data)
                 
                 if result:
                     service['last_used'] = datetime.now().isoformat()
@@ -113,7 +146,183 @@ class BackupAIService:
         logger.error("❌ All backup services exhausted")
         return None
     
-    def _analyze_with_openai(self, market_data: Dict, api_key: str) -> Optional[Dict]:
+    def get_hedged_analysis(self, market_data: MarketSnapshot,
+                            primary: Optional[Callable[[], Optional[Dict]]] = None,
+                            prompt: Optional[str] = None, hedge_delay: Optional[float] = None,
+                            timeout: float = AI_HEDGE_TIMEOUT,
+                            max_providers: Optional[int] = None) -> Optional[Dict]:
+        """
+        Race providers with staggered starts; the first valid decision wins
+        
+        The primary (if given) starts first. Whenever the last fired provider
+        has not answered within the hedge delay - or one fails - the next
+        active service in priority order is fired in parallel. Providers still
+        queued when a decision arrives are cancelled; calls already in flight
+        cannot be interrupted, so they run out in the background (bounded by
+        ``provider_timeout``) and are ignored. No hedge is fired while every
+        worker is busy with such calls.
+        
+        Args:
+            market_data: Market data to analyze
+            primary: Zero-argument call returning a parsed decision (e.g. Gemini)
+            prompt: Prompt for the backup services (default: their own)
+            hedge_delay: Seconds to wait before firing the next provider
+                (default: ``self.hedge_delay``, else the provider's p95 latency)
+            timeout: Seconds to wait for a decision in total
+            max_providers: Providers fired at most (default: all)
+        
+        Returns:
+            First valid decision (``source`` names the provider) or None
+        """
+        providers = []
+        if primary is not None:
+            providers.append(('gemini', primary))
+        for name in self.priority_order:
+            service = self.services[name]
+            if service['status'] == 'active':
+                providers.append((name, partial(self._dispatch, service, market_data, prompt)))
+        if max_providers is not None:
+            providers = providers[:max_providers]
+        if not providers:
+            logger.error("❌ No active AI provider to ask")
+            return None
+        
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=AI_HEDGE_MAX_WORKERS,
+                thread_name_prefix='ai-hedge'
+            )
+        
+        waiting = list(providers)  # Not fired yet
+        pending = {}  # future -> provider name
+        fired = []
+        skipped_busy = 0
+        
+        def launch() -> bool:
+            nonlocal skipped_busy
+            with self._lock:
+                if pending and self._in_flight >= AI_HEDGE_MAX_WORKERS:
+                    skipped_busy += 1
+                    return False
+                self._in_flight += 1
+            name, call = waiting.pop(0)
+            fired.append(name)
+            pending[self._executor.submit(self._run_provider, name, call)] = name
+            return True
+        
+        deadline = time.monotonic() + timeout
+        decision = None
+        launch()
+        
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            delay = hedge_delay or self.hedge_delay or self.latency_p95(fired[-1])
+            done, _ = wait(pending, timeout=min(delay, remaining) if waiting else remaining,
+                           return_when=FIRST_COMPLETED)
+            
+            if not done:
+                if waiting:
+                    logger.info(
+                        f"⏱️ No answer from {', '.join(pending.values())} after {delay:.1f}s - "
+                        f"hedging with {waiting[0][0]}"
+                    )
+                    if not launch():
+                        logger.warning("⏳ All hedge workers busy - waiting instead of hedging")
+                continue
+            
+            for future in done:
+                del pending[future]
+                result = future.result()
+                if result is not None and decision is None:
+                    decision = result
+            if decision is not None:
+                break
+            # A failure frees the slot for the next provider right away
+            if waiting:
+                launch()
+        
+        cancelled = sum(future.cancel() for future in pending)
+        abandoned = len(pending) - cancelled
+        with self._lock:
+            self._in_flight -= cancelled  # Never reached _run_provider
+            stats = self.hedge_stats
+            stats['requests'] += 1
+            stats['hedged'] += len(fired) > 1
+            stats['abandoned'] += abandoned
+            stats['hedges_skipped_busy'] += skipped_busy
+            if decision is None:
+                stats['no_decision'] += 1
+            else:
+                stats['wins'][decision['source']] = stats['wins'].get(decision['source'], 0) + 1
+                self.last_used = decision['source']
+        
+        if decision is None:
+            logger.error("❌ No AI provider returned a decision in time")
+        else:
+            logger.info(
+                f"🏁 {decision['source']} answered first"
+                + (f" ({abandoned} slower request(s) abandoned)" if abandoned else "")
+            )
+        return decision
+    
+    def latency_p95(self, name: str) -> float:
+        """
+        Seconds a provider usually answers within, used as its hedge delay
+        
+        Returns:
+            AI_HEDGE_LATENCY_PERCENTILE of its recent answer latencies, or
+            AI_HEDGE_DEFAULT_DELAY until AI_HEDGE_MIN_SAMPLES are recorded
+        """
+        with self._lock:
+            samples = list(self._latencies.get(name, ()))
+        if len(samples) < AI_HEDGE_MIN_SAMPLES:
+            return AI_HEDGE_DEFAULT_DELAY
+        return statistics.quantiles(samples, n=100)[AI_HEDGE_LATENCY_PERCENTILE - 1]
+    
+    def _run_provider(self, name: str, call: Callable[[], Optional[Dict]]) -> Optional[Dict]:
+        """Run one provider call on a worker thread and record the outcome"""
+        started = time.monotonic()
+        try:
+            result = call()
+        except Exception as e:
+            logger.warning(f"❌ {name} failed: {e}")
+            result = None
+        elapsed = time.monotonic() - started
+        
+        service = self.services.get(name)
+        with self._lock:
+            self._in_flight -= 1
+            if result:
+                self._latencies.setdefault(name, deque(maxlen=AI_HEDGE_LATENCY_WINDOW)).append(elapsed)
+            if service is not None:
+                if result:
+                    service['last_used'] = datetime.now().isoformat()
+                    service['success_count'] += 1
+                else:
+                    service['error_count'] += 1
+        
+        if not result:
+            return None
+        result.setdefault('source', name)
+        logger.info(f"✅ {name} answered in {elapsed:.2f}s")
+        return result
+    
+    def _dispatch(self, service: Dict, market_data: MarketSnapshot,
+                  prompt: Optional[str] = None) -> Optional[Dict]:
+        """Call the analyzer for a service's type"""
+        if service['type'] == 'openai':
+            return self._analyze_with_openai(market_data, service['api_key'], prompt)
+        elif service['type'] == 'anthropic':
+            return self._analyze_with_anthropic(market_data, service['api_key'], prompt)
+        elif service['type'] == 'together':
+            return self._analyze_with_together(market_data, service['api_key'], prompt)
+        logger.warning(f"Unknown service type: {service['type']}")
+        return None
+    
+    def _analyze_with_openai(self, market_data: MarketSnapshot, api_key: str,
+                             prompt: Optional[str] = None) -> Optional[Dict]:
         """
         Analyze using OpenAI GPT-4
         https://platform.openai.com/docs/api-reference
@@ -122,7 +331,7 @@ class BackupAIService:
             import openai
             client = openai.OpenAI(api_key=api_key)
             
-            prompt = self._build_analysis_prompt(market_data)
+            prompt = prompt or self._build_analysis_prompt(market_data)
             
             response = client.chat.completions.create(
                 model="gpt-4-turbo",  # Or "gpt-3.5-turbo" for faster/cheaper
@@ -138,7 +347,7 @@ class BackupAIService:
                 ],
                 temperature=0.3,  # Lower temp = more focused
                 max_tokens=1000,
-                timeout=10
+                timeout=self.provider_timeout
             )
             
             result = self._parse_response(response.choices[0].message.content)
@@ -150,16 +359,17 @@ class BackupAIService:
             logger.error(f"OpenAI error: {e}")
             return None
     
-    def _analyze_with_anthropic(self, market_data: Dict, api_key: str) -> Optional[Dict]:
+    def _analyze_with_anthropic(self, market_data: MarketSnapshot, api_key: str,
+                                prompt: Optional[str] = None) -> Optional[Dict]:
         """
         Analyze using Anthropic Claude
         https://docs.anthropic.com/
         """
         try:
             import anthropic
-            client = anthropic.Anthropic(api_key=api_key)
+            client = anthropic.Anthropic(api_key=api_key, timeout=self.provider_timeout)
             
-            prompt = self._build_analysis_prompt(market_data)
+            prompt = prompt or self._build_analysis_prompt(market_data)
             
             message = client.messages.create(
                 model="claude-3-sonnet-20240229",  # Fast and capable
@@ -181,16 +391,17 @@ class BackupAIService:
             logger.error(f"Anthropic error: {e}")
             return None
     
-    def _analyze_with_together(self, market_data: Dict, api_key: str) -> Optional[Dict]:
+    def _analyze_with_together(self, market_data: MarketSnapshot, api_key: str,
+                               prompt: Optional[str] = None) -> Optional[Dict]:
         """
         Analyze using Together AI
         https://docs.together.ai/
         """
         try:
             import together
-            client = together.Together(api_key=api_key)
+            client = together.Together(api_key=api_key, timeout=self.provider_timeout)
             
-            prompt = self._build_analysis_prompt(market_data)
+            prompt = prompt or self._build_analysis_prompt(market_data)
             
             response = client.complete(
                 prompt=prompt,
@@ -208,18 +419,18 @@ class BackupAIService:
             logger.error(f"Together AI error: {e}")
             return None
     
-    def _build_analysis_prompt(self, market_data: Dict) -> str:
+    def _build_analysis_prompt(self, market_data: MarketSnapshot) -> str:
         """Build analysis prompt for any AI service"""
         return f"""
 Analyze this cryptocurrency market data and provide a trading decision.
 
 MARKET DATA:
-- Price: ${market_data['price']:.2f}
-- RSI(14): {market_data['rsi']:.2f}
-- EMA(9): ${market_data.get('ema_fast', 0):.2f}
-- EMA(21): ${market_data.get('ema_slow', 0):.2f}
-- Volume Ratio: {market_data.get('volume_ratio', 1):.2f}x
-- Trend: {market_data['trend']}
+- Price: ${market_data.price:.2f}
+- RSI(14): {market_data.rsi:.2f}
+- EMA(9): ${market_data.ema_fast:.2f}
+- EMA(21): ${market_data.ema_slow:.2f}
+- Volume Ratio: {market_data.volume_ratio:.2f}x
+- Trend: {market_data.trend}
 
 DECISION RULES:
 - BUY: EMA9 > EMA21, RSI < 70, volume up
@@ -230,9 +441,9 @@ Respond ONLY with valid JSON (no markdown):
 {{
     "action": "BUY" or "SELL" or "HOLD",
     "confidence": 0.0 to 1.0,
-    "entry_price": {market_data['price']},
-    "stop_loss": {market_data['price'] - market_data.get('atr', 1)},
-    "take_profit": {market_data['price'] + market_data.get('atr', 1) * 2},
+    "entry_price": {market_data.price},
+    "stop_loss": {market_data.price - market_data.atr},
+    "take_profit": {market_data.price + market_data.atr * 2},
     "reasoning": "Brief explanation"
 }}
 """
@@ -266,6 +477,11 @@ Respond ONLY with valid JSON (no markdown):
             logger.error(f"Parse error: {e}")
             return None
     
+    def get_hedge_stats(self) -> Dict:
+        """Hedged request counts and first-answer wins per provider"""
+        with self._lock:
+            return {**self.hedge_stats, 'wins': dict(self.hedge_stats['wins'])}
+    
     def get_status(self) -> Dict:
         """Get status of all backup services"""
         status = {}
@@ -0,0 +1,191 @@
+"""
+Conversation Memory
+Sliding-window, token-budgeted chat history with a rolling summary
+
+Recent turns are kept verbatim while they fit the token budget; older
+ones are folded into a short summary of the model's past verdicts, so
+the context resent on every follow-up call stays flat over days of
+uptime instead of growing with it.
+"""
+
+import json
+import logging
+from collections import deque
+from datetime import datetime
+from threading import Lock
+from typing import Dict, List, Optional
+
+from config.settings import AI_MEMORY_TOKEN_BUDGET, AI_MEMORY_MAX_TURNS, AI_MEMORY_SUMMARY_LINES
+
+logger = logging.getLogger(__name__)
+
+# Rough token estimate for English text and JSON (no tokenizer dependency)
+CHARS_PER_TOKEN = 4
+
+# Response fields quoted in the rolling summary, first present one wins
+_VERDICT_FIELDS = ('refined_action', 'approval', 'action')
+_CONFIDENCE_FIELDS = ('refined_confidence', 'safety_score', 'confidence')
+_REASON_FIELDS = ('reasoning', 'reason')
+_REASON_CHARS = 80
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count of a text"""
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+class ConversationMemory:
+    """Bounded conversation history with a rolling summary of evicted turns"""
+
+    def __init__(self, token_budget: int = AI_MEMORY_TOKEN_BUDGET,
+                 max_turns: int = AI_MEMORY_MAX_TURNS,
+                 summary_lines: int = AI_MEMORY_SUMMARY_LINES):
+        """
+        Initialize memory
+
+        Args:
+            token_budget: Estimated tokens the verbatim turns plus summary
+                may take
+            max_turns: Verbatim turns kept at most
+            summary_lines: Summarized past verdicts kept
+        """
+        self.token_budget = token_budget
+        self.max_turns = max_turns
+        self.turns: deque = deque()
+        self.summary: deque = deque(maxlen=summary_lines)
+        self._turn_tokens = 0
+        self._lock = Lock()
+
+        # Metrics
+        self.summarized_turns = 0
+        self.prompts = 0
+        self.last_prompt_tokens = 0
+        self.max_prompt_tokens = 0
+        self._prompt_tokens_total = 0
+
+    def add(self, role: str, content: str) -> None:
+        """
+        Append a turn and compact the window
+
+        Args:
+            role: 'user' or 'ai'
+            content: Message text
+        """
+        turn = {
+            'role': role,
+            'content': content,
+            'timestamp': datetime.now().isoformat(),
+            'tokens': estimate_tokens(content),
+        }
+        with self._lock:
+            self.turns.append(turn)
+            self._turn_tokens += turn['tokens']
+            self._compact()
+
+    def _compact(self) -> None:
+        """Fold the oldest turns into the summary until the window fits"""
+        while self.turns and (
+            len(self.turns) > self.max_turns
+            or self._turn_tokens + self._summary_tokens() > self.token_budget
+        ):
+            turn = self.turns.popleft()
+            self._turn_tokens -= turn['tokens']
+            self.summarized_turns += 1
+            line = self._summarize(turn)
+            if line:
+                self.summary.append(line)
+
+    def _summary_tokens(self) -> int:
+        return sum(estimate_tokens(line) for line in self.summary)
+
+    @staticmethod
+    def _summarize(turn: Dict) -> Optional[str]:
+        """
+        One summary line for an evicted turn
+
+        Prompts are rebuilt from live market data every cycle, so only the
+        model's verdicts are kept.
+        """
+        if turn['role'] != 'ai':
+            return None
+        try:
+            reply = json.loads(turn['content'].replace('```json', '').replace('```', '').strip())
+        except (ValueError, AttributeError):
+            return f"{turn['timestamp'][11:16]} {turn['content'][:_REASON_CHARS]}"
+        if not isinstance(reply, dict):
+            return None
+
+        verdict = next((reply[f] for f in _VERDICT_FIELDS if f in reply), '?')
+        line = f"{turn['timestamp'][11:16]} {verdict}"
+        confidence = next((reply[f] for f in _CONFIDENCE_FIELDS if f in reply), None)
+        if isinstance(confidence, (int, float)):
+            line += f" {confidence:.0%}"
+        reason = next((reply[f] for f in _REASON_FIELDS if reply.get(f)), None)
+        if reason:
+            line += f" - {str(reason)[:_REASON_CHARS]}"
+        return line
+
+    def build_contents(self, prompt: str) -> List[Dict]:
+        """
+        Model contents for a follow-up prompt: summary, recent turns, prompt
+
+        Args:
+            prompt: New user message
+
+        Returns:
+            Gemini ``contents`` list (user/model roles with text parts)
+        """
+        with self._lock:
+            contents = []
+            if self.summary:
+                contents.append({'role': 'user', 'parts': [{
+                    'text': "Summary of your earlier decisions:\n" + "\n".join(self.summary)
+                }]})
+            for turn in self.turns:
+                contents.append({
+                    'role': 'model' if turn['role'] == 'ai' else 'user',
+                    'parts': [{'text': turn['content']}]
+                })
+            contents.append({'role': 'user', 'parts': [{'text': prompt}]})
+
+            tokens = self._turn_tokens + self._summary_tokens() + estimate_tokens(prompt)
+            self._track(tokens)
+        return contents
+
+    def track_prompt(self, prompt: str) -> None:
+        """Record the size of a prompt sent without the history"""
+        with self._lock:
+            self._track(estimate_tokens(prompt))
+
+    def _track(self, tokens: int) -> None:
+        self.prompts += 1
+        self.last_prompt_tokens = tokens
+        self.max_prompt_tokens = max(self.max_prompt_tokens, tokens)
+        self._prompt_tokens_total += tokens
+
+    def get_history(self) -> List[Dict]:
+        """Verbatim turns currently in the window, oldest first"""
+        with self._lock:
+            return list(self.turns)
+
+    def clear(self) -> None:
+        """Drop all turns and the summary"""
+        with self._lock:
+            self.turns.clear()
+            self.summary.clear()
+            self._turn_tokens = 0
+
+    def get_stats(self) -> Dict:
+        """Window size and per-call prompt size metrics (estimated tokens)"""
+        with self._lock:
+            return {
+                'turns': len(self.turns),
+                'summary_lines': len(self.summary),
+                'summarized_turns': self.summarized_turns,
+                'window_tokens': self._turn_tokens + self._summary_tokens(),
+                'token_budget': self.token_budget,
+                'prompts': self.prompts,
+                'last_prompt_tokens': self.last_prompt_tokens,
+                'avg_prompt_tokens': self._prompt_tokens_total / self.prompts if self.prompts else 0.0,
+                'max_prompt_tokens': self.max_prompt_tokens,
+            }
@@ -0,0 +1,186 @@
+"""
+Decision Cache
+Reuses AI trading decisions while the quantized market state is unchanged
+
+A snapshot is reduced to a coarse feature key - price bucket in units of
+ATR, RSI band, EMA spread sign, volume regime, trend and volatility
+regime - so consecutive cycles in a market that has barely moved map to
+the same entry and skip the multi-second model round trip.
+"""
+
+import logging
+import math
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, Optional, Tuple
+
+from market.snapshot import MarketSnapshot
+from config.settings import (
+    DECISION_CACHE_TTL, DECISION_CACHE_SIZE, DECISION_CACHE_PRICE_ATR_FRACTION,
+    DECISION_CACHE_RSI_BAND, DECISION_CACHE_VOLUME_BANDS, DECISION_CACHE_BYPASS_TRIGGERS
+)
+
+logger = logging.getLogger(__name__)
+
+# Price levels shifted with the price when a decision is reused
+PRICE_LEVELS = ('entry_price', 'stop_loss', 'take_profit')
+
+
+def _usable(value) -> bool:
+    return value is not None and not math.isnan(value)
+
+
+class DecisionCache:
+    """Bounded LRU cache of AI decisions keyed on a quantized market state"""
+
+    def __init__(self, ttl: float = DECISION_CACHE_TTL, max_entries: int = DECISION_CACHE_SIZE,
+                 price_atr_fraction: float = DECISION_CACHE_PRICE_ATR_FRACTION,
+                 rsi_band: float = DECISION_CACHE_RSI_BAND,
+                 volume_bands: Tuple[float, ...] = DECISION_CACHE_VOLUME_BANDS):
+        """
+        Initialize cache
+
+        Args:
+            ttl: Seconds a decision may be reused
+            max_entries: States kept before the least recently used ones
+                are evicted
+            price_atr_fraction: Price bucket width as a fraction of ATR
+            rsi_band: RSI points per band
+            volume_bands: Ascending volume ratio edges splitting the volume
+                regimes
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.price_atr_fraction = price_atr_fraction
+        self.rsi_band = rsi_band
+        self.volume_bands = tuple(volume_bands)
+
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._cache: OrderedDict = OrderedDict()
+        self._lock = Lock()
+
+    def key(self, market_data: MarketSnapshot) -> Optional[Tuple]:
+        """
+        Quantized market state of a snapshot
+
+        Args:
+            market_data: Market snapshot
+
+        Returns:
+            Hashable state key, or None when the snapshot must not be cached
+            (indicators still warming up, or an event-driven trigger such as
+            an activity burst that always deserves a fresh look)
+        """
+        if market_data.trigger in DECISION_CACHE_BYPASS_TRIGGERS:
+            return None
+
+        price, atr, rsi = market_data.price, market_data.atr, market_data.rsi
+        ema_fast, ema_slow = market_data.ema_fast, market_data.ema_slow
+        if not all(_usable(v) for v in (price, atr, rsi, ema_fast, ema_slow)) or atr <= 0:
+            return None
+
+        volume_ratio = market_data.volume_ratio
+        volume_band = -1
+        if _usable(volume_ratio):
+            volume_band = sum(volume_ratio >= edge for edge in self.volume_bands)
+
+        return (
+            market_data.symbol,
+            market_data.timeframe,
+            math.floor(price / (atr * self.price_atr_fraction)),
+            math.floor(rsi / self.rsi_band),
+            (ema_fast > ema_slow) - (ema_fast < ema_slow),
+            volume_band,
+            market_data.trend,
+            market_data.regime,
+        )
+
+    def get(self, market_data: MarketSnapshot) -> Optional[Dict]:
+        """
+        Cached decision for the snapshot's market state
+
+        Args:
+            market_data: Market snapshot
+
+        Returns:
+            Copy of the cached decision with its price levels moved by the
+            price change since it was made, ``cached`` set and ``cache_age``
+            in seconds - or None on a miss
+        """
+        key = self.key(market_data)
+        now = time.monotonic()
+        with self._lock:
+            if key is None:
+                self.bypassed += 1
+                return None
+            entry = self._cache.get(key)
+            if entry is not None and now - entry[0] > self.ttl:
+                del self._cache[key]
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._cache.move_to_end(key)
+            self.hits += 1
+            stored_at, price, decision = entry
+
+        decision = dict(decision)
+        shift = market_data.price - price
+        for level in PRICE_LEVELS:
+            value = decision.get(level)
+            if isinstance(value, (int, float)) and value:
+                decision[level] = value + shift
+        decision['cached'] = True
+        decision['cache_age'] = now - stored_at
+        return decision
+
+    def put(self, market_data: MarketSnapshot, decision: Dict) -> bool:
+        """
+        Store a decision for the snapshot's market state
+
+        Args:
+            market_data: Snapshot the decision was made on
+            decision: Decision dictionary (copied, top level only)
+
+        Returns:
+            True if stored, False if the snapshot is not cacheable
+        """
+        key = self.key(market_data)
+        if key is None:
+            return False
+
+        entry = (time.monotonic(), market_data.price, dict(decision))
+        with self._lock:
+            self._cache[key] = entry
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+                self.evictions += 1
+        return True
+
+    def clear(self) -> None:
+        """Drop every cached decision"""
+        with self._lock:
+            self._cache.clear()
+
+    def get_stats(self) -> Dict:
+        """Cache size, hit rate, evictions and expirations"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._cache),
+                'max_entries': self.max_entries,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'bypassed': self.bypassed,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+            }
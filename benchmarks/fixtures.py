@@ -0,0 +1,195 @@
+"""
+Benchmark Fixtures
+Synthetic and recorded kline series, plus an offline Binance client that
+replays them bar by bar
+"""
+
+import bisect
+import json
+import os
+import sys
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from market.kline_store import KlineStore  # noqa: E402
+from market.resampler import timeframe_to_ms  # noqa: E402
+from market.stream import kline_event_to_row  # noqa: E402
+
+
+def synthetic_klines(count: int, timeframe: str = '1m', seed: int = 0,
+                     price: float = 30000.0, end_ms: Optional[int] = None) -> List[List]:
+    """
+    Random-walk klines in the REST ``get_klines`` row layout
+
+    Args:
+        count: Number of candles
+        timeframe: Kline interval
+        seed: Random seed (same seed, same series)
+        price: Starting price
+        end_ms: Open time of the last candle (default: the current candle)
+
+    Returns:
+        List of kline rows, oldest first
+    """
+    step = timeframe_to_ms(timeframe)
+    if end_ms is None:
+        now = int(time.time() * 1000)
+        end_ms = now - now % step
+    start = end_ms - (count - 1) * step
+
+    rng = np.random.default_rng(seed)
+    closes = price * np.exp(np.cumsum(rng.normal(0, 0.001, count)))
+    opens = np.r_[price, closes[:-1]]
+    highs = np.maximum(opens, closes) * (1 + np.abs(rng.normal(0, 0.0005, count)))
+    lows = np.minimum(opens, closes) * (1 - np.abs(rng.normal(0, 0.0005, count)))
+    volumes = np.abs(rng.normal(10, 3, count))
+
+    return [
+        [start + i * step, f"{opens[i]:.2f}", f"{highs[i]:.2f}", f"{lows[i]:.2f}",
+         f"{closes[i]:.2f}", f"{volumes[i]:.4f}", start + (i + 1) * step - 1,
+         "0", 10, "0", "0", "0"]
+        for i in range(count)
+    ]
+
+
+def load_recorded(path: str, symbol: str = 'BTCUSDT', timeframe: str = '1m') -> List[List]:
+    """
+    Load recorded klines
+
+    Accepts a stream recording (``BinanceMarketStream(record_path=...)``,
+    ``.jsonl``; closed candles only), a JSON list of REST kline rows, or a
+    ``KlineStore`` root directory.
+
+    Args:
+        path: Fixture path
+        symbol: Symbol to read from stream recordings and kline stores
+        timeframe: Interval to read from kline stores
+
+    Returns:
+        List of kline rows, oldest first
+    """
+    if os.path.isdir(path):
+        records = KlineStore(path).read_range(symbol, timeframe)
+        return [
+            [int(r['open_time']), r['open'], r['high'], r['low'], r['close'], r['volume']]
+            for r in records
+        ]
+
+    if path.endswith('.jsonl'):
+        rows = {}
+        with open(path, 'r') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                message = json.loads(line)
+                data = message.get('data', message)
+                kline = data.get('k')
+                if data.get('e') == 'kline' and kline['x'] and kline['s'] == symbol.upper():
+                    rows[kline['t']] = kline_event_to_row(kline)
+        return [rows[t] for t in sorted(rows)]
+
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def load_depth_events(path: str, symbol: str = 'BTCUSDT') -> List[Dict]:
+    """
+    Load recorded diff-depth events from a stream recording (``.jsonl``)
+
+    Replay them with ``LocalOrderBook.replay`` on top of a depth snapshot
+    taken while recording.
+
+    Args:
+        path: Stream recording path
+        symbol: Symbol to read
+
+    Returns:
+        ``depthUpdate`` payloads in arrival order
+    """
+    events = []
+    with open(path, 'r') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            message = json.loads(line)
+            data = message.get('data', message)
+            if data.get('e') == 'depthUpdate' and data['s'] == symbol.upper():
+                events.append(data)
+    return events
+
+
+def rebase(rows: List[List], timeframe: str = '1m', end_ms: Optional[int] = None) -> List[List]:
+    """
+    Shift a series in time so its last candle opens at ``end_ms``
+
+    The fetcher only downloads incrementally when its buffer is recent, so
+    replayed fixtures are moved next to the current time.
+    """
+    step = timeframe_to_ms(timeframe)
+    if end_ms is None:
+        now = int(time.time() * 1000)
+        end_ms = now - now % step
+    shift = end_ms - int(rows[-1][0])
+    rebased = []
+    for row in rows:
+        row = list(row)
+        row[0] = int(row[0]) + shift
+        if len(row) > 6:
+            row[6] = int(row[6]) + shift
+        rebased.append(row)
+    return rebased
+
+
+class ReplayClient:
+    """
+    Offline stand-in for the python-binance client
+
+    Serves ``get_klines`` from fixture series, exposing them one bar at a
+    time: only candles up to the cursor are visible, and ``advance()``
+    reveals the next one.
+    """
+
+    def __init__(self, series: Dict[str, List[List]], visible: int):
+        """
+        Initialize client
+
+        Args:
+            series: Symbol -> kline rows (same length and timestamps)
+            visible: Candles visible at the start
+        """
+        self.series = series
+        self.times = {symbol: [int(r[0]) for r in rows] for symbol, rows in series.items()}
+        self.cursor = visible
+        self.calls = 0
+
+    @property
+    def remaining(self) -> int:
+        return len(next(iter(self.series.values()))) - self.cursor
+
+    def advance(self, bars: int = 1) -> None:
+        self.cursor += bars
+
+    def get_klines(self, symbol: str, interval: str, limit: int = 500,
+                   startTime: Optional[int] = None, endTime: Optional[int] = None) -> List[List]:
+        self.calls += 1
+        times = self.times[symbol]
+        end = self.cursor
+        if endTime is not None:
+            end = min(end, bisect.bisect_right(times, endTime))
+        if startTime is not None:
+            start = bisect.bisect_left(times, startTime)
+            return self.series[symbol][start:min(end, start + limit)]
+        return self.series[symbol][max(0, end - limit):end]
+
+    def get_symbol_ticker(self, symbol: str) -> Dict:
+        self.calls += 1
+        return {'symbol': symbol, 'price': self.series[symbol][self.cursor - 1][4]}
+
+    def get_server_time(self) -> Dict:
+        return {'serverTime': int(time.time() * 1000)}
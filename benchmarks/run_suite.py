@@ -0,0 +1,380 @@
+"""
+Benchmark Suite
+Offline latency, allocation and throughput benchmarks for the indicator
+functions, the market data pipeline and the trade aggregator, plus the
+NumPy kernels' speedup over the pandas reference and module import times
+
+Runs against synthetic klines by default, or a recorded fixture (see
+``benchmarks.fixtures.load_recorded``). Results are written as JSON so
+runs can be compared across commits.
+
+Usage:
+    python benchmarks/run_suite.py [--fixture PATH] [--output PATH]
+                                   [--compare PREVIOUS.json] [--quick]
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from functools import partial
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.fixtures import ReplayClient, load_recorded, rebase, synthetic_klines  # noqa: E402
+from config.settings import KLINE_HISTORY_LIMIT, TRADING_CONFIG  # noqa: E402
+import indicators  # noqa: E402
+from indicators import series  # noqa: E402
+from indicators.graph import IndicatorGraph  # noqa: E402
+from market.data_fetcher import MarketDataFetcher  # noqa: E402
+from market.kline_store import KlineStore  # noqa: E402
+from market.trade_aggregator import TradeAggregator  # noqa: E402
+from trading.auto_engine import AutoTradingEngine  # noqa: E402
+
+RESULTS_DIR = os.path.join(ROOT, 'benchmarks', 'results')
+
+
+def _percentiles(samples_ns: List[int]) -> Dict[str, float]:
+    ordered = np.sort(np.asarray(samples_ns, dtype=np.float64)) / 1000
+    return {
+        'calls': len(ordered),
+        'mean_us': round(float(ordered.mean()), 3),
+        'p50_us': round(float(np.percentile(ordered, 50)), 3),
+        'p95_us': round(float(np.percentile(ordered, 95)), 3),
+        'p99_us': round(float(np.percentile(ordered, 99)), 3),
+        'max_us': round(float(ordered[-1]), 3),
+    }
+
+
+def _allocations(fn: Callable, calls: int) -> Dict[str, float]:
+    """Median per-call peak of traced allocations (bytes) and blocks left behind"""
+    peaks = []
+    tracemalloc.start()
+    try:
+        fn()  # Warm caches so one-off allocations are not counted
+        before_blocks = len(tracemalloc.take_snapshot().traces)
+        for _ in range(calls):
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            fn()
+            peaks.append(tracemalloc.get_traced_memory()[1] - current)
+        retained = len(tracemalloc.take_snapshot().traces) - before_blocks
+    finally:
+        tracemalloc.stop()
+    return {'alloc_peak_bytes': int(statistics.median(peaks)), 'retained_blocks': retained}
+
+
+def bench(fn: Callable, calls: int, setup: Optional[Callable] = None,
+          alloc_calls: int = 50) -> Dict[str, float]:
+    """
+    Time ``fn`` per call, then measure its allocations in a separate pass
+
+    Args:
+        fn: Zero-argument callable under test
+        calls: Timed calls
+        setup: Untimed callable run before every call (e.g. advance a replay)
+        alloc_calls: Calls traced for allocations (tracing distorts timing; 0 skips)
+
+    Returns:
+        Latency percentiles plus allocation figures
+    """
+    samples = []
+    for _ in range(calls):
+        if setup:
+            setup()
+        started = time.perf_counter_ns()
+        fn()
+        samples.append(time.perf_counter_ns() - started)
+    result = _percentiles(samples)
+    if not setup and alloc_calls:
+        result.update(_allocations(fn, alloc_calls))
+    return result
+
+
+def bench_indicators(closes: np.ndarray, highs: np.ndarray, lows: np.ndarray,
+                     calls: int) -> Dict[str, Dict]:
+    """
+    Scalar indicator functions over a live-sized window
+
+    When pandas is installed the ``indicators.reference`` version of each
+    function is timed on the same window too (``reference_p50_us`` and
+    ``speedup``).
+    """
+    try:
+        from indicators import reference
+    except ImportError:
+        reference = None
+        print("pandas not installed - reference timings skipped")
+
+    window = KLINE_HISTORY_LIMIT
+    close, high, low = closes[-window:], highs[-window:], lows[-window:]
+    cases = {
+        'calculate_rsi': (close, TRADING_CONFIG['rsi_period']),
+        'calculate_ema': (close, TRADING_CONFIG['ema_slow']),
+        'calculate_atr': (high, low, close, TRADING_CONFIG['atr_period']),
+        'calculate_sma': (close, 20),
+        'calculate_bollinger_bands': (close,),
+    }
+    results = {}
+    for name, args in cases.items():
+        results[name] = bench(partial(getattr(indicators, name), *args), calls)
+        results[name]['window'] = window
+        if reference is not None:
+            slow = bench(partial(getattr(reference, name), *args), calls, alloc_calls=0)
+            results[name]['reference_p50_us'] = slow['p50_us']
+            results[name]['speedup'] = round(slow['p50_us'] / results[name]['p50_us'], 1)
+    return results
+
+
+def bench_series(closes: np.ndarray, highs: np.ndarray, lows: np.ndarray,
+                 repeats: int) -> Dict[str, Dict]:
+    """Full-series indicator throughput in bars per second"""
+    cases = {
+        'rsi_series': lambda: series.rsi_series(closes),
+        'ema_series': lambda: series.ema_series(closes, TRADING_CONFIG['ema_slow']),
+        'atr_series': lambda: series.atr_series(highs, lows, closes),
+        'bollinger_series': lambda: series.bollinger_series(closes),
+    }
+    results = {}
+    for name, fn in cases.items():
+        result = bench(fn, repeats, alloc_calls=3)
+        result['bars'] = len(closes)
+        result['bars_per_sec'] = round(len(closes) / (result['p50_us'] / 1e6))
+        results[name] = result
+    return results
+
+
+def bench_market_data(rows: List[List], calls: int) -> Dict:
+    """
+    ``MarketDataFetcher.get_market_data`` over REST, one new bar per call
+
+    Each round starts a fresh fetcher (empty caches) and replays up to
+    ``KLINE_HISTORY_LIMIT - 10`` bars so every timed call takes the
+    incremental download path. Order book features are off: the replay
+    client serves klines only.
+    """
+    per_round = min(KLINE_HISTORY_LIMIT - 10, len(rows) - KLINE_HISTORY_LIMIT - 1)
+    if per_round < 1:
+        raise ValueError(f"Fixture needs more than {KLINE_HISTORY_LIMIT + 1} candles")
+
+    fixture = rebase(rows[-(KLINE_HISTORY_LIMIT + per_round + 1):])
+    samples = []
+    client = fetcher = None
+    with tempfile.TemporaryDirectory() as store_dir:
+        while len(samples) < calls:
+            if client is None or not client.remaining:
+                client = ReplayClient({'BTCUSDT': fixture}, visible=KLINE_HISTORY_LIMIT + 1)
+                fetcher = MarketDataFetcher(
+                    client, streaming=False, symbols=['BTCUSDT'],
+                    store=KlineStore(os.path.join(store_dir, str(len(samples)))),
+                    graph=IndicatorGraph(), order_book=False
+                )
+                fetcher.get_market_data()  # Warm-up: full history download
+            client.advance()
+            started = time.perf_counter_ns()
+            data = fetcher.get_market_data()
+            samples.append(time.perf_counter_ns() - started)
+            if data is None:
+                raise RuntimeError("get_market_data returned None during replay")
+        fetcher.close()
+
+    result = _percentiles(samples)
+    result['calls_per_sec'] = round(1e6 / result['p50_us'])
+    return result
+
+
+def bench_watchlist(symbol_count: int, repeats: int) -> Dict:
+    """Vectorized watchlist features over REST replay, in symbols per second"""
+    fixtures = {
+        f"SYM{i:03d}USDT": synthetic_klines(KLINE_HISTORY_LIMIT + 1, seed=i)
+        for i in range(symbol_count)
+    }
+    client = ReplayClient(fixtures, visible=KLINE_HISTORY_LIMIT + 1)
+    with tempfile.TemporaryDirectory() as store_dir:
+        fetcher = MarketDataFetcher(
+            client, streaming=False, symbols=list(fixtures),
+            store=KlineStore(store_dir), graph=IndicatorGraph(), order_book=False
+        )
+        fetcher.get_watchlist_features()  # Warm-up: full history download
+        result = bench(fetcher.get_watchlist_features, repeats, alloc_calls=3)
+        fetcher.close()
+
+    result['symbols'] = symbol_count
+    result['symbols_per_sec'] = round(symbol_count / (result['p50_us'] / 1e6))
+    return result
+
+
+def bench_trade_aggregator(trade_count: int, repeats: int) -> Dict:
+    """``TradeAggregator.add_trades`` over a synthetic aggTrade session, in trades per second"""
+    rng = np.random.default_rng(42)
+    prices = 30_000.0 + np.cumsum(rng.normal(0.0, 0.5, trade_count))
+    quantities = rng.exponential(0.05, trade_count)
+    buyer_maker = rng.random(trade_count) < 0.5
+    # Roughly 200 trades per second with occasional dense stretches
+    gaps = rng.exponential(5.0, trade_count) * np.where(rng.random(trade_count) < 0.02, 0.05, 1.0)
+    trade_times = 1_700_000_000_000 + np.cumsum(gaps).astype(np.int64)
+    batch = (prices.tolist(), quantities.tolist(), buyer_maker.tolist(), trade_times.tolist())
+
+    samples = []
+    for _ in range(repeats):
+        aggregator = TradeAggregator('BTCUSDT')
+        started = time.perf_counter_ns()
+        aggregator.add_trades(*batch)
+        samples.append(time.perf_counter_ns() - started)
+
+    result = _percentiles(samples)
+    result['trades'] = trade_count
+    result['trades_per_sec'] = round(trade_count / (result['p50_us'] / 1e6))
+    return result
+
+
+def bench_ai_score(market_data: Dict, calls: int) -> Dict:
+    """``AutoTradingEngine.calculate_ai_score`` on a real snapshot"""
+    engine = AutoTradingEngine(None, None, None)
+    return bench(lambda: engine.calculate_ai_score(market_data), calls)
+
+
+def bench_imports(repeats: int) -> Dict[str, Dict]:
+    """Median cold-import time of the indicator modules, each in a fresh interpreter"""
+    code = (
+        "import time; started = time.perf_counter_ns(); "
+        "import {module}; print(time.perf_counter_ns() - started)"
+    )
+    modules = ['indicators', 'indicators.reference']
+    results = {}
+    for module in modules:
+        samples = []
+        for _ in range(repeats):
+            out = subprocess.run(
+                [sys.executable, '-c', code.format(module=module)], cwd=ROOT,
+                capture_output=True, text=True
+            )
+            if out.returncode:
+                break  # Optional dependency (pandas) not installed
+            samples.append(int(out.stdout.strip()))
+        if samples:
+            results[module] = _percentiles(samples)
+    return results
+
+
+def _snapshot_for(rows: List[List]) -> Dict:
+    client = ReplayClient({'BTCUSDT': rebase(rows[-(KLINE_HISTORY_LIMIT + 1):])},
+                          visible=KLINE_HISTORY_LIMIT + 1)
+    with tempfile.TemporaryDirectory() as store_dir:
+        fetcher = MarketDataFetcher(client, streaming=False, symbols=['BTCUSDT'],
+                                    store=KlineStore(store_dir), graph=IndicatorGraph(),
+                                    order_book=False)
+        return fetcher.get_market_data()
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        return None
+
+
+def compare(current: Dict, previous: Dict) -> None:
+    """Print p50 changes between two result files"""
+    print(f"\nChange vs {previous.get('commit')} (p50; + is slower)")
+    for group, cases in current['results'].items():
+        old_cases = previous.get('results', {}).get(group, {})
+        if 'p50_us' in cases:
+            cases, old_cases = {group: cases}, {group: old_cases}
+        for name, result in cases.items():
+            old = old_cases.get(name, {}).get('p50_us')
+            if old:
+                change = (result['p50_us'] - old) / old * 100
+                print(f"  {name:<28}{old:>12.1f} -> {result['p50_us']:>10.1f} us  {change:+6.1f}%")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--fixture', help='Recorded klines (.jsonl stream recording, .json rows or store dir)')
+    parser.add_argument('--symbol', default='BTCUSDT', help='Symbol to read from the fixture')
+    parser.add_argument('--output', help='Result file (default: benchmarks/results/<commit>.json)')
+    parser.add_argument('--compare', help='Previous result file to compare against')
+    parser.add_argument('--symbols', type=int, default=200, help='Watchlist size')
+    parser.add_argument('--quick', action='store_true', help='Fewer iterations (smoke run)')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    calls = 200 if args.quick else 2000
+    repeats = 5 if args.quick else 30
+
+    if args.fixture:
+        rows = load_recorded(args.fixture, args.symbol)
+        source = os.path.basename(args.fixture.rstrip('/'))
+    else:
+        rows = synthetic_klines(100_000, seed=42)
+        source = 'synthetic'
+
+    closes = np.array([float(r[4]) for r in rows])
+    highs = np.array([float(r[2]) for r in rows])
+    lows = np.array([float(r[3]) for r in rows])
+
+    results = {
+        'indicators': bench_indicators(closes, highs, lows, calls),
+        'series': bench_series(closes, highs, lows, repeats),
+        'get_market_data': bench_market_data(rows, calls // 4),
+        'watchlist_features': bench_watchlist(args.symbols, repeats),
+        'trade_aggregator': bench_trade_aggregator(20_000 if args.quick else 200_000, repeats),
+        'calculate_ai_score': bench_ai_score(_snapshot_for(rows), calls),
+        'import': bench_imports(3 if args.quick else 5),
+    }
+
+    report = {
+        'commit': _git_commit(),
+        'timestamp': datetime.now().isoformat(),
+        'fixture': source,
+        'bars': len(rows),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'machine': platform.machine(),
+        'results': results,
+    }
+
+    output = args.output or os.path.join(RESULTS_DIR, f"{report['commit'] or 'local'}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(report, f, indent=2)
+
+    print(f"Benchmarks ({source}, {len(rows)} bars) -> {output}")
+    for group, cases in results.items():
+        if 'p50_us' in cases:
+            cases = {group: cases}
+        for name, result in cases.items():
+            extra = ''
+            for key in ('bars_per_sec', 'symbols_per_sec', 'calls_per_sec', 'trades_per_sec'):
+                if key in result:
+                    extra = f"  {result[key]:,} {key[:-8]}/s"
+            if 'speedup' in result:
+                extra += f"  pandas {result['reference_p50_us']:.1f}us ({result['speedup']}x)"
+            alloc = f"  {result['alloc_peak_bytes']:,} B" if 'alloc_peak_bytes' in result else ''
+            print(
+                f"  {name:<28} p50 {result['p50_us']:>10.1f}us  p95 {result['p95_us']:>10.1f}us  "
+                f"p99 {result['p99_us']:>10.1f}us{alloc}{extra}"
+            )
+
+    if args.compare:
+        with open(args.compare, 'r') as f:
+            compare(report, json.load(f))
+
+
+if __name__ == '__main__':
+    main()
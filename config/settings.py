@@ -22,11 +22,90 @@ TOGETHER_API_KEY = os.getenv('TOGETHER_API_KEY', '')
 # Enable autonomous trading (NO human intervention)
 AUTONOMOUS_MODE = os.getenv('AUTONOMOUS_MODE', 'true').lower() == 'true'
 ENABLE_BACKUP_APIS = os.getenv('ENABLE_BACKUP_APIS', 'true').lower() == 'true'
+# One model call per decision with the risk rules checked locally (false = analyse / refine / validate calls)
+AI_FAST_MODE = os.getenv('AI_FAST_MODE', 'true').lower() == 'true'
 
 # ============ BINANCE CONFIGURATION ============
 BINANCE_TESTNET_URL = 'https://testnet.binance.vision'
 BINANCE_USE_TESTNET = True
 
+# REST request-weight budget shared by the market data fetcher and trade executor
+EXCHANGE_WEIGHT_LIMIT = int(os.getenv('EXCHANGE_WEIGHT_LIMIT', 6000))  # REQUEST_WEIGHT per minute
+EXCHANGE_WEIGHT_SAFETY = 0.8  # Use at most 80% of the exchange limit
+EXCHANGE_WEIGHT_ORDER_RESERVE = 0.2  # Share of the budget kept free for orders and exits
+
+# ============ MARKET DATA CONFIGURATION ============
+# Keep a persistent WebSocket subscription instead of polling REST every cycle
+MARKET_DATA_STREAMING = os.getenv('MARKET_DATA_STREAMING', 'false').lower() == 'true'
+BINANCE_STREAM_URL = os.getenv('BINANCE_STREAM_URL', 'wss://testnet.binance.vision/stream')
+KLINE_HISTORY_LIMIT = 100  # Candles kept in memory / fetched on warm-up
+STREAM_STALE_AFTER = 90  # Seconds without a frame before falling back to REST
+STREAM_RECONNECT_DELAY = 5  # Seconds to wait before reconnecting
+
+# Watchlist mode: one fetcher scans many pairs (comma separated, e.g. BTCUSDT,ETHUSDT)
+WATCHLIST = [s.strip().upper() for s in os.getenv('WATCHLIST', '').split(',') if s.strip()]
+WATCHLIST_MAX_WORKERS = int(os.getenv('WATCHLIST_MAX_WORKERS', 16))  # Concurrent REST requests
+
+# Align analysis to exchange candle closes instead of a free-running sleep
+CANDLE_ALIGNED_SCHEDULING = os.getenv('CANDLE_ALIGNED_SCHEDULING', 'true').lower() == 'true'
+SCHEDULER_LEAD_SECONDS = float(os.getenv('SCHEDULER_LEAD_SECONDS', 0))  # Fire this long before close
+SCHEDULER_FRESH_ATTEMPTS = 3  # Market data fetches per close while waiting for the closed bar
+SCHEDULER_FRESH_POLL = 0.5  # Seconds between those fetches
+SCHEDULER_CLOCK_RESYNC = 600  # Seconds between exchange clock offset measurements
+
+# Per-bar indicator results shared by every consumer (LRU entries)
+INDICATOR_CACHE_SIZE = 2048
+
+# Local order book: spread / imbalance / microprice features for the trading symbol (opt-in:
+# adds a depth request per cycle in REST mode and blocks entries above max_spread_bps)
+ORDER_BOOK_ENABLED = os.getenv('ORDER_BOOK_ENABLED', 'false').lower() == 'true'
+ORDER_BOOK_TOP_N = 10  # Levels per side in the depth imbalance
+ORDER_BOOK_SNAPSHOT_LIMIT = 1000  # Depth snapshot used to sync the streamed book
+ORDER_BOOK_REST_LIMIT = 20  # Depth fetched per cycle when polling REST
+
+# Trade flow from the aggTrade stream: tick / volume bars, volume delta, bursts
+TRADE_STREAM_ENABLED = os.getenv('TRADE_STREAM_ENABLED', 'false').lower() == 'true'
+TICK_BAR_SIZE = 500  # Trades per tick bar
+VOLUME_BAR_SIZE = 5.0  # Base-asset volume per volume bar
+TRADE_BAR_HISTORY = 500  # Completed bars kept per bar type
+BURST_WINDOW_SECONDS = 5  # Activity window compared against the baseline
+BURST_BASELINE_SECONDS = 300  # History forming the baseline trade rate
+BURST_MULTIPLIER = 4.0  # Window activity vs baseline that counts as a burst
+BURST_MIN_TRADES = 50  # Ignore "bursts" in a quiet market
+BURST_COOLDOWN_SECONDS = 30  # Minimum time between two burst triggers
+
+# Volatility regime: analyse less often in dead markets, intrabar when volatile (opt-in)
+REGIME_DETECTION_ENABLED = os.getenv('REGIME_DETECTION_ENABLED', 'false').lower() == 'true'
+REGIME_LOOKBACK = 720  # Closed bars (12h of 1m) for the ATR / realized volatility percentiles and volume z-score
+REGIME_RV_PERIOD = 20  # Bars in the realized volatility (std of returns)
+REGIME_DEAD_PERCENTILE = 20  # ATR and RV percentile at or below this (and quiet volume) = dead
+REGIME_HIGH_PERCENTILE = 90  # ATR and RV percentile at or above this = high volatility
+REGIME_VOLUME_Z_HIGH = 2.5  # Volume z-score at or above this = high volatility
+REGIME_CONFIRM_BARS = 3  # Bars a calmer regime must hold before switching to it
+# Seconds between analyses per regime (None = the normal candle / interval cadence)
+REGIME_CADENCE = {
+    'dead': 300,
+    'normal': None,
+    'high': 15,
+}
+
+# Reuse the last AI decision while the quantized market state is unchanged
+DECISION_CACHE_ENABLED = os.getenv('DECISION_CACHE_ENABLED', 'true').lower() == 'true'
+DECISION_CACHE_TTL = 120  # Seconds a decision may be reused
+DECISION_CACHE_SIZE = 256  # Market states kept (LRU)
+DECISION_CACHE_PRICE_ATR_FRACTION = 0.25  # Price bucket width in ATRs
+DECISION_CACHE_RSI_BAND = 5  # RSI points per band
+DECISION_CACHE_VOLUME_BANDS = (0.8, 1.5)  # Volume ratio edges: low / normal / high volume
+DECISION_CACHE_BYPASS_TRIGGERS = ('trade_burst',)  # Bus triggers that always get a fresh analysis
+
+# Answer HOLD locally (no model call) when the rule-based setup score shows no trade
+PREFILTER_ENABLED = os.getenv('PREFILTER_ENABLED', 'true').lower() == 'true'
+PREFILTER_MIN_SCORE = int(os.getenv('PREFILTER_MIN_SCORE', 55))  # Signal score (trend + volume + sentiment, 25-70) needed to ask the model
+PREFILTER_PASS_TRIGGERS = ('trade_burst',)  # Bus triggers that always reach the model
+
+# Timeframes for multi-timeframe analysis; higher ones are resampled from the base timeframe
+MULTI_TIMEFRAMES = ['1m', '5m', '15m', '1h']
+
 # ============ TRADING CONFIGURATION ============
 TRADING_CONFIG: Dict = {
     # Trading pair and timeframe
@@ -37,6 +116,9 @@ TRADING_CONFIG: Dict = {
     'risk_per_trade': 0.02,  # 2% of account per trade
     'max_positions': 3,
     'min_confidence': 0.7,
+    'max_spread_bps': 10,  # Skip entries when the order book spread is wider
+    'min_reward_risk': 2.0,  # Take-profit distance over stop distance
+    'min_win_probability': 0.55,
     
     # Check intervals
     'check_interval': 60,  # Check every 60 seconds
@@ -56,6 +138,19 @@ TRADING_CONFIG: Dict = {
     'atr_period': 14,
     'atr_multiplier': 1.5,
     
+    # MACD
+    'macd_fast': 12,
+    'macd_slow': 26,
+    'macd_signal': 9,
+    
+    # Stochastic oscillator (%K lookback, %D smoothing)
+    'stoch_k': 14,
+    'stoch_d': 3,
+    
+    # Bollinger Bands (the middle band doubles as the SMA)
+    'bb_period': 20,
+    'bb_std_dev': 2,
+    
     # Volume
     'volume_threshold': 1.2,
 }
@@ -73,12 +168,30 @@ FLASK_DEBUG = os.getenv('FLASK_DEBUG', 'False').lower() == 'true'
 AI_MODEL = 'gemini-2.0-flash-exp'
 AI_MAX_RETRIES = 3
 AI_TIMEOUT = 30
+AI_MEMORY_TOKEN_BUDGET = 4000  # Estimated tokens of conversation resent with follow-up calls
+AI_MEMORY_MAX_TURNS = 12  # Verbatim messages kept; older ones are summarized
+AI_MEMORY_SUMMARY_LINES = 20  # Past verdicts kept in the rolling summary
+AI_PROVIDER_TIMEOUT = AI_TIMEOUT  # Seconds before any single provider request is given up
+# Hedged requests: fire the next provider if the current ones have not answered within the delay
+# (opt-in: every hedge is another paid request)
+AI_HEDGED_REQUESTS = os.getenv('AI_HEDGED_REQUESTS', 'false').lower() == 'true'
+AI_HEDGE_DELAY = float(os.getenv('AI_HEDGE_DELAY', 0)) or None  # Fixed seconds before the next provider (unset = from observed latency)
+AI_HEDGE_DEFAULT_DELAY = 10.0  # Delay until a provider has AI_HEDGE_MIN_SAMPLES answers on record
+AI_HEDGE_LATENCY_PERCENTILE = 95  # Observed answer latency a provider gets before it is hedged
+AI_HEDGE_LATENCY_WINDOW = 50  # Recent answer latencies kept per provider
+AI_HEDGE_MIN_SAMPLES = 10
+AI_HEDGE_TIMEOUT = AI_TIMEOUT  # Seconds to wait for any provider in total
+AI_HEDGE_MAX_WORKERS = 8  # Threads for in-flight provider calls (stragglers included)
 
 # ============ DATA STORAGE ============
 TRADES_LOG_FILE = 'logs/trades.json'
 DATA_DIR = 'data'
 LOGS_DIR = 'logs'
 
+# On-disk kline cache used for warm starts, backtests and analytics
+KLINE_STORE_ENABLED = os.getenv('KLINE_STORE_ENABLED', 'true').lower() == 'true'
+KLINE_STORE_DIR = os.path.join(DATA_DIR, 'klines')
+
 def get_trading_config(key: str, default=None):
     """Get trading configuration value safely"""
     return TRADING_CONFIG.get(key, default)
@@ -3,9 +3,18 @@ Technical Indicators Module
 Implements various technical analysis indicators for trading signals
 """
 
-import pandas as pd
+import math
 from typing import List, Tuple
 
+import numpy as np
+
+# Pure NumPy kernels for the live path; pandas versions live in indicators.reference
+
+
+def _tail(values, count: int) -> np.ndarray:
+    """Last ``count`` values as a float array (no copy for float64 arrays)"""
+    return np.asarray(values[-count:] if count else values[:0], dtype=np.float64)
+
 
 def calculate_rsi(prices: List[float], period: int = 14) -> float:
     """
@@ -18,12 +27,18 @@ def calculate_rsi(prices: List[float], period: int = 14) -> float:
     Returns:
         RSI value (0-100)
     """
-    deltas = pd.Series(prices).diff()
-    gain = (deltas.where(deltas > 0, 0)).rolling(window=period).mean()
-    loss = (-deltas.where(deltas < 0, 0)).rolling(window=period).mean()
-    rs = gain / loss
-    rsi = 100 - (100 / (1 + rs))
-    return float(rsi.iloc[-1])
+    if len(prices) < period:
+        return math.nan
+    
+    # The first price has no change; it counts as a zero gain/loss
+    window = _tail(prices, period + 1)
+    deltas = np.diff(window) if len(window) > period else np.r_[0.0, np.diff(window)]
+    gain = deltas[deltas > 0].sum() / period
+    loss = -deltas[deltas < 0].sum() / period
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rs = np.float64(gain) / loss
+    return float(100 - (100 / (1 + rs)))
 
 
 def calculate_ema(prices: List[float], period: int) -> float:
@@ -37,7 +52,15 @@ def calculate_ema(prices: List[float], period: int) -> float:
     Returns:
         EMA value
     """
-    return float(pd.Series(prices).ewm(span=period, adjust=False).mean().iloc[-1])
+    if not len(prices):
+        return math.nan
+    
+    # span=period, adjust=False: the first price seeds, then decays geometrically
+    values = np.asarray(prices, dtype=np.float64)
+    alpha = 2.0 / (period + 1)
+    weights = alpha * (1 - alpha) ** np.arange(len(values) - 1, -1, -1, dtype=np.float64)
+    weights[0] = (1 - alpha) ** (len(values) - 1)
+    return float(weights @ values)
 
 
 def calculate_atr(high: List[float], low: List[float], close: List[float], period: int = 14) -> float:
@@ -53,14 +76,18 @@ def calculate_atr(high: List[float], low: List[float], close: List[float], perio
     Returns:
         ATR value
     """
-    df = pd.DataFrame({'high': high, 'low': low, 'close': close})
-    df['tr'] = pd.concat([
-        df['high'] - df['low'],
-        abs(df['high'] - df['close'].shift()),
-        abs(df['low'] - df['close'].shift())
-    ], axis=1).max(axis=1)
-    atr = df['tr'].rolling(window=period).mean().iloc[-1]
-    return float(atr)
+    if len(close) < period:
+        return math.nan
+    
+    highs = _tail(high, period)
+    lows = _tail(low, period)
+    # Previous closes; the very first candle has none and uses high - low
+    prev_close = _tail(close, period + 1)[:-1]
+    if len(prev_close) < period:
+        prev_close = np.r_[np.nan, prev_close]
+    
+    true_range = np.fmax(highs - lows, np.fmax(np.abs(highs - prev_close), np.abs(lows - prev_close)))
+    return float(true_range.sum() / period)
 
 
 def calculate_sma(prices: List[float], period: int) -> float:
@@ -74,7 +101,9 @@ def calculate_sma(prices: List[float], period: int) -> float:
     Returns:
         SMA value
     """
-    return float(pd.Series(prices).rolling(window=period).mean().iloc[-1])
+    if len(prices) < period:
+        return math.nan
+    return float(_tail(prices, period).sum() / period)
 
 
 def calculate_bollinger_bands(prices: List[float], period: int = 20, std_dev: int = 2) -> Tuple[float, float, float]:
@@ -89,13 +118,15 @@ def calculate_bollinger_bands(prices: List[float], period: int = 20, std_dev: in
     Returns:
         Tuple of (upper_band, middle_band, lower_band)
     """
-    series = pd.Series(prices)
-    sma = series.rolling(window=period).mean()
-    std = series.rolling(window=period).std()
+    if len(prices) < period:
+        return math.nan, math.nan, math.nan
+    
+    window = _tail(prices, period)
+    middle = window.sum() / period
+    std = window.std(ddof=1) if period > 1 else math.nan
     
-    middle = sma.iloc[-1]
-    upper = middle + (std.iloc[-1] * std_dev)
-    lower = middle - (std.iloc[-1] * std_dev)
+    upper = middle + (std * std_dev)
+    lower = middle - (std * std_dev)
     
     return float(upper), float(middle), float(lower)
 
@@ -0,0 +1,213 @@
+"""
+Indicator Graph
+Per-bar memoized indicators that share their intermediates
+
+Every node result is cached under (symbol, timeframe, bar close time,
+node, params), so SMA, Bollinger Bands and RSI built on the same rolling
+windows or price changes compute them once, and every consumer asking
+about the same bar gets the same (read-only) arrays back. A bar that is
+still open is also keyed by its current OHLCV, so each tick re-evaluates
+it once.
+"""
+
+import logging
+from collections import OrderedDict
+from threading import Lock
+from types import MappingProxyType
+from typing import Callable, Dict, Tuple
+
+import numpy as np
+
+from indicators.series import (
+    sma_series, ema_series, rsi_from_changes, true_range_series, rolling_std_series,
+    vwap_series, stochastic_series, obv_series
+)
+from market.resampler import timeframe_to_ms
+from config.settings import INDICATOR_CACHE_SIZE
+
+logger = logging.getLogger(__name__)
+
+
+def _bollinger(node, candles, period: int, std_dev: float):
+    middle = node('sma', period=period)
+    std = node('rolling_std', period=period)
+    return middle + std * std_dev, middle, middle - std * std_dev
+
+
+def _macd(node, candles, fast: int, slow: int, signal: int):
+    macd = node('ema', period=fast) - node('ema', period=slow)
+    signal_line = ema_series(macd, signal)
+    return macd, signal_line, macd - signal_line
+
+
+# node name -> fn(node, candles, **params); ``node(name, **params)`` resolves a dependency
+NODES: Dict[str, Callable] = {
+    'sma': lambda node, c, period: sma_series(c['close'], period),
+    'ema': lambda node, c, period: ema_series(c['close'], period),
+    'rolling_std': lambda node, c, period: rolling_std_series(c['close'], period),
+    'bollinger': _bollinger,
+    'price_change': lambda node, c: np.diff(np.asarray(c['close'], dtype=np.float64), prepend=np.nan),
+    'rsi': lambda node, c, period: rsi_from_changes(node('price_change'), period),
+    'true_range': lambda node, c: true_range_series(c['high'], c['low'], c['close']),
+    'atr': lambda node, c, period: sma_series(node('true_range'), period),
+    'macd': _macd,
+    'vwap': lambda node, c: vwap_series(c['open_time'], c['high'], c['low'], c['close'], c['volume']),
+    'stochastic': lambda node, c, k_period, d_period: stochastic_series(
+        c['high'], c['low'], c['close'], k_period, d_period
+    ),
+    'obv': lambda node, c: obv_series(c['close'], c['volume']),
+}
+
+
+def _freeze(value):
+    """Make a cached result read-only, since every caller shares it"""
+    if isinstance(value, np.ndarray):
+        value.flags.writeable = False
+    elif isinstance(value, tuple):
+        for item in value:
+            _freeze(item)
+    elif isinstance(value, dict):
+        for item in value.values():
+            _freeze(item)
+        return MappingProxyType(value)
+    return value
+
+
+class IndicatorGraph:
+    """Bounded LRU cache of indicator nodes evaluated over candle windows"""
+
+    def __init__(self, max_entries: int = INDICATOR_CACHE_SIZE):
+        """
+        Initialize graph
+
+        Args:
+            max_entries: Node results kept before the least recently used
+                ones are evicted
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._cache: OrderedDict = OrderedDict()
+        self._lock = Lock()
+
+    @staticmethod
+    def bar_key(symbol: str, timeframe: str, candles: Dict[str, np.ndarray]) -> Tuple:
+        """
+        Identity of the window's last bar
+
+        Args:
+            symbol: Trading pair
+            timeframe: Kline interval
+            candles: OHLCV window, oldest first
+
+        Returns:
+            (symbol, timeframe, close time, revision) - the revision changes
+            whenever the window is reloaded or the open bar ticks
+        """
+        times = candles['open_time']
+        close_time = int(times[-1]) + timeframe_to_ms(timeframe)
+        revision = (
+            len(times), int(times[0]),
+            float(candles['high'][-1]), float(candles['low'][-1]),
+            float(candles['close'][-1]), float(candles['volume'][-1])
+        )
+        return symbol, timeframe, close_time, revision
+
+    def evaluate(self, symbol: str, timeframe: str, candles: Dict[str, np.ndarray],
+                 name: str, **params):
+        """
+        Full-series value of a node for the window ending at its last bar
+
+        Args:
+            symbol: Trading pair
+            timeframe: Kline interval
+            candles: OHLCV window, oldest first
+            name: Node name (see ``NODES``)
+            **params: Node parameters (e.g. period=14)
+
+        Returns:
+            Read-only array (or tuple of arrays) aligned with the window
+        """
+        if name not in NODES:
+            raise ValueError(f"Unknown indicator node: {name}")
+        bar = self.bar_key(symbol, timeframe, candles)
+        return self._resolve(bar, candles, name, params, NODES[name])
+
+    def latest(self, symbol: str, timeframe: str, candles: Dict[str, np.ndarray],
+               name: str, **params):
+        """
+        Last-bar value of a node
+
+        Returns:
+            Float (or tuple of floats for multi-output nodes such as bollinger)
+        """
+        value = self.evaluate(symbol, timeframe, candles, name, **params)
+        if isinstance(value, tuple):
+            return tuple(float(v[-1]) for v in value)
+        return float(value[-1])
+
+    def memo(self, symbol: str, timeframe: str, candles: Dict[str, np.ndarray],
+             name: str, compute: Callable, **params):
+        """
+        Cache a caller-supplied per-bar computation alongside the nodes
+
+        Args:
+            symbol: Trading pair
+            timeframe: Kline interval
+            candles: OHLCV window, oldest first
+            name: Cache name (must not clash with a node)
+            compute: Zero-argument callable run on a cache miss
+            **params: Extra key parameters
+
+        Returns:
+            Cached (or freshly computed) result, shared with every other
+            caller for the bar: arrays are read-only and a dict comes back
+            as a read-only mapping
+        """
+        bar = self.bar_key(symbol, timeframe, candles)
+        return self._resolve(bar, candles, name, params, lambda node, c, **p: compute())
+
+    def _resolve(self, bar: Tuple, candles: Dict[str, np.ndarray], name: str,
+                 params: Dict, fn: Callable):
+        key = bar + (name, tuple(sorted(params.items())))
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return self._cache[key]
+            self.misses += 1
+
+        def node(dependency: str, **dependency_params):
+            return self._resolve(bar, candles, dependency, dependency_params, NODES[dependency])
+
+        value = _freeze(fn(node, candles, **params))
+
+        with self._lock:
+            self._cache[key] = value
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def clear(self) -> None:
+        """Drop every cached result"""
+        with self._lock:
+            self._cache.clear()
+
+    def get_stats(self) -> Dict:
+        """Cache size, hit rate and evictions"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._cache),
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+            }
+
+
+# One graph per process so every consumer reuses the same per-bar results
+shared_graph = IndicatorGraph()
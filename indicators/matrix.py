@@ -0,0 +1,174 @@
+"""
+Indicator Matrix
+Watchlist candles held as symbols x bars arrays, with RSI/EMA/ATR/volume
+ratio computed for every symbol in one vectorized pass
+
+Values match the per-symbol functions in ``indicators`` for the same
+window; symbols with fewer bars than the matrix holds are left-padded
+with NaN and get NaN for any indicator their history cannot cover.
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from config.settings import TRADING_CONFIG
+
+# Compact per-symbol feature table (one record per symbol)
+FEATURE_DTYPE = np.dtype([
+    ('symbol', 'U20'),
+    ('open_time', '<i8'),   # Open time of the last bar (ms), 0 if no data
+    ('price', '<f8'),
+    ('rsi', '<f8'),
+    ('ema_fast', '<f8'),
+    ('ema_slow', '<f8'),
+    ('atr', '<f8'),
+    ('volume_ratio', '<f8'),
+    ('trend', 'i1'),        # 1 bullish, -1 bearish, 0 neutral
+])
+
+
+def _ema_last(close: np.ndarray, period: int) -> np.ndarray:
+    """Last EMA (span, adjust=False) of every row, seeded at each row's first valid bar"""
+    bars = close.shape[1]
+    alpha = 2.0 / (period + 1)
+    decay = 1.0 - alpha
+    # Weight of bar j given the series starts at bar s: alpha * decay**(n-1-j),
+    # except the seed bar s, which carries decay**(n-1-s)
+    powers = decay ** np.arange(bars - 1, -1, -1, dtype=np.float64)
+    first = np.argmax(~np.isnan(close), axis=1)
+
+    weights = np.broadcast_to(alpha * powers, close.shape).copy()
+    rows = np.arange(close.shape[0])
+    weights[rows, first] = powers[first]
+    values = np.where(np.isnan(close), 0.0, close)
+    weights[np.arange(bars)[None, :] < first[:, None]] = 0.0
+
+    out = np.einsum('ij,ij->i', weights, values)
+    out[np.isnan(close).all(axis=1)] = np.nan
+    return out
+
+
+def compute_features(symbols: List[str], open_time: np.ndarray, high: np.ndarray,
+                     low: np.ndarray, close: np.ndarray, volume: np.ndarray,
+                     config: Dict = TRADING_CONFIG) -> np.ndarray:
+    """
+    Indicators for every row of symbols x bars arrays (oldest bar first)
+
+    Args:
+        symbols: Row labels
+        open_time: Bar open times (ms), int64
+        high: High prices (NaN where a symbol has no bar)
+        low: Low prices
+        close: Closing prices
+        volume: Volumes
+        config: Settings providing rsi_period, ema_fast, ema_slow and atr_period
+
+    Returns:
+        Structured array of ``FEATURE_DTYPE``, one record per symbol
+    """
+    rows, bars = close.shape
+    features = np.zeros(rows, dtype=FEATURE_DTYPE)
+    features['symbol'] = symbols
+    if not bars:
+        for field in ('price', 'rsi', 'ema_fast', 'ema_slow', 'atr', 'volume_ratio'):
+            features[field] = np.nan
+        return features
+
+    features['open_time'] = open_time[:, -1]
+    features['price'] = close[:, -1]
+    available = (~np.isnan(close)).sum(axis=1)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # RSI: simple means of the last ``period`` gains / losses; a series'
+        # first bar has no change and counts as zero
+        period = config['rsi_period']
+        deltas = np.diff(close[:, -(period + 1):], axis=1)
+        if deltas.shape[1] < period:
+            deltas = np.concatenate([np.full((rows, period - deltas.shape[1]), np.nan), deltas], axis=1)
+        deltas = np.where(np.isnan(deltas) & (available == period)[:, None], 0.0, deltas)
+        gain = np.where(deltas > 0, deltas, 0.0).sum(axis=1) / period
+        loss = np.where(deltas < 0, -deltas, 0.0).sum(axis=1) / period
+        rsi = 100 - 100 / (1 + gain / loss)
+        rsi[np.isnan(deltas).any(axis=1)] = np.nan
+        features['rsi'] = rsi
+
+        features['ema_fast'] = _ema_last(close, config['ema_fast'])
+        features['ema_slow'] = _ema_last(close, config['ema_slow'])
+
+        # ATR: mean of the last ``period`` true ranges (high - low on a first bar)
+        period = config['atr_period']
+        prev_close = np.concatenate([np.full((rows, 1), np.nan), close[:, :-1]], axis=1)[:, -period:]
+        highs, lows = high[:, -period:], low[:, -period:]
+        true_range = np.fmax(highs - lows, np.fmax(np.abs(highs - prev_close), np.abs(lows - prev_close)))
+        atr = true_range.sum(axis=1) / period
+        atr[(available < period) | np.isnan(highs).any(axis=1)] = np.nan
+        features['atr'] = atr
+
+        avg_volume = volume[:, -20:].sum(axis=1) / 20
+        # 1.0 for a zero average, as the per-symbol path; NaN without 20 bars
+        volume_ratio = np.where(avg_volume > 0, volume[:, -1] / avg_volume, 1.0)
+        volume_ratio[np.isnan(avg_volume)] = np.nan
+        features['volume_ratio'] = volume_ratio
+
+    features['trend'] = np.sign(np.nan_to_num(features['ema_fast'] - features['ema_slow']))
+    return features
+
+
+class WatchlistMatrix:
+    """Preallocated symbols x bars candle arrays for a fixed watchlist"""
+
+    def __init__(self, symbols: List[str], bars: int):
+        """
+        Initialize matrix
+
+        Args:
+            symbols: Watchlist, one row each
+            bars: Bars kept per symbol (newest aligned to the last column)
+        """
+        self.symbols = list(symbols)
+        self.bars = bars
+        self.rows = {symbol: i for i, symbol in enumerate(self.symbols)}
+
+        shape = (len(self.symbols), bars)
+        self.open_time = np.zeros(shape, dtype=np.int64)
+        self.high = np.full(shape, np.nan)
+        self.low = np.full(shape, np.nan)
+        self.close = np.full(shape, np.nan)
+        self.volume = np.full(shape, np.nan)
+
+    def set_row(self, symbol: str, window: Optional[Dict[str, np.ndarray]]) -> None:
+        """
+        Copy a symbol's newest candles into its row
+
+        Args:
+            symbol: Watchlist symbol
+            window: OHLCV window (see ``OHLCVBuffer.window``), or None to
+                mark the symbol as having no data
+        """
+        i = self.rows[symbol]
+        count = 0 if window is None else min(self.bars, len(window['open_time']))
+        pad = self.bars - count
+
+        self.open_time[i, :pad] = 0
+        for array in (self.high, self.low, self.close, self.volume):
+            array[i, :pad] = np.nan
+        if not count:
+            return
+
+        self.open_time[i, pad:] = window['open_time'][-count:]
+        self.high[i, pad:] = window['high'][-count:]
+        self.low[i, pad:] = window['low'][-count:]
+        self.close[i, pad:] = window['close'][-count:]
+        self.volume[i, pad:] = window['volume'][-count:]
+
+    def features(self, config: Dict = TRADING_CONFIG) -> np.ndarray:
+        """
+        Compute the feature table for every symbol at once
+
+        Returns:
+            Structured array of ``FEATURE_DTYPE`` in watchlist order
+        """
+        return compute_features(
+            self.symbols, self.open_time, self.high, self.low, self.close, self.volume, config
+        )
@@ -0,0 +1,207 @@
+"""
+Volatility Regime Detection
+Streaming dead / normal / high volatility classifier over closed candles
+
+Three readings are updated in constant (or lookback-bounded) time per
+closed candle:
+
+- ATR percentile: where ATR / price sits among the last ``lookback`` bars
+- realized volatility percentile: same for the rolling std of returns
+- volume z-score: current volume against the lookback mean and std
+"""
+
+import bisect
+import logging
+import math
+from collections import deque
+from typing import Dict, Optional
+
+from indicators.streaming import StreamingATR, _RollingMean
+from config.settings import (
+    TRADING_CONFIG, REGIME_LOOKBACK, REGIME_RV_PERIOD, REGIME_DEAD_PERCENTILE,
+    REGIME_HIGH_PERCENTILE, REGIME_VOLUME_Z_HIGH, REGIME_CONFIRM_BARS
+)
+
+logger = logging.getLogger(__name__)
+
+REGIME_DEAD = 'dead'
+REGIME_NORMAL = 'normal'
+REGIME_HIGH = 'high'
+
+
+class _RollingRank:
+    """Percentile rank of the newest value within a fixed window"""
+
+    def __init__(self, period: int):
+        self.values = deque(maxlen=period)
+        self._sorted = []
+
+    def push(self, value: float) -> float:
+        """Add a value and return its percentile (0-100) among the window"""
+        if len(self.values) == self.values.maxlen:
+            oldest = self.values[0]
+            del self._sorted[bisect.bisect_left(self._sorted, oldest)]
+        self.values.append(value)
+        bisect.insort(self._sorted, value)
+        below = bisect.bisect_left(self._sorted, value)
+        equal = bisect.bisect_right(self._sorted, value) - below
+        return 100.0 * (below + 0.5 * equal) / len(self._sorted)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+class RegimeDetector:
+    """Classifies each closed candle as a dead, normal or high volatility regime"""
+
+    def __init__(self, lookback: int = REGIME_LOOKBACK, rv_period: int = REGIME_RV_PERIOD,
+                 atr_period: int = TRADING_CONFIG['atr_period'],
+                 dead_percentile: float = REGIME_DEAD_PERCENTILE,
+                 high_percentile: float = REGIME_HIGH_PERCENTILE,
+                 volume_z_high: float = REGIME_VOLUME_Z_HIGH,
+                 confirm_bars: int = REGIME_CONFIRM_BARS):
+        """
+        Initialize detector
+
+        Args:
+            lookback: Bars the percentiles and volume z-score are taken over
+            rv_period: Bars in the realized volatility (std of returns)
+            atr_period: ATR period
+            dead_percentile: ATR and RV percentiles both at or below this
+                (with below-average volume) mean a dead market
+            high_percentile: ATR and RV percentiles both at or above this
+                mean high volatility
+            volume_z_high: Volume z-score at or above this also means high
+                volatility
+            confirm_bars: Consecutive bars a calmer regime must hold before
+                switching to it (high volatility switches immediately)
+        """
+        self.lookback = lookback
+        self.dead_percentile = dead_percentile
+        self.high_percentile = high_percentile
+        self.volume_z_high = volume_z_high
+        self.confirm_bars = confirm_bars
+        self.min_bars = max(atr_period, rv_period) + rv_period
+
+        self._atr = StreamingATR(atr_period)
+        self._returns = _RollingMean(rv_period)
+        self._squared_returns = _RollingMean(rv_period)
+        self._volume = _RollingMean(lookback)
+        self._squared_volume = _RollingMean(lookback)
+        self._atr_rank = _RollingRank(lookback)
+        self._rv_rank = _RollingRank(lookback)
+        self._prev_close: Optional[float] = None
+
+        self.bars = 0
+        self.last_open_time: Optional[int] = None
+        self.regime = REGIME_NORMAL
+        self._candidate = REGIME_NORMAL
+        self._candidate_bars = 0
+        self.readings: Dict[str, float] = {}
+        self.changes = 0
+
+    def update(self, high: float, low: float, close: float, volume: float) -> str:
+        """
+        Feed one closed candle
+
+        Args:
+            high: Candle high
+            low: Candle low
+            close: Candle close
+            volume: Candle volume
+
+        Returns:
+            Regime after this candle (normal until enough bars are seen)
+        """
+        self.bars += 1
+        atr = self._atr.update(high, low, close)
+
+        if self._prev_close:
+            change = close / self._prev_close - 1.0
+            self._returns.push(change)
+            self._squared_returns.push(change * change)
+        self._prev_close = close
+
+        self._volume.push(volume)
+        self._squared_volume.push(volume * volume)
+
+        mean_return = self._returns.mean
+        realized_vol = math.sqrt(max(self._squared_returns.mean - mean_return * mean_return, 0.0))
+
+        atr_percentile = self._atr_rank.push(atr / close) if not math.isnan(atr) else math.nan
+        rv_percentile = self._rv_rank.push(realized_vol) if not math.isnan(realized_vol) else math.nan
+
+        # Volume z-score over whatever history exists so far
+        count = len(self._volume.values)
+        mean_volume = self._volume.total / count
+        variance = self._squared_volume.total / count - mean_volume * mean_volume
+        volume_z = (volume - mean_volume) / math.sqrt(variance) if variance > 0 else 0.0
+
+        self.readings = {
+            'atr_percentile': atr_percentile,
+            'rv_percentile': rv_percentile,
+            'realized_vol': realized_vol,
+            'volume_z': volume_z,
+        }
+
+        regime = self._classify(atr_percentile, rv_percentile, volume_z)
+        if regime == self._candidate:
+            self._candidate_bars += 1
+        else:
+            self._candidate, self._candidate_bars = regime, 1
+
+        if regime != self.regime and (regime == REGIME_HIGH or self._candidate_bars >= self.confirm_bars):
+            logger.info(
+                f"🌡️ Volatility regime {self.regime} → {regime} "
+                f"(ATR pct {atr_percentile:.0f}, RV pct {rv_percentile:.0f}, volume z {volume_z:+.1f})"
+            )
+            self.regime = regime
+            self.changes += 1
+        return self.regime
+
+    def _classify(self, atr_percentile: float, rv_percentile: float, volume_z: float) -> str:
+        if self.bars < self.min_bars or math.isnan(atr_percentile) or math.isnan(rv_percentile):
+            return REGIME_NORMAL
+        if ((atr_percentile >= self.high_percentile and rv_percentile >= self.high_percentile)
+                or volume_z >= self.volume_z_high):
+            return REGIME_HIGH
+        if (atr_percentile <= self.dead_percentile and rv_percentile <= self.dead_percentile
+                and volume_z <= 0):
+            return REGIME_DEAD
+        return REGIME_NORMAL
+
+    def ingest(self, candles: Dict) -> str:
+        """
+        Feed every closed candle of an OHLCV window not seen yet
+
+        The window's last candle is treated as still open.
+
+        Args:
+            candles: OHLCV window (e.g. ``MarketSnapshot.candles``)
+
+        Returns:
+            Current regime
+        """
+        times = candles['open_time']
+        if len(times) < 2:
+            return self.regime
+
+        start = 0
+        if self.last_open_time is not None:
+            start = int(bisect.bisect_right(times[:-1], self.last_open_time))
+        for i in range(start, len(times) - 1):
+            self.update(
+                float(candles['high'][i]), float(candles['low'][i]),
+                float(candles['close'][i]), float(candles['volume'][i])
+            )
+        self.last_open_time = int(times[-2])
+        return self.regime
+
+    def get_state(self) -> Dict:
+        """Current regime and the readings behind it"""
+        return {
+            'regime': self.regime,
+            'bars': self.bars,
+            'changes': self.changes,
+            **{name: None if math.isnan(value) else round(value, 6) for name, value in self.readings.items()}
+        }
@@ -0,0 +1,300 @@
+"""
+Full-Series Technical Indicators
+Vectorized RSI/EMA/ATR/SMA/Bollinger/MACD/VWAP/Stochastic/OBV over whole
+NumPy price arrays
+
+Each function returns an array aligned with its input, holding the value
+the matching function in ``indicators`` (or streaming indicator in
+``indicators.streaming``) would return for the prefix ending at that bar.
+Positions without enough history are NaN.
+"""
+
+from typing import Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Bars per block in the EMA recurrence (one B x B matrix product per block)
+_EMA_BLOCK = 256
+
+
+def _as_array(values) -> np.ndarray:
+    return np.asarray(values, dtype=np.float64)
+
+
+def sma_series(prices, period: int) -> np.ndarray:
+    """
+    Simple moving average for every bar
+
+    Args:
+        prices: Closing prices, oldest first
+        period: SMA period
+
+    Returns:
+        Array of SMA values (NaN for the first ``period - 1`` bars)
+    """
+    prices = _as_array(prices)
+    out = np.full(len(prices), np.nan)
+    if len(prices) >= period:
+        out[period - 1:] = sliding_window_view(prices, period).mean(axis=1)
+    return out
+
+
+def ema_series(prices, period: int) -> np.ndarray:
+    """
+    Exponential moving average for every bar (span ``period``, seeded
+    with the first price, same as ``calculate_ema``)
+
+    The recurrence is solved in blocks: inside a block every output is a
+    fixed linear combination of the block's prices plus a decayed carry
+    from the previous block, so all blocks are one matrix product and only
+    the per-block carries are chained in Python.
+
+    Args:
+        prices: Closing prices, oldest first
+        period: EMA span
+
+    Returns:
+        Array of EMA values
+    """
+    prices = _as_array(prices)
+    n = len(prices)
+    if not n:
+        return np.empty(0)
+
+    alpha = 2.0 / (period + 1)
+    decay = 1.0 - alpha
+    block = min(_EMA_BLOCK, n)
+
+    # weights[i, j] = alpha * decay**(i - j) for j <= i
+    lags = np.arange(block)[:, None] - np.arange(block)[None, :]
+    weights = np.where(lags >= 0, alpha * decay ** np.maximum(lags, 0), 0.0)
+    carry_decay = decay ** np.arange(1, block + 1)
+
+    blocks = -(-n // block)
+    padded = np.empty(blocks * block)
+    padded[:n] = prices
+    padded[n:] = prices[-1]
+    local = padded.reshape(blocks, block) @ weights.T
+
+    # EMA value just before each block (the first price seeds the series)
+    carries = np.empty(blocks)
+    carry = prices[0]
+    last_decay = carry_decay[-1]
+    for b in range(blocks):
+        carries[b] = carry
+        carry = local[b, -1] + last_decay * carry
+
+    return (local + carries[:, None] * carry_decay[None, :]).ravel()[:n]
+
+
+def rsi_series(prices, period: int = 14) -> np.ndarray:
+    """
+    RSI for every bar (simple-average gains/losses, same as ``calculate_rsi``)
+
+    Args:
+        prices: Closing prices, oldest first
+        period: RSI period (default: 14)
+
+    Returns:
+        Array of RSI values 0-100 (NaN for the first ``period - 1`` bars
+        and wherever the window has neither gains nor losses)
+    """
+    return rsi_from_changes(np.diff(_as_array(prices), prepend=np.nan), period)
+
+
+def rsi_from_changes(changes: np.ndarray, period: int = 14) -> np.ndarray:
+    """
+    RSI from bar-to-bar price changes (first change NaN, as ``np.diff(prepend=nan)``)
+
+    Args:
+        changes: Close-to-close changes, oldest first
+        period: RSI period
+
+    Returns:
+        Array of RSI values (see ``rsi_series``)
+    """
+    gains = np.where(changes > 0, changes, 0.0)
+    losses = np.where(changes < 0, -changes, 0.0)
+
+    avg_gain = sma_series(gains, period)
+    avg_loss = sma_series(losses, period)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return 100 - 100 / (1 + avg_gain / avg_loss)
+
+
+def true_range_series(high, low, close) -> np.ndarray:
+    """
+    True range for every bar (high - low on the first bar)
+
+    Args:
+        high: High prices, oldest first
+        low: Low prices
+        close: Closing prices
+
+    Returns:
+        Array of true range values
+    """
+    high, low, close = _as_array(high), _as_array(low), _as_array(close)
+    prev_close = np.r_[np.nan, close[:-1]]
+    with np.errstate(invalid='ignore'):
+        return np.fmax(high - low, np.fmax(np.abs(high - prev_close), np.abs(low - prev_close)))
+
+
+def atr_series(high, low, close, period: int = 14) -> np.ndarray:
+    """
+    ATR for every bar (simple average of true range, same as ``calculate_atr``)
+
+    Args:
+        high: High prices, oldest first
+        low: Low prices
+        close: Closing prices
+        period: ATR period (default: 14)
+
+    Returns:
+        Array of ATR values (NaN for the first ``period - 1`` bars)
+    """
+    return sma_series(true_range_series(high, low, close), period)
+
+
+def rolling_std_series(prices, period: int) -> np.ndarray:
+    """
+    Rolling sample standard deviation for every bar
+
+    Args:
+        prices: Closing prices, oldest first
+        period: Window length
+
+    Returns:
+        Array of standard deviations (NaN for the first ``period - 1`` bars)
+    """
+    prices = _as_array(prices)
+    std = np.full(len(prices), np.nan)
+    if len(prices) >= period and period > 1:
+        std[period - 1:] = sliding_window_view(prices, period).std(axis=1, ddof=1)
+    return std
+
+
+def bollinger_series(prices, period: int = 20,
+                     std_dev: float = 2) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Bollinger Bands for every bar (sample standard deviation)
+
+    Args:
+        prices: Closing prices, oldest first
+        period: Period for bands (default: 20)
+        std_dev: Number of standard deviations (default: 2)
+
+    Returns:
+        Tuple of (upper, middle, lower) arrays (NaN for the first
+        ``period - 1`` bars)
+    """
+    middle = sma_series(prices, period)
+    std = rolling_std_series(prices, period)
+    return middle + std * std_dev, middle, middle - std * std_dev
+
+
+def macd_series(prices, fast: int = 12, slow: int = 26,
+                signal: int = 9) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    MACD for every bar
+
+    Args:
+        prices: Closing prices, oldest first
+        fast: Fast EMA span (default: 12)
+        slow: Slow EMA span (default: 26)
+        signal: Signal EMA span (default: 9)
+
+    Returns:
+        Tuple of (macd, signal, histogram) arrays
+    """
+    macd = ema_series(prices, fast) - ema_series(prices, slow)
+    signal_line = ema_series(macd, signal)
+    return macd, signal_line, macd - signal_line
+
+
+def vwap_series(open_time, high, low, close, volume,
+                session_ms: int = 86_400_000) -> np.ndarray:
+    """
+    Session VWAP of typical price for every bar (resets each session)
+
+    Args:
+        open_time: Candle open times (ms), oldest first
+        high: High prices
+        low: Low prices
+        close: Closing prices
+        volume: Volumes
+        session_ms: Session length in ms (default: one UTC day)
+
+    Returns:
+        Array of VWAP values (NaN while a session has no volume)
+    """
+    open_time = np.asarray(open_time, dtype=np.int64)
+    volume = _as_array(volume)
+    typical = (_as_array(high) + _as_array(low) + _as_array(close)) / 3
+    if not len(open_time):
+        return np.empty(0)
+
+    sessions = open_time - open_time % session_ms
+    starts = np.flatnonzero(np.r_[True, sessions[1:] != sessions[:-1]])
+    lengths = np.diff(np.r_[starts, len(sessions)])
+
+    def session_cumsum(values: np.ndarray) -> np.ndarray:
+        totals = np.cumsum(values)
+        before = np.r_[0.0, totals[starts[1:] - 1]]
+        return totals - np.repeat(before, lengths)
+
+    price_volume = session_cumsum(typical * volume)
+    total_volume = session_cumsum(volume)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(total_volume > 0, price_volume / total_volume, np.nan)
+
+
+def stochastic_series(high, low, close, k_period: int = 14,
+                      d_period: int = 3) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Stochastic oscillator for every bar
+
+    Args:
+        high: High prices, oldest first
+        low: Low prices
+        close: Closing prices
+        k_period: Highest-high / lowest-low lookback (default: 14)
+        d_period: %D smoothing period (default: 3)
+
+    Returns:
+        Tuple of (%K, %D) arrays; %K is 50 where the range is flat
+    """
+    high, low, close = _as_array(high), _as_array(low), _as_array(close)
+    k = np.full(len(close), np.nan)
+    if len(close) >= k_period:
+        highest = sliding_window_view(high, k_period).max(axis=1)
+        lowest = sliding_window_view(low, k_period).min(axis=1)
+        span = highest - lowest
+        with np.errstate(divide='ignore', invalid='ignore'):
+            k[k_period - 1:] = np.where(
+                span == 0, 50.0, 100 * (close[k_period - 1:] - lowest) / span
+            )
+
+    d = np.full(len(close), np.nan)
+    if len(close) >= k_period + d_period - 1:
+        d[k_period + d_period - 2:] = sma_series(k[k_period - 1:], d_period)[d_period - 1:]
+    return k, d
+
+
+def obv_series(close, volume) -> np.ndarray:
+    """
+    On-balance volume for every bar (0 at the first bar)
+
+    Args:
+        close: Closing prices, oldest first
+        volume: Volumes
+
+    Returns:
+        Array of OBV values
+    """
+    close, volume = _as_array(close), _as_array(volume)
+    if not len(close):
+        return np.empty(0)
+    signed = np.sign(np.diff(close)) * volume[1:]
+    return np.r_[0.0, np.cumsum(signed)]
@@ -0,0 +1,544 @@
+"""
+Streaming Technical Indicators
+Stateful RSI/EMA/ATR/MACD/VWAP/Stochastic/OBV that update in constant
+time per candle
+
+Each indicator matches the window implementation in ``indicators`` (or
+the full-series one in ``indicators.series``) over the same input
+sequence. ``update(..., closed=False)`` evaluates an in-progress candle
+without committing it, so the live (unfinished) bar can be re-evaluated
+on every tick.
+"""
+
+import math
+from collections import deque
+from typing import Dict, Optional, Tuple
+
+from config.settings import TRADING_CONFIG
+
+
+class _RollingMean:
+    """Fixed-window running mean with periodic resync against float drift"""
+
+    def __init__(self, period: int):
+        self.period = period
+        self.values = deque(maxlen=period)
+        self.total = 0.0
+        self._since_resync = 0
+
+    def push(self, value: float) -> None:
+        if len(self.values) == self.period:
+            self.total -= self.values[0]
+        self.values.append(value)
+        self.total += value
+
+        self._since_resync += 1
+        if self._since_resync >= self.period:
+            self.total = math.fsum(self.values)
+            self._since_resync = 0
+
+    def mean_with(self, value: float) -> float:
+        """Mean if ``value`` were pushed, without pushing it"""
+        if len(self.values) + 1 < self.period:
+            return math.nan
+        dropped = self.values[0] if len(self.values) == self.period else 0.0
+        return (self.total - dropped + value) / self.period
+
+    @property
+    def mean(self) -> float:
+        if len(self.values) < self.period:
+            return math.nan
+        return self.total / self.period
+
+    def snapshot(self) -> Dict:
+        return {'values': list(self.values), 'total': self.total, 'since_resync': self._since_resync}
+
+    def restore(self, state: Dict) -> None:
+        self.values = deque(state['values'], maxlen=self.period)
+        self.total = state['total']
+        self._since_resync = state.get('since_resync', 0)
+
+
+class StreamingEMA:
+    """EMA with ``span=period, adjust=False`` semantics"""
+
+    def __init__(self, period: int):
+        """
+        Args:
+            period: EMA span
+        """
+        self.period = period
+        self.alpha = 2.0 / (period + 1)
+        self.value = math.nan
+
+    def update(self, close: float, closed: bool = True) -> float:
+        """
+        Feed one close
+
+        Args:
+            close: Candle close
+            closed: Commit the candle (False evaluates an in-progress candle)
+
+        Returns:
+            EMA value including this candle
+        """
+        if math.isnan(self.value):
+            value = close
+        else:
+            value = self.alpha * close + (1 - self.alpha) * self.value
+
+        if closed:
+            self.value = value
+        return value
+
+    def snapshot(self) -> Dict:
+        return {'period': self.period, 'value': self.value}
+
+    def restore(self, state: Dict) -> None:
+        self.value = state['value']
+
+
+class StreamingRSI:
+    """RSI using simple rolling means of gains and losses"""
+
+    def __init__(self, period: int = 14):
+        """
+        Args:
+            period: RSI period
+        """
+        self.period = period
+        self.prev_close: Optional[float] = None
+        self._gains = _RollingMean(period)
+        self._losses = _RollingMean(period)
+        self.value = math.nan
+
+    def update(self, close: float, closed: bool = True) -> float:
+        """
+        Feed one close
+
+        Args:
+            close: Candle close
+            closed: Commit the candle (False evaluates an in-progress candle)
+
+        Returns:
+            RSI value (0-100), NaN until ``period`` candles are seen
+        """
+        delta = 0.0 if self.prev_close is None else close - self.prev_close
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+
+        if closed:
+            self._gains.push(gain)
+            self._losses.push(loss)
+            self.prev_close = close
+            value = self._rsi(self._gains.mean, self._losses.mean)
+            self.value = value
+            return value
+
+        return self._rsi(self._gains.mean_with(gain), self._losses.mean_with(loss))
+
+    @staticmethod
+    def _rsi(avg_gain: float, avg_loss: float) -> float:
+        if math.isnan(avg_gain) or math.isnan(avg_loss):
+            return math.nan
+        if avg_loss == 0:
+            return 100.0 if avg_gain > 0 else math.nan
+        return 100 - (100 / (1 + avg_gain / avg_loss))
+
+    def snapshot(self) -> Dict:
+        return {
+            'period': self.period,
+            'prev_close': self.prev_close,
+            'gains': self._gains.snapshot(),
+            'losses': self._losses.snapshot(),
+            'value': self.value
+        }
+
+    def restore(self, state: Dict) -> None:
+        self.prev_close = state['prev_close']
+        self._gains.restore(state['gains'])
+        self._losses.restore(state['losses'])
+        self.value = state['value']
+
+
+class StreamingATR:
+    """ATR as the simple rolling mean of true range"""
+
+    def __init__(self, period: int = 14):
+        """
+        Args:
+            period: ATR period
+        """
+        self.period = period
+        self.prev_close: Optional[float] = None
+        self._true_range = _RollingMean(period)
+        self.value = math.nan
+
+    def update(self, high: float, low: float, close: float, closed: bool = True) -> float:
+        """
+        Feed one candle
+
+        Args:
+            high: Candle high
+            low: Candle low
+            close: Candle close
+            closed: Commit the candle (False evaluates an in-progress candle)
+
+        Returns:
+            ATR value, NaN until ``period`` candles are seen
+        """
+        true_range = high - low
+        if self.prev_close is not None:
+            true_range = max(true_range, abs(high - self.prev_close), abs(low - self.prev_close))
+
+        if closed:
+            self._true_range.push(true_range)
+            self.prev_close = close
+            self.value = self._true_range.mean
+            return self.value
+
+        return self._true_range.mean_with(true_range)
+
+    def snapshot(self) -> Dict:
+        return {
+            'period': self.period,
+            'prev_close': self.prev_close,
+            'true_range': self._true_range.snapshot(),
+            'value': self.value
+        }
+
+    def restore(self, state: Dict) -> None:
+        self.prev_close = state['prev_close']
+        self._true_range.restore(state['true_range'])
+        self.value = state['value']
+
+
+class StreamingMACD:
+    """MACD line, signal line and histogram from streaming EMAs"""
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        """
+        Args:
+            fast: Fast EMA span
+            slow: Slow EMA span
+            signal: Signal EMA span (over the MACD line)
+        """
+        self.fast = StreamingEMA(fast)
+        self.slow = StreamingEMA(slow)
+        self.signal = StreamingEMA(signal)
+
+    def update(self, close: float, closed: bool = True) -> Tuple[float, float, float]:
+        """
+        Feed one close
+
+        Args:
+            close: Candle close
+            closed: Commit the candle (False evaluates an in-progress candle)
+
+        Returns:
+            Tuple of (macd, signal, histogram)
+        """
+        macd = self.fast.update(close, closed) - self.slow.update(close, closed)
+        signal = self.signal.update(macd, closed)
+        return macd, signal, macd - signal
+
+    def snapshot(self) -> Dict:
+        return {
+            'fast': self.fast.snapshot(),
+            'slow': self.slow.snapshot(),
+            'signal': self.signal.snapshot()
+        }
+
+    def restore(self, state: Dict) -> None:
+        self.fast.restore(state['fast'])
+        self.slow.restore(state['slow'])
+        self.signal.restore(state['signal'])
+
+
+class StreamingVWAP:
+    """Volume-weighted average of typical price, reset every session (UTC day)"""
+
+    def __init__(self, session_ms: int = 86_400_000):
+        """
+        Args:
+            session_ms: Session length in ms (sessions start at multiples of it)
+        """
+        self.session_ms = session_ms
+        self.session: Optional[int] = None
+        self.price_volume = 0.0
+        self.volume = 0.0
+        self.value = math.nan
+
+    def update(self, open_time: int, high: float, low: float, close: float,
+               volume: float, closed: bool = True) -> float:
+        """
+        Feed one candle
+
+        Args:
+            open_time: Candle open time (ms)
+            high: Candle high
+            low: Candle low
+            close: Candle close
+            volume: Candle volume
+            closed: Commit the candle (False evaluates an in-progress candle)
+
+        Returns:
+            Session VWAP including this candle (NaN while the session has no volume)
+        """
+        session = open_time - open_time % self.session_ms
+        if session != self.session:
+            price_volume, total_volume = 0.0, 0.0
+        else:
+            price_volume, total_volume = self.price_volume, self.volume
+
+        price_volume += (high + low + close) / 3 * volume
+        total_volume += volume
+        value = price_volume / total_volume if total_volume > 0 else math.nan
+
+        if closed:
+            self.session = session
+            self.price_volume = price_volume
+            self.volume = total_volume
+            self.value = value
+        return value
+
+    def snapshot(self) -> Dict:
+        return {
+            'session': self.session,
+            'price_volume': self.price_volume,
+            'volume': self.volume,
+            'value': self.value
+        }
+
+    def restore(self, state: Dict) -> None:
+        self.session = state['session']
+        self.price_volume = state['price_volume']
+        self.volume = state['volume']
+        self.value = state['value']
+
+
+class _RollingExtreme:
+    """Rolling max (or min) over a fixed window using a monotonic deque"""
+
+    def __init__(self, period: int, largest: bool = True):
+        self.period = period
+        self.largest = largest
+        self.count = 0
+        self.window = deque()  # (index, value), best value first
+
+    def _beats(self, a: float, b: float) -> bool:
+        return a >= b if self.largest else a <= b
+
+    def push(self, value: float) -> None:
+        while self.window and self._beats(value, self.window[-1][1]):
+            self.window.pop()
+        self.window.append((self.count, value))
+        self.count += 1
+        if self.window[0][0] <= self.count - 1 - self.period:
+            self.window.popleft()
+
+    def extreme_with(self, value: float) -> float:
+        """Extreme over the window if ``value`` were pushed, without pushing it"""
+        oldest = self.count + 1 - self.period  # first index still in that window
+        for index, kept in self.window:
+            if index >= oldest:
+                return kept if self._beats(kept, value) else value
+        return value
+
+    def snapshot(self) -> Dict:
+        return {'count': self.count, 'window': [list(item) for item in self.window]}
+
+    def restore(self, state: Dict) -> None:
+        self.count = state['count']
+        self.window = deque(tuple(item) for item in state['window'])
+
+
+def stochastic_k(close: float, highest: float, lowest: float) -> float:
+    """%K for one candle (50 when the range is flat)"""
+    if highest == lowest:
+        return 50.0
+    return 100 * (close - lowest) / (highest - lowest)
+
+
+class StreamingStochastic:
+    """Stochastic oscillator: %K over ``k_period`` candles, %D its ``d_period`` SMA"""
+
+    def __init__(self, k_period: int = 14, d_period: int = 3):
+        """
+        Args:
+            k_period: Lookback for the highest high / lowest low
+            d_period: Smoothing period of %D
+        """
+        self.k_period = k_period
+        self.seen = 0
+        self._highs = _RollingExtreme(k_period, largest=True)
+        self._lows = _RollingExtreme(k_period, largest=False)
+        self._k = _RollingMean(d_period)
+
+    def update(self, high: float, low: float, close: float,
+               closed: bool = True) -> Tuple[float, float]:
+        """
+        Feed one candle
+
+        Args:
+            high: Candle high
+            low: Candle low
+            close: Candle close
+            closed: Commit the candle (False evaluates an in-progress candle)
+
+        Returns:
+            Tuple of (%K, %D), NaN until enough candles are seen
+        """
+        if self.seen + 1 < self.k_period:
+            if closed:
+                self._highs.push(high)
+                self._lows.push(low)
+                self.seen += 1
+            return math.nan, math.nan
+
+        highest = self._highs.extreme_with(high)
+        lowest = self._lows.extreme_with(low)
+        k = stochastic_k(close, highest, lowest)
+
+        if closed:
+            self._highs.push(high)
+            self._lows.push(low)
+            self.seen += 1
+            self._k.push(k)
+            return k, self._k.mean
+        return k, self._k.mean_with(k)
+
+    def snapshot(self) -> Dict:
+        return {
+            'seen': self.seen,
+            'highs': self._highs.snapshot(),
+            'lows': self._lows.snapshot(),
+            'k': self._k.snapshot()
+        }
+
+    def restore(self, state: Dict) -> None:
+        self.seen = state['seen']
+        self._highs.restore(state['highs'])
+        self._lows.restore(state['lows'])
+        self._k.restore(state['k'])
+
+
+class StreamingOBV:
+    """On-balance volume, starting from 0 at the first candle"""
+
+    def __init__(self):
+        self.prev_close: Optional[float] = None
+        self.value = 0.0
+
+    def update(self, close: float, volume: float, closed: bool = True) -> float:
+        """
+        Feed one candle
+
+        Args:
+            close: Candle close
+            volume: Candle volume
+            closed: Commit the candle (False evaluates an in-progress candle)
+
+        Returns:
+            OBV including this candle
+        """
+        value = self.value
+        if self.prev_close is not None:
+            if close > self.prev_close:
+                value += volume
+            elif close < self.prev_close:
+                value -= volume
+
+        if closed:
+            self.prev_close = close
+            self.value = value
+        return value
+
+    def snapshot(self) -> Dict:
+        return {'prev_close': self.prev_close, 'value': self.value}
+
+    def restore(self, state: Dict) -> None:
+        self.prev_close = state['prev_close']
+        self.value = state['value']
+
+
+class StreamingIndicatorSet:
+    """The live indicator bundle for one symbol/timeframe"""
+
+    def __init__(self, config: Dict = TRADING_CONFIG):
+        """
+        Args:
+            config: Settings providing rsi_period, ema_fast, ema_slow,
+                atr_period, macd_fast/slow/signal and stoch_k/stoch_d
+        """
+        self.rsi = StreamingRSI(config['rsi_period'])
+        self.ema_fast = StreamingEMA(config['ema_fast'])
+        self.ema_slow = StreamingEMA(config['ema_slow'])
+        self.atr = StreamingATR(config['atr_period'])
+        self.macd = StreamingMACD(config['macd_fast'], config['macd_slow'], config['macd_signal'])
+        self.vwap = StreamingVWAP()
+        self.stochastic = StreamingStochastic(config['stoch_k'], config['stoch_d'])
+        self.obv = StreamingOBV()
+        self.last_open_time: Optional[int] = None  # Last committed candle
+
+    def update(self, open_time: int, high: float, low: float, close: float,
+               volume: float = 0.0, closed: bool = True) -> Dict[str, float]:
+        """
+        Feed one candle to every indicator
+
+        Args:
+            open_time: Candle open time (ms)
+            high: Candle high
+            low: Candle low
+            close: Candle close
+            volume: Candle volume
+            closed: Commit the candle (False evaluates an in-progress candle)
+
+        Returns:
+            Dictionary with rsi, ema_fast, ema_slow, atr, macd, macd_signal,
+            macd_hist, vwap, stoch_k, stoch_d and obv
+        """
+        macd, macd_signal, macd_hist = self.macd.update(close, closed)
+        stoch_k, stoch_d = self.stochastic.update(high, low, close, closed)
+        values = {
+            'rsi': self.rsi.update(close, closed),
+            'ema_fast': self.ema_fast.update(close, closed),
+            'ema_slow': self.ema_slow.update(close, closed),
+            'atr': self.atr.update(high, low, close, closed),
+            'macd': macd,
+            'macd_signal': macd_signal,
+            'macd_hist': macd_hist,
+            'vwap': self.vwap.update(int(open_time), high, low, close, volume, closed),
+            'stoch_k': stoch_k,
+            'stoch_d': stoch_d,
+            'obv': self.obv.update(close, volume, closed)
+        }
+        if closed:
+            self.last_open_time = int(open_time)
+        return values
+
+    def snapshot(self) -> Dict:
+        """JSON-serializable state of every indicator"""
+        return {
+            'last_open_time': self.last_open_time,
+            'rsi': self.rsi.snapshot(),
+            'ema_fast': self.ema_fast.snapshot(),
+            'ema_slow': self.ema_slow.snapshot(),
+            'atr': self.atr.snapshot(),
+            'macd': self.macd.snapshot(),
+            'vwap': self.vwap.snapshot(),
+            'stochastic': self.stochastic.snapshot(),
+            'obv': self.obv.snapshot()
+        }
+
+    def restore(self, state: Dict) -> None:
+        """Restore state produced by ``snapshot``"""
+        self.last_open_time = state['last_open_time']
+        self.rsi.restore(state['rsi'])
+        self.ema_fast.restore(state['ema_fast'])
+        self.ema_slow.restore(state['ema_slow'])
+        self.atr.restore(state['atr'])
+        self.macd.restore(state['macd'])
+        self.vwap.restore(state['vwap'])
+        self.stochastic.restore(state['stochastic'])
+        self.obv.restore(state['obv'])
@@ -21,11 +21,15 @@ from config.settings import (
     BINANCE_API_KEY, BINANCE_API_SECRET, BINANCE_TESTNET_URL,
     GEMINI_API_KEY, TRADING_CONFIG, LOG_LEVEL, LOG_FORMAT,
     FLASK_HOST, FLASK_PORT, FLASK_DEBUG, validate_api_keys,
-    AUTONOMOUS_MODE, ENABLE_BACKUP_APIS,
+    AUTONOMOUS_MODE, ENABLE_BACKUP_APIS, CANDLE_ALIGNED_SCHEDULING, REGIME_DETECTION_ENABLED,
     OPENAI_API_KEY, ANTHROPIC_API_KEY, TOGETHER_API_KEY
 )
 from binance.client import Client
 from market.data_fetcher import MarketDataFetcher
+from market.bus import MarketDataBus, TRIGGER_MONITOR
+from market.scheduler import CandleScheduler
+from indicators.regime import RegimeDetector
+from utils.weight_budget import RequestWeightBudget, BudgetedClient, PRIORITY_ORDER, PRIORITY_MARKET
 from ai.analyzer import GeminiAnalyzer
 from ai.autonomous_engine import FullyAutonomousTrader
 from trading.executor import TradeExecutor
@@ -57,6 +61,8 @@ CORS(app)
 # Global state
 bot_running = False
 market_fetcher = None
+market_bus = None  # Single producer of market snapshots for all loops
+weight_budget = None  # Exchange request weight shared by all REST traffic
 ai_analyzer = None
 trade_executor = None
 auto_engine = None
@@ -80,7 +86,7 @@ def initialize_services() -> bool:
     Returns:
         True if initialization successful, False otherwise
     """
-    global market_fetcher, ai_analyzer, trade_executor, auto_engine, autonomous_trader
+    global market_fetcher, market_bus, weight_budget, ai_analyzer, trade_executor, auto_engine, autonomous_trader
     
     try:
         # Validate API keys
@@ -97,24 +103,38 @@ def initialize_services() -> bool:
         binance_client = Client(BINANCE_API_KEY, BINANCE_API_SECRET, testnet=True)
         binance_client.API_URL = BINANCE_TESTNET_URL
         
+        # All REST traffic spends one weight budget; orders and exits go first
+        weight_budget = RequestWeightBudget()
+        order_client = BudgetedClient(binance_client, weight_budget, PRIORITY_ORDER)
+        market_client = BudgetedClient(binance_client, weight_budget, PRIORITY_MARKET)
+        
         # Test connection
-        account = binance_client.get_account()
+        account = order_client.get_account()
         logger.info(f"✅ Connected to Binance Testnet")
         
         # Initialize market data fetcher
-        market_fetcher = MarketDataFetcher(binance_client)
+        market_fetcher = MarketDataFetcher(market_client)
         logger.info("✅ Market data fetcher initialized")
         
+        # One producer computes each snapshot; every loop subscribes to it
+        scheduler = CandleScheduler(market_client) if CANDLE_ALIGNED_SCHEDULING else None
+        # Volatility regime sets the analysis cadence: monitor-only cycles when dead, intrabar when volatile
+        regime = RegimeDetector() if REGIME_DETECTION_ENABLED else None
+        market_bus = MarketDataBus(market_fetcher, scheduler=scheduler, regime=regime)
+        # Trade bursts publish an intrabar snapshot instead of waiting for the close
+        market_fetcher.add_burst_listener(lambda burst: market_bus.trigger('trade_burst'))
+        logger.info("✅ Market data bus initialized")
+        
         # Initialize AI analyzer
         ai_analyzer = GeminiAnalyzer(GEMINI_API_KEY)
         logger.info("✅ Gemini AI analyzer initialized")
         
         # Initialize trade executor
-        trade_executor = TradeExecutor(binance_client)
+        trade_executor = TradeExecutor(order_client)
         logger.info("✅ Trade executor initialized")
         
         # Initialize auto-trading engine
-        auto_engine = AutoTradingEngine(market_fetcher, ai_analyzer, trade_executor)
+        auto_engine = AutoTradingEngine(market_fetcher, ai_analyzer, trade_executor, market_bus)
         trade_executor.auto_engine = auto_engine
         trade_executor.bot_running = False
         logger.info("✅ Auto-trading engine initialized")
@@ -122,7 +142,7 @@ def initialize_services() -> bool:
         # Initialize autonomous AI trader (if enabled)
         if AUTONOMOUS_MODE:
             logger.info("🤖 Initializing Autonomous AI Trader with backup services...")
-            autonomous_trader = FullyAutonomousTrader(market_fetcher, trade_executor)
+            autonomous_trader = FullyAutonomousTrader(market_fetcher, trade_executor, market_bus)
             
             # Configure backup AI services if enabled
             if ENABLE_BACKUP_APIS:
@@ -206,35 +226,39 @@ def trading_bot_loop() -> None:
     else:
         # Manual trading mode
         logger.info("🎮 Starting Manual Trading Mode...")
+        subscription = market_bus.subscribe('manual_loop')
         while bot_running:
             try:
-                # Get market data
-                market_data = market_fetcher.get_market_data()
+                # Get market data from the shared bus
+                market_data = subscription.get(timeout=TRADING_CONFIG['check_interval'] * 2)
                 
                 if market_data:
                     logger.info(
-                        f"📊 Price: ${market_data['price']:.2f} | "
-                        f"RSI: {market_data['rsi']:.1f} | "
-                        f"Trend: {market_data['trend']}"
+                        f"📊 Price: ${market_data.price:.2f} | "
+                        f"RSI: {market_data.rsi:.1f} | "
+                        f"Trend: {market_data.trend}"
                     )
                     
                     # Check exit conditions first
                     trade_executor.check_exit_conditions()
                     
+                    # Dead market cadence: exits only, no analysis this cycle
+                    if market_data.trigger == TRIGGER_MONITOR:
+                        continue
+                    
                     # Get AI analysis
                     ai_decision = ai_analyzer.analyze_market(market_data)
                     
-                    # Execute trade if conditions met
-                    if ai_decision['action'] != 'HOLD':
+                    # Execute trade if conditions met (never twice on one cached decision)
+                    if ai_decision['action'] != 'HOLD' and not ai_decision.get('cached'):
                         result = trade_executor.execute_trade(ai_decision, market_data)
                         logger.info(f"Trade execution result: {result['status']}")
                 
-                # Wait before next check
-                time.sleep(TRADING_CONFIG['check_interval'])
-                
             except Exception as e:
                 logger.error(f"Error in bot loop: {e}")
                 time.sleep(60)
+        
+        market_bus.unsubscribe(subscription)
     
     logger.info("🛑 AI Trading Bot Stopped!")
 
@@ -278,6 +302,9 @@ def main() -> None:
         logger.error("Failed to initialize services. Exiting.")
         return
     
+    # Start the market data producer before any consumer subscribes
+    market_bus.start()
+    
     # Start auto-trading background thread (but don't start auto-trading yet)
     auto_thread = Thread(target=auto_engine.monitor_market, daemon=True)
     auto_thread.start()
@@ -330,9 +357,27 @@ def main() -> None:
             'avg_profit': stats.get('avg_profit', 0),
             'avg_loss': stats.get('avg_loss', 0),
             'positions': list(trade_executor.active_positions.values()),
-            'recent_trades': trade_executor.trade_history[-10:]
+            'recent_trades': trade_executor.trade_history[-10:],
+            'request_weight': weight_budget.get_stats() if weight_budget else None,
+            'decision_cache': (
+                ai_analyzer.decision_cache.get_stats()
+                if ai_analyzer and ai_analyzer.decision_cache else None
+            ),
+            'prefilter': (
+                ai_analyzer.prefilter.get_stats()
+                if ai_analyzer and ai_analyzer.prefilter else None
+            )
         })
     
+    @app.route('/api/market-data')
+    def get_market_data_snapshot():
+        """Latest published market snapshot with indicators (JSON-safe, no candle arrays)"""
+        snapshot = market_bus.latest if market_bus else None
+        if not snapshot:
+            return jsonify({})
+        
+        return jsonify(snapshot.to_dict(json_safe=True))
+    
     @app.route('/api/trade-history')
     def get_trade_history():
         """Get trade history for chart markers"""
@@ -437,9 +482,9 @@ def main() -> None:
         try:
             logger.info("🧪 Starting test trade...")
             
-            # Get current market data
-            market_data = market_fetcher.get_market_data()
-            buy_price = market_data['price']
+            # Get current market data (reuse the latest bus snapshot)
+            market_data = market_bus.latest or market_fetcher.get_market_data()
+            buy_price = market_data.price
             
             logger.info(f"📊 Current Price: ${buy_price:.2f}")
             
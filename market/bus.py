@@ -0,0 +1,366 @@
+"""
+Market Data Bus Module
+Single producer that fetches each market snapshot once and fans it out
+to every trading loop
+"""
+
+import logging
+import queue
+import time
+from threading import Thread, Event, Lock
+from typing import Dict, List, Optional
+
+from market.resampler import timeframe_to_ms
+from market.snapshot import MarketSnapshot
+from config.settings import TRADING_CONFIG, REGIME_CADENCE
+
+logger = logging.getLogger(__name__)
+
+# Backpressure policies for a full subscriber queue
+POLICY_LATEST = 'latest'      # Drop the oldest queued snapshot, keep the new one
+POLICY_DROP_NEW = 'drop_new'  # Keep what is queued, drop the new snapshot
+POLICY_BLOCK = 'block'        # Wait up to block_timeout for the consumer, then drop
+POLICIES = (POLICY_LATEST, POLICY_DROP_NEW, POLICY_BLOCK)
+
+# Trigger of a snapshot published between analyses of a slow (dead market)
+# cadence: consumers keep monitoring open positions but skip analysis
+TRIGGER_MONITOR = 'monitor'
+
+
+class Subscription:
+    """One consumer's queue of market snapshots"""
+
+    def __init__(self, name: str, maxsize: int = 1, policy: str = POLICY_LATEST,
+                 block_timeout: float = 1.0):
+        """
+        Initialize subscription
+
+        Args:
+            name: Consumer name (for logs and stats)
+            maxsize: Snapshots buffered before the policy applies
+            policy: One of POLICIES
+            block_timeout: Seconds the producer waits under POLICY_BLOCK
+        """
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown backpressure policy: {policy}")
+
+        self.name = name
+        self.policy = policy
+        self.block_timeout = block_timeout
+        self.delivered = 0
+        self.dropped = 0
+        self._queue = queue.Queue(maxsize=max(1, maxsize))
+
+    def offer(self, snapshot: MarketSnapshot) -> bool:
+        """
+        Enqueue a snapshot according to the backpressure policy (producer side)
+
+        Returns:
+            True if the snapshot was queued
+        """
+        try:
+            if self.policy == POLICY_BLOCK:
+                self._queue.put(snapshot, timeout=self.block_timeout)
+            else:
+                self._queue.put_nowait(snapshot)
+        except queue.Full:
+            if self.policy != POLICY_LATEST:
+                self.dropped += 1
+                return False
+
+            try:
+                self._queue.get_nowait()
+                self.dropped += 1
+            except queue.Empty:
+                pass
+            try:
+                self._queue.put_nowait(snapshot)
+            except queue.Full:
+                self.dropped += 1
+                return False
+
+        self.delivered += 1
+        return True
+
+    def get(self, timeout: Optional[float] = None) -> Optional[MarketSnapshot]:
+        """
+        Wait for the next snapshot
+
+        Args:
+            timeout: Seconds to wait (None waits forever)
+
+        Returns:
+            MarketSnapshot, or None on timeout
+        """
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def get_latest(self) -> Optional[MarketSnapshot]:
+        """Drain the queue and return only the newest snapshot (None if empty)"""
+        snapshot = None
+        while True:
+            try:
+                snapshot = self._queue.get_nowait()
+            except queue.Empty:
+                return snapshot
+
+    def pending(self) -> int:
+        """Snapshots waiting to be consumed"""
+        return self._queue.qsize()
+
+
+class MarketDataBus:
+    """Publishes one market snapshot per interval to all subscribers"""
+
+    def __init__(self, market_fetcher, interval: Optional[float] = None, scheduler=None,
+                 regime=None, cadence: Optional[Dict[str, Optional[float]]] = None):
+        """
+        Initialize bus
+
+        Args:
+            market_fetcher: MarketDataFetcher used by the producer thread
+            interval: Seconds between snapshots (default: check_interval)
+            scheduler: Optional CandleScheduler; when set, snapshots are
+                produced at candle closes instead of every ``interval``
+            regime: Optional RegimeDetector fed every snapshot; its regime
+                sets how often snapshots are analysed
+            cadence: Regime -> seconds between analysed snapshots (default
+                REGIME_CADENCE; None keeps the normal cadence). Slower than
+                normal publishes the cycles in between as TRIGGER_MONITOR,
+                faster adds intrabar snapshots.
+        """
+        self.market_fetcher = market_fetcher
+        self.interval = interval or TRADING_CONFIG['check_interval']
+        self.scheduler = scheduler
+        self.regime = regime
+        self.cadence = cadence or REGIME_CADENCE
+
+        # Normal cadence: one candle, or one interval
+        self.base_period = (
+            timeframe_to_ms(scheduler.timeframe) / 1000 if scheduler else self.interval
+        )
+        self.skipped_cycles = 0  # Cycles published as TRIGGER_MONITOR
+        self._last_analysis_time = 0.0
+
+        self.latest: Optional[MarketSnapshot] = None
+        self.snapshots_published = 0
+        self.fetch_failures = 0
+        self.triggered_publishes = 0
+
+        self._subscriptions: List[Subscription] = []
+        self._lock = Lock()
+        self._stop_event = Event()
+        self._wake_event = Event()  # Set by stop() and trigger()
+        self._trigger_reason: Optional[str] = None
+        self._thread: Optional[Thread] = None
+
+    def subscribe(self, name: str, maxsize: int = 1, policy: str = POLICY_LATEST,
+                  block_timeout: float = 1.0) -> Subscription:
+        """
+        Register a consumer
+
+        Args:
+            name: Consumer name
+            maxsize: Queue size (1 gives latest-only semantics)
+            policy: Backpressure policy when the queue is full
+            block_timeout: Seconds the producer waits under POLICY_BLOCK
+
+        Returns:
+            Subscription to read snapshots from
+        """
+        subscription = Subscription(name, maxsize, policy, block_timeout)
+        with self._lock:
+            self._subscriptions.append(subscription)
+        logger.info(f"📬 {name} subscribed to market data bus ({policy}, maxsize={maxsize})")
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Remove a consumer"""
+        with self._lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+
+    def publish(self, snapshot: MarketSnapshot) -> None:
+        """Deliver a snapshot to every subscriber"""
+        self.latest = snapshot
+        self.snapshots_published += 1
+
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+
+        for subscription in subscriptions:
+            if not subscription.offer(snapshot):
+                logger.debug(f"Market snapshot dropped for slow consumer {subscription.name}")
+
+    def trigger(self, reason: str = 'manual') -> None:
+        """
+        Publish a snapshot now instead of waiting for the next interval or
+        candle close (e.g. on a burst of trading activity)
+
+        Args:
+            reason: Set as the snapshot's ``trigger``
+        """
+        self._trigger_reason = reason
+        self._wake_event.set()
+
+    def _take_trigger(self) -> Optional[str]:
+        if not self._wake_event.is_set() or self._stop_event.is_set():
+            return None
+        self._wake_event.clear()
+        return self._trigger_reason
+
+    def start(self) -> None:
+        """Start the producer thread"""
+        if self._thread and self._thread.is_alive():
+            logger.warning("Market data bus already running")
+            return
+
+        self._stop_event.clear()
+        self._wake_event.clear()
+        self._thread = Thread(target=self._produce, daemon=True)
+        self._thread.start()
+        if self.scheduler:
+            logger.info(f"📡 Market data bus started (on {self.scheduler.timeframe} candle close)")
+        else:
+            logger.info(f"📡 Market data bus started (every {self.interval}s)")
+
+    def stop(self) -> None:
+        """Stop the producer thread"""
+        self._stop_event.set()
+        self._wake_event.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+        logger.info("📡 Market data bus stopped")
+
+    def is_running(self) -> bool:
+        return bool(self._thread and self._thread.is_alive())
+
+    def _produce(self) -> None:
+        if self.scheduler:
+            self._produce_on_candle_close()
+            return
+
+        reason = 'interval'
+        while not self._stop_event.is_set():
+            started = time.time()
+            self._publish_now(reason, scheduled=reason == 'interval')
+
+            period = min(self.base_period, self._regime_cadence() or self.base_period)
+            self._wake_event.wait(max(0.0, period - (time.time() - started)))
+            reason = self._take_trigger() or 'interval'
+
+    def _regime_cadence(self) -> Optional[float]:
+        """Seconds between snapshots in the current regime (None = normal cadence)"""
+        if not self.regime:
+            return None
+        return self.cadence.get(self.regime.regime)
+
+    def _update_regime(self, snapshot: MarketSnapshot) -> Optional[str]:
+        if not self.regime or snapshot.candles is None:
+            return None
+        return self.regime.ingest(snapshot.candles)
+
+    def _is_due(self) -> bool:
+        """False while a slow (dead market) cadence says to skip analysing this cycle"""
+        cadence = self._regime_cadence()
+        if not cadence or cadence <= self.base_period:
+            return True
+        # Half a period of slack so scheduling jitter cannot skip an extra cycle
+        return time.time() - self._last_analysis_time >= cadence - self.base_period / 2
+
+    def _publish_regime_aware(self, snapshot: MarketSnapshot, reason: str, scheduled: bool) -> bool:
+        """
+        Tag and publish a snapshot
+
+        Every snapshot is published so consumers can keep checking exits on
+        open positions; cycles the regime cadence skips are tagged
+        TRIGGER_MONITOR instead of ``reason``.
+
+        Returns:
+            True if published for analysis (False for a monitor-only cycle)
+        """
+        regime = self._update_regime(snapshot)
+        if scheduled and not self._is_due():
+            self.skipped_cycles += 1
+            logger.debug(f"Monitor-only {reason} snapshot ({regime} market)")
+            self.publish(snapshot.replace(trigger=TRIGGER_MONITOR, regime=regime))
+            return False
+
+        self.publish(snapshot.replace(trigger=reason, regime=regime))
+        self._last_analysis_time = time.time()
+        if not scheduled:
+            self.triggered_publishes += 1
+        return True
+
+    def _publish_now(self, reason: str, scheduled: bool = False) -> None:
+        """Fetch one snapshot and publish it, tagged with what triggered it"""
+        try:
+            snapshot = self.market_fetcher.get_market_data()
+            if snapshot:
+                self._publish_regime_aware(snapshot, reason, scheduled)
+            else:
+                self.fetch_failures += 1
+        except Exception as e:
+            self.fetch_failures += 1
+            logger.error(f"Market data bus producer error: {e}")
+
+    def _produce_on_candle_close(self) -> None:
+        """Publish once per candle, as soon as the closed bar is available"""
+        while not self._stop_event.is_set():
+            # A fast (high volatility) cadence also wakes up inside the candle
+            cadence = self._regime_cadence()
+            max_wait = cadence if cadence and cadence < self.base_period else None
+
+            boundary = self.scheduler.wait_for_next_close(self._wake_event, max_wait=max_wait)
+            if boundary is None:
+                # Woken early: stopped, an intrabar trigger, or the regime timer
+                if self._stop_event.is_set():
+                    return
+                self._publish_now(self._take_trigger() or 'volatility')
+                continue
+
+            # Each attempt is a full fetch (REST weight when not streaming), so
+            # only a few, spaced out, before publishing what we have
+            snapshot = None
+            try:
+                for attempt in range(self.scheduler.fresh_attempts):
+                    if attempt and self._stop_event.wait(self.scheduler.fresh_poll):
+                        return
+                    snapshot = self.market_fetcher.get_market_data()
+                    if self.scheduler.is_fresh(snapshot, boundary):
+                        break
+            except Exception as e:
+                logger.error(f"Market data bus producer error: {e}")
+
+            if snapshot:
+                self._publish_regime_aware(snapshot, 'candle_close', scheduled=True)
+                self.scheduler.record_publish(boundary)
+            else:
+                self.fetch_failures += 1
+
+    def get_status(self) -> Dict:
+        """Producer and per-subscriber statistics"""
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+
+        return {
+            'running': self.is_running(),
+            'interval': self.interval,
+            'scheduler': self.scheduler.get_stats() if self.scheduler else None,
+            'snapshots_published': self.snapshots_published,
+            'fetch_failures': self.fetch_failures,
+            'triggered_publishes': self.triggered_publishes,
+            'skipped_cycles': self.skipped_cycles,
+            'regime': self.regime.get_state() if self.regime else None,
+            'subscribers': {
+                s.name: {
+                    'policy': s.policy,
+                    'delivered': s.delivered,
+                    'dropped': s.dropped,
+                    'pending': s.pending()
+                }
+                for s in subscriptions
+            }
+        }
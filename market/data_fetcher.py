@@ -4,12 +4,30 @@ Handles fetching and processing real-time market data from Binance
 """
 
 import logging
-from typing import Dict, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock, Thread
+from typing import Callable, Dict, List, Optional, Tuple
+import numpy as np
 from binance.client import Client
-from indicators import (
-    calculate_rsi, calculate_ema, calculate_atr, detect_trend
+from requests.adapters import HTTPAdapter
+from indicators import detect_trend
+from indicators.graph import IndicatorGraph, shared_graph
+from indicators.matrix import WatchlistMatrix
+from indicators.streaming import StreamingIndicatorSet
+from market.kline_store import KlineStore
+from market.ohlcv_buffer import OHLCVBuffer
+from market.order_book import LocalOrderBook
+from market.resampler import resample_into, timeframe_to_ms
+from market.snapshot import MarketSnapshot
+from market.stream import BinanceMarketStream
+from market.trade_aggregator import TradeAggregator
+from config.settings import (
+    TRADING_CONFIG, MARKET_DATA_STREAMING, BINANCE_STREAM_URL,
+    KLINE_HISTORY_LIMIT, STREAM_STALE_AFTER, WATCHLIST, WATCHLIST_MAX_WORKERS,
+    MULTI_TIMEFRAMES, KLINE_STORE_ENABLED, ORDER_BOOK_ENABLED, ORDER_BOOK_SNAPSHOT_LIMIT,
+    ORDER_BOOK_REST_LIMIT, TRADE_STREAM_ENABLED
 )
-from config.settings import TRADING_CONFIG
 
 logger = logging.getLogger(__name__)
 
@@ -17,76 +35,446 @@ logger = logging.getLogger(__name__)
 class MarketDataFetcher:
     """Handles market data fetching and technical analysis"""
     
-    def __init__(self, binance_client: Client):
+    def __init__(self, binance_client: Client, streaming: bool = MARKET_DATA_STREAMING,
+                 stream_url: str = BINANCE_STREAM_URL, symbols: Optional[List[str]] = None,
+                 store: Optional[KlineStore] = None, graph: Optional[IndicatorGraph] = None,
+                 order_book: bool = ORDER_BOOK_ENABLED, trade_flow: bool = TRADE_STREAM_ENABLED):
         """
         Initialize market data fetcher
         
         Args:
             binance_client: Binance API client instance
+            streaming: Keep candles in memory from a WebSocket stream
+            stream_url: Combined stream endpoint used in streaming mode
+            symbols: Watchlist served by this fetcher (defaults to WATCHLIST,
+                or just the trading symbol)
+            store: On-disk kline cache (defaults to the shared store under
+                data/ when KLINE_STORE_ENABLED)
+            graph: Per-bar indicator cache (defaults to the process-wide graph)
+            order_book: Add spread / imbalance / microprice from a local
+                order book (diff-depth stream, or a depth snapshot per cycle)
+            trade_flow: Subscribe to aggTrade in streaming mode for volume
+                delta, trade rate and activity bursts
         """
         self.client = binance_client
         self.symbol = TRADING_CONFIG['symbol']
         self.timeframe = TRADING_CONFIG['timeframe']
+        self.history_limit = KLINE_HISTORY_LIMIT
+        self.symbols = list(symbols or WATCHLIST or [self.symbol])
+        self.store = store if store is not None else (KlineStore() if KLINE_STORE_ENABLED else None)
+        self.graph = graph or shared_graph
+        
+        # Watchlist requests share one pooled HTTP session
+        self.max_workers = max(1, min(len(self.symbols), WATCHLIST_MAX_WORKERS))
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._last_update: Dict[str, float] = {}
+        self._matrix: Optional[WatchlistMatrix] = None
+        self._configure_session_pool()
+        
+        # In-memory candles per (symbol, timeframe) and best bid/ask
+        self.buffers: Dict[Tuple[str, str], OHLCVBuffer] = {}
+        self.buffer = self.get_buffer(self.symbol, self.timeframe)
+        self._indicator_sets: Dict[Tuple[str, str], StreamingIndicatorSet] = {}
+        
+        # Completeness per series, and holes the exchange confirmed it has no data for
+        self.complete: Dict[Tuple[str, str], bool] = {}
+        self._known_gaps: Dict[Tuple[str, str], set] = {}
+        self._book_ticker: Optional[Dict] = None
+        self._lock = Lock()
+        
+        # Local order books, synced from a snapshot plus the diff-depth stream
+        self.order_book_enabled = order_book
+        self.order_books: Dict[str, LocalOrderBook] = {}
+        self._book_syncing = False
+        
+        # Trade flow (streaming only) and callbacks fired on activity bursts
+        self.trade_flow_enabled = trade_flow
+        self.trade_aggregators: Dict[str, TradeAggregator] = {}
+        self._burst_listeners: List[Callable[[Dict], None]] = []
+        
+        self.stream = None
+        if streaming:
+            self.start_stream(stream_url)
     
-    def get_market_data(self) -> Optional[Dict]:
+    def start_stream(self, url: str = BINANCE_STREAM_URL) -> None:
+        """
+        Warm up candle history over REST, then keep it current from the stream
+        
+        Args:
+            url: Combined stream endpoint
+        """
+        if self.stream:
+            logger.warning("Market stream already started")
+            return
+        
+        try:
+            self._fetch_klines()
+            logger.info(f"✅ Warmed up {len(self.buffer)} candles over REST")
+        except Exception as e:
+            logger.warning(f"REST warm-up failed, stream will fill history: {e}")
+        
+        on_trade = None
+        if self.trade_flow_enabled:
+            aggregator = TradeAggregator(
+                self.symbol, interval_ms=timeframe_to_ms(self.timeframe),
+                on_burst=self._on_trade_burst
+            )
+            self.trade_aggregators[self.symbol] = aggregator
+            on_trade = aggregator.add_trade
+        
+        self.stream = BinanceMarketStream(
+            self.symbol,
+            self.timeframe,
+            on_kline=self._apply_kline,
+            on_book_ticker=self._apply_book_ticker,
+            on_depth=self._apply_depth if self.order_book_enabled else None,
+            on_trade=on_trade,
+            url=url
+        )
+        self.stream.start()
+    
+    def stop_stream(self) -> None:
+        """Stop the market stream (REST polling resumes)"""
+        if self.stream:
+            self.stream.stop()
+            self.stream = None
+    
+    def is_streaming(self) -> bool:
+        """True when the stream is connected, fresh and has full history"""
+        return (
+            self.stream is not None and
+            self.stream.is_connected and
+            self.stream.seconds_since_last_message() < STREAM_STALE_AFTER and
+            len(self.buffer) >= self.history_limit
+        )
+    
+    def get_buffer(self, symbol: str, timeframe: str) -> OHLCVBuffer:
+        """
+        Get (or create) the candle buffer for a symbol/timeframe
+        
+        Args:
+            symbol: Trading pair
+            timeframe: Kline interval
+        
+        Returns:
+            Ring buffer holding up to ``history_limit`` candles
+        """
+        key = (symbol, timeframe)
+        buffer = self.buffers.get(key)
+        if buffer is None:
+            # setdefault keeps concurrent watchlist workers on one buffer
+            buffer = self.buffers.setdefault(key, OHLCVBuffer(self.history_limit))
+        return buffer
+    
+    def get_market_data(self, symbol: Optional[str] = None) -> Optional[MarketSnapshot]:
         """
         Fetch real-time market data and calculate technical indicators
         
+        In streaming mode this is a memory read for the trading symbol; REST
+        is used as fallback whenever the stream is down or stale, and for
+        other watchlist symbols.
+        
+        Args:
+            symbol: Trading pair (defaults to the configured trading symbol)
+        
         Returns:
-            Dictionary with market data and indicators, or None on error
+            Immutable snapshot with market data and indicators, or None on error
         """
+        symbol = symbol or self.symbol
+        
         try:
-            # Get klines (candlestick data)
-            klines = self.client.get_klines(
-                symbol=self.symbol,
-                interval=self.timeframe,
-                limit=100
-            )
-            
-            # Extract OHLCV data
-            closes = [float(k[4]) for k in klines]
-            highs = [float(k[2]) for k in klines]
-            lows = [float(k[3]) for k in klines]
-            volumes = [float(k[5]) for k in klines]
-            
-            current_price = closes[-1]
+            if symbol == self.symbol and self.is_streaming():
+                book_ticker = self._book_ticker
+                book = self.order_books.get(symbol)
+                aggregator = self.trade_aggregators.get(symbol)
+                trade_flow = aggregator.get_features() if aggregator else None
+                self._last_update[symbol] = self.stream.last_message_time
+            else:
+                # Refresh candles (candlestick data) over REST
+                self._fetch_klines(symbol)
+                book_ticker = None
+                book = self._fetch_order_book(symbol)
+                trade_flow = None
             
-            # Calculate technical indicators
-            rsi = calculate_rsi(closes, TRADING_CONFIG['rsi_period'])
-            ema_fast = calculate_ema(closes, TRADING_CONFIG['ema_fast'])
-            ema_slow = calculate_ema(closes, TRADING_CONFIG['ema_slow'])
-            atr = calculate_atr(highs, lows, closes, TRADING_CONFIG['atr_period'])
+            # Never compute indicators over a window with missing candles
+            if not self._ensure_complete(symbol, self.timeframe):
+                logger.warning(f"⚠️ {symbol} {self.timeframe} series has missing candles, skipping cycle")
+                return None
             
-            # Calculate volume metrics
-            avg_volume = sum(volumes[-20:]) / 20
-            current_volume = volumes[-1]
-            volume_ratio = current_volume / avg_volume if avg_volume > 0 else 1.0
+            buffer = self.get_buffer(symbol, self.timeframe)
+            with self._lock:
+                return self._build_market_data(
+                    symbol, self.timeframe, buffer, book_ticker, book, trade_flow
+                )
             
-            # Determine trend
-            trend = detect_trend(ema_fast, ema_slow)
+        except Exception as e:
+            logger.error(f"Error fetching market data: {e}")
+            return None
+    
+    def get_multi_timeframe_data(self, symbol: Optional[str] = None,
+                                 timeframes: Optional[List[str]] = None) -> Optional[Dict]:
+        """
+        Market data for several timeframes, resampled from the base series
+        
+        Higher timeframes are backfilled over REST once, then built locally
+        from the in-memory base candles, so each call costs one base refresh
+        (none while streaming) plus a few array reductions.
+        
+        Args:
+            symbol: Trading pair (defaults to the configured trading symbol)
+            timeframes: Timeframes to include (defaults to MULTI_TIMEFRAMES)
+        
+        Returns:
+            ``market_data_multi`` dictionary of timeframe -> MarketSnapshot,
+            as expected by ``AdvancedMultiTimeframeAI``, or None on error
+        """
+        symbol = symbol or self.symbol
+        timeframes = timeframes or MULTI_TIMEFRAMES
+        
+        base_data = self.get_market_data(symbol)
+        if not base_data:
+            return None
+        
+        market_data_multi = {self.timeframe: base_data}
+        
+        try:
+            base = self.get_buffer(symbol, self.timeframe)
+            base_ms = timeframe_to_ms(self.timeframe)
             
-            market_data = {
-                'price': current_price,
-                'rsi': rsi,
-                'ema_fast': ema_fast,
-                'ema_slow': ema_slow,
-                'atr': atr,
-                'volume': current_volume,
-                'avg_volume': avg_volume,
-                'volume_ratio': volume_ratio,
-                'trend': trend,
-                'timestamp': self._get_timestamp(),
-                'klines': klines  # Keep raw data for advanced analysis
-            }
+            for timeframe in timeframes:
+                if timeframe == self.timeframe:
+                    continue
+                
+                interval_ms = timeframe_to_ms(timeframe)
+                if interval_ms % base_ms:
+                    raise ValueError(f"{timeframe} is not a multiple of {self.timeframe}")
+                
+                target = self.get_buffer(symbol, timeframe)
+                with self._lock:
+                    resampled = resample_into(base.window(), target, interval_ms)
+                
+                if not resampled:
+                    # First use, or the base series moved past the last bucket
+                    self._fetch_klines(symbol, timeframe)
+                    with self._lock:
+                        resample_into(base.window(), target, interval_ms)
+                
+                if not self._ensure_complete(symbol, timeframe):
+                    logger.warning(f"⚠️ {symbol} {timeframe} series has missing candles, skipping cycle")
+                    return None
+                
+                with self._lock:
+                    market_data_multi[timeframe] = self._build_market_data(symbol, timeframe, target)
             
-            return market_data
+            return market_data_multi
             
         except Exception as e:
-            logger.error(f"Error fetching market data: {e}")
+            logger.error(f"Error building multi-timeframe data: {e}")
             return None
     
+    def _build_market_data(self, symbol: str, timeframe: str, buffer: OHLCVBuffer,
+                           book_ticker: Optional[Dict] = None,
+                           book: Optional[LocalOrderBook] = None,
+                           trade_flow: Optional[Dict] = None) -> MarketSnapshot:
+        """
+        Compute indicators and assemble the market snapshot
+        
+        Must be called with ``self._lock`` held.
+        
+        Args:
+            symbol: Trading pair
+            timeframe: Kline interval of ``buffer``
+            buffer: Candle buffer to read
+            book_ticker: Latest best bid/ask, if streaming
+            book: Order book for spread / imbalance / microprice, if any
+            trade_flow: Trade aggregator features, if streaming trades
+        
+        Returns:
+            Market snapshot
+        """
+        # Zero-copy OHLCV views - indicators read straight from the buffer
+        candles = buffer.window()
+        volumes = candles['volume']
+        
+        current_price = float(candles['close'][-1])
+        
+        # Advance streaming indicators by the newly closed candles only,
+        # once per bar revision however many callers build this snapshot
+        indicators = self.graph.memo(
+            symbol, timeframe, candles, 'streaming',
+            lambda: self._update_indicators((symbol, timeframe), candles)
+        )
+        rsi = indicators['rsi']
+        ema_fast = indicators['ema_fast']
+        ema_slow = indicators['ema_slow']
+        atr = indicators['atr']
+        macd = indicators['macd']
+        vwap = indicators['vwap']
+        stoch_k = indicators['stoch_k']
+        bb_upper, bb_middle, bb_lower = self.graph.latest(
+            symbol, timeframe, candles, 'bollinger',
+            period=TRADING_CONFIG['bb_period'], std_dev=TRADING_CONFIG['bb_std_dev']
+        )
+        
+        # Calculate volume metrics
+        avg_volume = float(volumes[-20:].sum()) / 20
+        current_volume = float(volumes[-1])
+        volume_ratio = current_volume / avg_volume if avg_volume > 0 else 1.0
+        
+        # Determine trend
+        trend = detect_trend(ema_fast, ema_slow)
+        
+        # Microstructure: the synced order book, else the streamed best bid/ask
+        microstructure = book.get_features() if book and book.synced else {}
+        if not microstructure and book_ticker:
+            bid, ask = book_ticker['bid'], book_ticker['ask']
+            microstructure = {
+                'bid': bid,
+                'ask': ask,
+                'spread': ask - bid,
+                'spread_bps': (ask - bid) / ((ask + bid) / 2) * 10_000,
+            }
+        
+        return MarketSnapshot(
+            symbol=symbol,
+            timeframe=timeframe,
+            price=current_price,
+            rsi=rsi,
+            ema_fast=ema_fast,
+            ema_slow=ema_slow,
+            atr=atr,
+            macd=macd,
+            macd_signal=indicators['macd_signal'],
+            macd_hist=indicators['macd_hist'],
+            vwap=vwap,
+            stoch_k=stoch_k,
+            stoch_d=indicators['stoch_d'],
+            obv=indicators['obv'],
+            sma=bb_middle,
+            bb_upper=bb_upper,
+            bb_middle=bb_middle,
+            bb_lower=bb_lower,
+            volume=current_volume,
+            avg_volume=avg_volume,
+            volume_ratio=volume_ratio,
+            trend=trend,
+            complete=self.complete.get((symbol, timeframe), False),
+            bid=microstructure.get('bid'),
+            ask=microstructure.get('ask'),
+            spread=microstructure.get('spread'),
+            spread_bps=microstructure.get('spread_bps'),
+            book_imbalance=microstructure.get('book_imbalance'),
+            microprice=microstructure.get('microprice'),
+            cvd=trade_flow['cvd'] if trade_flow else None,
+            candle_delta=trade_flow['candle_delta'] if trade_flow else None,
+            buy_ratio=trade_flow['buy_ratio'] if trade_flow else None,
+            trade_rate=trade_flow['trade_rate'] if trade_flow else None,
+            activity_ratio=trade_flow['activity_ratio'] if trade_flow else None,
+            timestamp=self._get_timestamp(),
+            candles=buffer.frozen_window()  # Copy: subscribers read it on other threads
+        )
+    
+    def get_watchlist_snapshot(self) -> Dict:
+        """
+        Fetch every watchlist symbol concurrently
+        
+        Returns:
+            Dictionary with 'timestamp', per-symbol 'markets' (None on error),
+            per-symbol 'staleness' in seconds since the last successful
+            refresh (None if never refreshed) and the list of 'failed' symbols
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix='watchlist'
+            )
+        
+        started = time.time()
+        results = dict(zip(
+            self.symbols,
+            self._executor.map(self.get_market_data, self.symbols)
+        ))
+        now = time.time()
+        
+        failed = [symbol for symbol, data in results.items() if data is None]
+        if failed:
+            logger.warning(f"Watchlist refresh failed for: {', '.join(failed)}")
+        
+        logger.debug(f"Watchlist of {len(self.symbols)} symbols refreshed in {now - started:.2f}s")
+        
+        return {
+            'timestamp': self._get_timestamp(),
+            'markets': results,
+            'staleness': {
+                symbol: (now - self._last_update[symbol]) if symbol in self._last_update else None
+                for symbol in self.symbols
+            },
+            'failed': failed
+        }
+    
+    def get_watchlist_features(self) -> np.ndarray:
+        """
+        Refresh every watchlist symbol concurrently, then compute RSI, EMAs,
+        ATR and volume ratio for all of them in one vectorized pass
+        
+        Cheaper than ``get_watchlist_snapshot`` for scanning: no per-symbol
+        market snapshots are built.
+        
+        Returns:
+            Structured array of ``indicators.matrix.FEATURE_DTYPE``, one
+            record per symbol in watchlist order; symbols that failed to
+            refresh or have missing candles get NaN indicators
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix='watchlist'
+            )
+        if self._matrix is None:
+            self._matrix = WatchlistMatrix(self.symbols, self.history_limit)
+        
+        started = time.time()
+        refreshed = dict(zip(
+            self.symbols,
+            self._executor.map(self._refresh_symbol, self.symbols)
+        ))
+        
+        with self._lock:
+            for symbol in self.symbols:
+                window = self.get_buffer(symbol, self.timeframe).window() if refreshed[symbol] else None
+                self._matrix.set_row(symbol, window)
+        features = self._matrix.features()
+        
+        failed = [symbol for symbol, ok in refreshed.items() if not ok]
+        if failed:
+            logger.warning(f"Watchlist refresh failed for: {', '.join(failed)}")
+        logger.debug(f"Watchlist features for {len(self.symbols)} symbols in {time.time() - started:.2f}s")
+        
+        return features
+    
+    def _refresh_symbol(self, symbol: str) -> bool:
+        """Bring one symbol's base series up to date (True if complete)"""
+        try:
+            if not (symbol == self.symbol and self.is_streaming()):
+                self._fetch_klines(symbol)
+            return self._ensure_complete(symbol, self.timeframe)
+        except Exception as e:
+            logger.error(f"Error refreshing {symbol}: {e}")
+            return False
+    
+    def close(self) -> None:
+        """Stop the stream and release watchlist worker threads"""
+        self.stop_stream()
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+    
     def get_current_price(self) -> Optional[float]:
         """Get current price of the symbol"""
+        if self.is_streaming():
+            with self._lock:
+                return float(self.buffer.closes[-1])
+        
         try:
             ticker = self.client.get_symbol_ticker(symbol=self.symbol)
             return float(ticker['price'])
@@ -94,6 +482,260 @@ class MarketDataFetcher:
             logger.error(f"Error fetching current price: {e}")
             return None
     
+    def _update_indicators(self, key: Tuple[str, str], candles: Dict[str, np.ndarray]) -> Dict[str, float]:
+        """
+        Commit closed candles the indicator state has not seen yet, then
+        evaluate the in-progress (last) candle without committing it
+        
+        State is rebuilt from the window when it no longer lines up with
+        the buffer (first call, REST reload after an outage, etc.).
+        
+        Args:
+            key: (symbol, timeframe)
+            candles: OHLCV window views, oldest first
+        
+        Returns:
+            Dictionary of indicator values (see ``StreamingIndicatorSet.update``)
+        """
+        times = candles['open_time']
+        highs = candles['high']
+        lows = candles['low']
+        closes = candles['close']
+        volumes = candles['volume']
+        last = len(times) - 1
+        
+        state = self._indicator_sets.get(key)
+        start = 0
+        if state is not None and state.last_open_time is not None:
+            index = int(np.searchsorted(times, state.last_open_time))
+            if index < last and times[index] == state.last_open_time:
+                start = index + 1
+            else:
+                state = None
+        
+        if state is None:
+            state = StreamingIndicatorSet()
+            self._indicator_sets[key] = state
+        
+        for i in range(start, last):
+            state.update(int(times[i]), float(highs[i]), float(lows[i]), float(closes[i]),
+                         float(volumes[i]))
+        
+        return state.update(
+            int(times[last]), float(highs[last]), float(lows[last]), float(closes[last]),
+            float(volumes[last]), closed=False
+        )
+    
+    def _configure_session_pool(self) -> None:
+        """Size the client's HTTP connection pool for concurrent watchlist requests"""
+        session = getattr(self.client, 'session', None)
+        if session is None:
+            return
+        
+        adapter = HTTPAdapter(pool_connections=self.max_workers, pool_maxsize=self.max_workers)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+    
+    def _fetch_klines(self, symbol: Optional[str] = None, timeframe: Optional[str] = None) -> List[List]:
+        """
+        Bring a buffer up to date over REST, downloading only what is missing
+        
+        An empty buffer is first warm-started from the on-disk store. When
+        the buffer's last candle is recent, only candles from that candle
+        onward are requested; otherwise the latest window is reloaded.
+        """
+        symbol = symbol or self.symbol
+        timeframe = timeframe or self.timeframe
+        buffer = self.get_buffer(symbol, timeframe)
+        interval_ms = timeframe_to_ms(timeframe)
+        now_ms = int(time.time() * 1000)
+        
+        if not len(buffer):
+            self._warm_start(symbol, timeframe, buffer, now_ms)
+        
+        if len(buffer) and buffer.last_open_time > now_ms - self.history_limit * interval_ms:
+            # Gap fill: the last (possibly in-progress) candle plus anything newer
+            klines = self.client.get_klines(
+                symbol=symbol,
+                interval=timeframe,
+                startTime=buffer.last_open_time,
+                limit=self.history_limit
+            )
+            with self._lock:
+                for row in klines:
+                    buffer.update(row)
+        else:
+            klines = self.client.get_klines(
+                symbol=symbol,
+                interval=timeframe,
+                limit=self.history_limit
+            )
+            with self._lock:
+                buffer.load(klines)
+        
+        if timeframe == self.timeframe:
+            self._last_update[symbol] = time.time()
+        
+        # Every row but the last is a closed candle
+        self._persist(symbol, timeframe, klines[:-1])
+        return klines
+    
+    def _ensure_complete(self, symbol: str, timeframe: str) -> bool:
+        """
+        Detect missing open times in a series and backfill them
+        
+        All holes inside the window are covered by a single ranged request
+        (the window is never longer than one request's limit). Holes the
+        exchange returns nothing for (e.g. maintenance) are remembered and
+        no longer count as missing.
+        
+        Args:
+            symbol: Trading pair
+            timeframe: Kline interval
+        
+        Returns:
+            True when the window is complete (also stored in ``self.complete``)
+        """
+        key = (symbol, timeframe)
+        buffer = self.get_buffer(symbol, timeframe)
+        interval_ms = timeframe_to_ms(timeframe)
+        known = self._known_gaps.setdefault(key, set())
+        
+        with self._lock:
+            gaps = buffer.find_gaps(interval_ms)
+        known.intersection_update(gaps)
+        missing = [gap for gap in gaps if gap not in known]
+        
+        if missing:
+            # Candles older than the final window would fall straight off
+            floor = buffer.last_open_time - (self.history_limit - 1) * interval_ms
+            start = max(missing[0][0], floor)
+            end = missing[-1][1]
+            logger.info(f"🩹 Backfilling {len(missing)} gap(s) in {symbol} {timeframe}")
+            
+            try:
+                rows = self.client.get_klines(
+                    symbol=symbol,
+                    interval=timeframe,
+                    startTime=start,
+                    endTime=end,
+                    limit=self.history_limit
+                ) if start <= end else []
+                
+                with self._lock:
+                    buffer.merge(rows)
+                    gaps = buffer.find_gaps(interval_ms)
+                
+                # Fill the same holes on disk (only closed candles)
+                closed = [row for row in rows if int(row[0]) < buffer.last_open_time]
+                self._persist(symbol, timeframe, closed)
+                
+                # Whatever is still missing inside the fetched range does not exist
+                for gap in gaps:
+                    if gap not in known and gap[0] >= start and gap[1] <= end:
+                        logger.warning(f"Exchange has no {symbol} {timeframe} candles for {gap}")
+                        known.add(gap)
+            except Exception as e:
+                logger.error(f"Gap backfill failed for {symbol} {timeframe}: {e}")
+        
+        complete = all(gap in known for gap in gaps)
+        self.complete[key] = complete
+        return complete
+    
+    def _warm_start(self, symbol: str, timeframe: str, buffer: OHLCVBuffer, now_ms: int) -> None:
+        """Seed an empty buffer from the on-disk store if it holds recent candles"""
+        if not self.store:
+            return
+        
+        try:
+            records = self.store.read_latest(symbol, timeframe, self.history_limit)
+            interval_ms = timeframe_to_ms(timeframe)
+            if len(records) and records['open_time'][-1] > now_ms - self.history_limit * interval_ms:
+                with self._lock:
+                    buffer.load(records)
+                logger.info(f"💾 Warm-started {len(records)} {symbol} {timeframe} candles from disk")
+        except Exception as e:
+            logger.warning(f"Kline store warm start failed: {e}")
+    
+    def _persist(self, symbol: str, timeframe: str, rows: List[List]) -> None:
+        """Append closed candles to the on-disk store"""
+        if not self.store or not rows:
+            return
+        
+        try:
+            self.store.append(symbol, timeframe, rows)
+        except Exception as e:
+            logger.warning(f"Could not persist klines: {e}")
+    
+    def _apply_kline(self, row: List, is_closed: bool) -> None:
+        """Apply a streamed kline update (in-progress or closed)"""
+        with self._lock:
+            self.buffer.update(row)
+        if is_closed:
+            self._persist(self.symbol, self.timeframe, [row])
+    
+    def _apply_book_ticker(self, book_ticker: Dict) -> None:
+        """Store the latest best bid/ask"""
+        self._book_ticker = book_ticker
+    
+    def add_burst_listener(self, callback: Callable[[Dict], None]) -> None:
+        """
+        Register a callback for trade activity bursts on the streamed symbol
+        
+        Args:
+            callback: Called with the burst details (on the stream thread)
+        """
+        self._burst_listeners.append(callback)
+    
+    def _on_trade_burst(self, burst: Dict) -> None:
+        for callback in list(self._burst_listeners):
+            callback(burst)
+    
+    def _apply_depth(self, event: Dict) -> None:
+        """Apply a streamed diff-depth update, resyncing the book on a gap"""
+        book = self.order_books.get(self.symbol)
+        if book is None:
+            book = self.order_books.setdefault(self.symbol, LocalOrderBook(self.symbol))
+        
+        if not book.apply_diff(event) and not self._book_syncing:
+            # Snapshot off the socket thread; events keep buffering meanwhile
+            self._book_syncing = True
+            Thread(target=self._sync_order_book, args=(book,), daemon=True).start()
+    
+    def _sync_order_book(self, book: LocalOrderBook) -> None:
+        """Fetch a depth snapshot and replay the buffered stream events on it"""
+        try:
+            # Give the stream a moment to buffer events preceding the snapshot
+            time.sleep(1)
+            snapshot = self.client.get_order_book(symbol=book.symbol, limit=ORDER_BOOK_SNAPSHOT_LIMIT)
+            if not book.apply_snapshot(snapshot):
+                logger.warning(f"{book.symbol} depth snapshot did not line up with the stream, retrying")
+        except Exception as e:
+            logger.error(f"Error syncing order book: {e}")
+        finally:
+            self._book_syncing = False
+    
+    def _fetch_order_book(self, symbol: str) -> Optional[LocalOrderBook]:
+        """
+        Fetch a shallow depth snapshot (REST mode)
+        
+        Args:
+            symbol: Trading pair
+        
+        Returns:
+            Order book built from the snapshot, or None if disabled or failed
+        """
+        if not self.order_book_enabled:
+            return None
+        try:
+            snapshot = self.client.get_order_book(symbol=symbol, limit=ORDER_BOOK_REST_LIMIT)
+            book = LocalOrderBook.from_snapshot(symbol, snapshot)
+            self.order_books[symbol] = book
+            return book
+        except Exception as e:
+            logger.warning(f"Could not fetch {symbol} order book: {e}")
+            return None
+    
     @staticmethod
     def _get_timestamp() -> str:
         """Get ISO format timestamp"""
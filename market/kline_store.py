@@ -0,0 +1,212 @@
+"""
+Kline Store Module
+Append-mostly, memory-mapped on-disk candle cache
+
+Layout: ``<root>/<SYMBOL>/<timeframe>/<YYYY-MM-DD>.bin``, each file a flat
+array of fixed-size ``KLINE_DTYPE`` records in open-time order. Files can
+be opened directly with ``np.memmap(path, dtype=KLINE_DTYPE, mode='r')``
+by backtests and analytics without touching the exchange.
+
+New candles are appended; older ones (backfilled gaps) are merged into
+their day file, which is then rewritten and swapped in atomically.
+"""
+
+import logging
+import os
+from datetime import datetime, timezone
+from threading import Lock
+from typing import Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from config.settings import KLINE_STORE_DIR
+
+logger = logging.getLogger(__name__)
+
+KLINE_DTYPE = np.dtype([
+    ('open_time', '<i8'),
+    ('open', '<f8'),
+    ('high', '<f8'),
+    ('low', '<f8'),
+    ('close', '<f8'),
+    ('volume', '<f8'),
+])
+
+_DAY_MS = 86_400_000
+
+
+def _day_name(open_time: int) -> str:
+    return datetime.fromtimestamp(open_time / 1000, tz=timezone.utc).strftime('%Y-%m-%d')
+
+
+class KlineStore:
+    """Columnar kline files partitioned by symbol / timeframe / UTC day"""
+
+    def __init__(self, root: str = KLINE_STORE_DIR):
+        """
+        Initialize store
+
+        Args:
+            root: Base directory for the partition tree
+        """
+        self.root = root
+        self._lock = Lock()
+
+    def _dir(self, symbol: str, timeframe: str) -> str:
+        return os.path.join(self.root, symbol.upper(), timeframe)
+
+    def days(self, symbol: str, timeframe: str) -> List[str]:
+        """Sorted day partitions (YYYY-MM-DD) stored for a symbol/timeframe"""
+        directory = self._dir(symbol, timeframe)
+        if not os.path.isdir(directory):
+            return []
+        return sorted(name[:-4] for name in os.listdir(directory) if name.endswith('.bin'))
+
+    def _open_day(self, symbol: str, timeframe: str, day: str) -> np.ndarray:
+        """Memory-map one day partition (ignores a torn trailing record)"""
+        path = os.path.join(self._dir(symbol, timeframe), f"{day}.bin")
+        count = os.path.getsize(path) // KLINE_DTYPE.itemsize
+        if not count:
+            return np.empty(0, dtype=KLINE_DTYPE)
+        return np.memmap(path, dtype=KLINE_DTYPE, mode='r', shape=(count,))
+
+    def last_open_time(self, symbol: str, timeframe: str) -> Optional[int]:
+        """Open time (ms) of the newest stored candle, or None"""
+        for day in reversed(self.days(symbol, timeframe)):
+            records = self._open_day(symbol, timeframe, day)
+            if len(records):
+                return int(records['open_time'][-1])
+        return None
+
+    def append(self, symbol: str, timeframe: str, rows: Iterable[Sequence]) -> int:
+        """
+        Store closed candles
+
+        Candles newer than the last stored one are appended. Older candles
+        (e.g. a backfilled gap) are inserted into their day file; ones
+        already stored are left as they are.
+
+        Args:
+            symbol: Trading pair
+            timeframe: Kline interval
+            rows: REST-layout kline rows, oldest first (closed candles only)
+
+        Returns:
+            Number of candles written
+        """
+        with self._lock:
+            records = [
+                (int(r[0]), float(r[1]), float(r[2]), float(r[3]), float(r[4]), float(r[5]))
+                for r in rows
+            ]
+            if not records:
+                return 0
+
+            data = np.array(records, dtype=KLINE_DTYPE)
+            last = self.last_open_time(symbol, timeframe)
+            directory = self._dir(symbol, timeframe)
+            os.makedirs(directory, exist_ok=True)
+
+            written = 0
+            days = data['open_time'] // _DAY_MS
+            for day in np.unique(days):
+                chunk = data[days == day]
+                path = os.path.join(directory, f"{_day_name(int(chunk['open_time'][0]))}.bin")
+                newer = chunk[chunk['open_time'] > last] if last is not None else chunk
+                if len(newer) < len(chunk):
+                    written += self._insert_file(path, chunk[chunk['open_time'] <= last])
+                if len(newer):
+                    self._append_file(path, newer)
+                    written += len(newer)
+
+            return written
+
+    @staticmethod
+    def _append_file(path: str, chunk: np.ndarray) -> None:
+        with open(path, 'ab') as f:
+            size = f.tell()
+            torn = size % KLINE_DTYPE.itemsize
+            if torn:
+                # Drop a partial record left by an interrupted write
+                f.truncate(size - torn)
+                f.seek(size - torn)
+            f.write(chunk.tobytes())
+
+    @staticmethod
+    def _insert_file(path: str, chunk: np.ndarray) -> int:
+        """Merge older candles into a day file (existing records win), returns candles added"""
+        existing = np.empty(0, dtype=KLINE_DTYPE)
+        count = os.path.getsize(path) // KLINE_DTYPE.itemsize if os.path.exists(path) else 0
+        if count:
+            existing = np.memmap(path, dtype=KLINE_DTYPE, mode='r', shape=(count,))
+
+        # Binary search the sorted file: re-sent candles are the common case
+        times = existing['open_time']
+        index = np.minimum(np.searchsorted(times, chunk['open_time']), max(count - 1, 0))
+        stored = (times[index] == chunk['open_time']) if count else np.zeros(len(chunk), dtype=bool)
+        added = chunk[~stored]
+        added = added[np.unique(added['open_time'], return_index=True)[1]]
+        if not len(added):
+            return 0
+
+        merged = np.concatenate([np.array(existing), added])
+        merged = merged[np.argsort(merged['open_time'], kind='stable')]
+        del existing, times
+        # Rewrite beside the file and swap, so readers never see a partial day
+        temp = f"{path}.tmp"
+        merged.tofile(temp)
+        os.replace(temp, path)
+        return len(added)
+
+    def read_range(self, symbol: str, timeframe: str,
+                   start_ms: Optional[int] = None, end_ms: Optional[int] = None) -> np.ndarray:
+        """
+        Read candles with start_ms <= open_time <= end_ms
+
+        Args:
+            symbol: Trading pair
+            timeframe: Kline interval
+            start_ms: Inclusive lower bound (None for the beginning)
+            end_ms: Inclusive upper bound (None for the end)
+
+        Returns:
+            Structured array of ``KLINE_DTYPE`` records
+        """
+        start_day = _day_name(start_ms) if start_ms is not None else None
+        end_day = _day_name(end_ms) if end_ms is not None else None
+
+        parts = []
+        for day in self.days(symbol, timeframe):
+            if (start_day and day < start_day) or (end_day and day > end_day):
+                continue
+            records = self._open_day(symbol, timeframe, day)
+            times = records['open_time']
+            lo = 0 if start_ms is None else int(np.searchsorted(times, start_ms, 'left'))
+            hi = len(times) if end_ms is None else int(np.searchsorted(times, end_ms, 'right'))
+            if hi > lo:
+                parts.append(records[lo:hi])
+
+        if not parts:
+            return np.empty(0, dtype=KLINE_DTYPE)
+        return np.concatenate(parts)
+
+    def read_latest(self, symbol: str, timeframe: str, count: int) -> np.ndarray:
+        """
+        Read the newest ``count`` stored candles
+
+        Returns:
+            Structured array of ``KLINE_DTYPE`` records, oldest first
+        """
+        parts = []
+        remaining = count
+        for day in reversed(self.days(symbol, timeframe)):
+            records = self._open_day(symbol, timeframe, day)
+            if len(records):
+                parts.append(records[-remaining:])
+                remaining -= len(parts[-1])
+            if remaining <= 0:
+                break
+
+        if not parts:
+            return np.empty(0, dtype=KLINE_DTYPE)
+        return np.concatenate(parts[::-1])
@@ -0,0 +1,209 @@
+"""
+OHLCV Buffer Module
+Fixed-capacity NumPy ring buffer for candle data with zero-copy window views
+"""
+
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Column order inside the value matrix
+OPEN, HIGH, LOW, CLOSE, VOLUME = range(5)
+
+
+class OHLCVBuffer:
+    """
+    Ring buffer of candles for one (symbol, timeframe)
+
+    Every value is written twice, at ``i`` and ``i + capacity``, so the most
+    recent ``n`` candles are always one contiguous slice. Window accessors
+    return views into that storage - nothing is copied per read, and memory
+    stays constant however long the bot runs.
+
+    Views are live: a later ``update`` may overwrite what they point at.
+    Call ``.copy()`` on a view that must outlive the next update.
+    """
+
+    def __init__(self, capacity: int):
+        """
+        Initialize buffer
+
+        Args:
+            capacity: Maximum number of candles kept
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+
+        self.capacity = capacity
+        self._times = np.zeros(2 * capacity, dtype=np.int64)
+        self._values = np.zeros((5, 2 * capacity), dtype=np.float64)
+        self._head = 0  # Next write position in [0, capacity)
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def clear(self) -> None:
+        """Drop all candles"""
+        self._head = 0
+        self._count = 0
+
+    def load(self, rows: Iterable[Sequence]) -> None:
+        """
+        Replace contents with REST-layout kline rows (oldest first)
+
+        Args:
+            rows: Rows of [open_time, open, high, low, close, volume, ...]
+        """
+        self.clear()
+        for row in rows:
+            self._append(row)
+
+    def update(self, row: Sequence) -> None:
+        """
+        Apply one kline row: overwrite the in-progress candle or append a new one
+
+        Rows older than the last candle are ignored.
+
+        Args:
+            row: [open_time, open, high, low, close, volume, ...]
+        """
+        open_time = int(row[0])
+
+        if self._count:
+            last = self.last_open_time
+            if open_time == last:
+                self._write(self._head - 1 if self._head else self.capacity - 1, row)
+                return
+            if open_time < last:
+                return
+
+        self._append(row)
+
+    def merge(self, rows: Iterable[Sequence]) -> None:
+        """
+        Insert rows anywhere in the series (e.g. backfilled candles)
+
+        Existing candles win over rows with the same open time, and only
+        the newest ``capacity`` candles are kept.
+
+        Args:
+            rows: REST-layout kline rows in any order
+        """
+        merged = {row[0]: row for row in self.to_rows()}
+        for row in rows:
+            merged.setdefault(int(row[0]), row)
+        self.load(merged[t] for t in sorted(merged)[-self.capacity:])
+
+    def find_gaps(self, interval_ms: int) -> List[Tuple[int, int]]:
+        """
+        Missing candles between the first and last candle
+
+        Args:
+            interval_ms: Expected spacing of open times
+
+        Returns:
+            List of (first_missing_open_time, last_missing_open_time)
+        """
+        times = self.open_times
+        if len(times) < 2:
+            return []
+        holes = np.flatnonzero(np.diff(times) > interval_ms)
+        return [(int(times[i]) + interval_ms, int(times[i + 1]) - interval_ms) for i in holes]
+
+    def _append(self, row: Sequence) -> None:
+        self._write(self._head, row)
+        self._head = (self._head + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    def _write(self, index: int, row: Sequence) -> None:
+        mirror = index + self.capacity
+        self._times[index] = self._times[mirror] = int(row[0])
+        values = self._values
+        for column in range(5):
+            values[column, index] = values[column, mirror] = float(row[column + 1])
+
+    def _slice(self, n: Optional[int] = None) -> slice:
+        n = self._count if n is None else min(n, self._count)
+        end = self._head + self.capacity
+        return slice(end - n, end)
+
+    @property
+    def last_open_time(self) -> int:
+        """Open time (ms) of the most recent candle"""
+        if not self._count:
+            raise IndexError("buffer is empty")
+        return int(self._times[self._head + self.capacity - 1])
+
+    @property
+    def open_times(self) -> np.ndarray:
+        return self._times[self._slice()]
+
+    @property
+    def opens(self) -> np.ndarray:
+        return self._values[OPEN, self._slice()]
+
+    @property
+    def highs(self) -> np.ndarray:
+        return self._values[HIGH, self._slice()]
+
+    @property
+    def lows(self) -> np.ndarray:
+        return self._values[LOW, self._slice()]
+
+    @property
+    def closes(self) -> np.ndarray:
+        return self._values[CLOSE, self._slice()]
+
+    @property
+    def volumes(self) -> np.ndarray:
+        return self._values[VOLUME, self._slice()]
+
+    def window(self, n: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """
+        Zero-copy views of the most recent ``n`` candles (all if None)
+
+        Returns:
+            Dictionary of column name -> 1-D view
+        """
+        s = self._slice(n)
+        return {
+            'open_time': self._times[s],
+            'open': self._values[OPEN, s],
+            'high': self._values[HIGH, s],
+            'low': self._values[LOW, s],
+            'close': self._values[CLOSE, s],
+            'volume': self._values[VOLUME, s],
+        }
+
+    def frozen_window(self, n: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """
+        Read-only copy of the most recent ``n`` candles (all if None)
+
+        Unlike ``window`` the arrays are not overwritten by later updates,
+        so they can be handed to other threads.
+
+        Returns:
+            Dictionary of column name -> 1-D read-only array
+        """
+        s = self._slice(n)
+        times = self._times[s].copy()
+        values = self._values[:, s].copy()
+        times.setflags(write=False)
+        values.setflags(write=False)
+        return {
+            'open_time': times,
+            'open': values[OPEN],
+            'high': values[HIGH],
+            'low': values[LOW],
+            'close': values[CLOSE],
+            'volume': values[VOLUME],
+        }
+
+    def to_rows(self) -> List[List]:
+        """Export candles as REST-layout rows (for persistence or debugging)"""
+        s = self._slice()
+        return [
+            [int(t), *map(float, self._values[:, i])]
+            for t, i in zip(self._times[s], range(s.start, s.stop))
+        ]
@@ -0,0 +1,241 @@
+"""
+Order Book Module
+Local order book kept in sync from a REST depth snapshot plus diff-depth
+stream events, with spread / imbalance / microprice features
+
+Sync follows Binance's procedure: buffer diff events, fetch a snapshot,
+drop events with ``u <= lastUpdateId``, then every applied event must
+satisfy ``U <= lastUpdateId + 1 <= u``. Any gap marks the book unsynced
+until a new snapshot arrives.
+"""
+
+import bisect
+import logging
+import time
+from collections import deque
+from threading import Lock
+from typing import Dict, Iterable, List, Optional
+
+from config.settings import ORDER_BOOK_TOP_N
+
+logger = logging.getLogger(__name__)
+
+
+class LocalOrderBook:
+    """One symbol's order book with features recomputed on every update"""
+
+    def __init__(self, symbol: str, top_n: int = ORDER_BOOK_TOP_N, max_pending: int = 1000):
+        """
+        Initialize order book
+
+        Args:
+            symbol: Trading pair
+            top_n: Levels per side used for the depth imbalance
+            max_pending: Diff events buffered while waiting for a snapshot
+        """
+        self.symbol = symbol
+        self.top_n = top_n
+
+        self.bids: Dict[float, float] = {}
+        self.asks: Dict[float, float] = {}
+        self._bid_prices: List[float] = []  # Ascending, best bid last
+        self._ask_prices: List[float] = []  # Ascending, best ask first
+
+        self.last_update_id: Optional[int] = None
+        self.synced = False
+        self.updates = 0
+        self.resyncs = 0
+        self.last_update_time = 0.0
+
+        self._pending = deque(maxlen=max_pending)
+        self._features: Dict = {}
+        self._lock = Lock()
+
+    @property
+    def needs_snapshot(self) -> bool:
+        return not self.synced
+
+    def apply_snapshot(self, snapshot: Dict) -> bool:
+        """
+        Load a REST depth snapshot and replay buffered diff events on top
+
+        Args:
+            snapshot: ``get_order_book`` payload with lastUpdateId, bids, asks
+
+        Returns:
+            True if the book is now synced (False if the buffered events do
+            not connect to the snapshot - fetch another one)
+        """
+        with self._lock:
+            self.bids.clear()
+            self.asks.clear()
+            self._set_levels(self.bids, self._bid_prices, snapshot['bids'])
+            self._set_levels(self.asks, self._ask_prices, snapshot['asks'])
+            self.last_update_id = int(snapshot['lastUpdateId'])
+            self.synced = True
+
+            pending = list(self._pending)
+            self._pending.clear()
+            for index, event in enumerate(pending):
+                if not self._apply(event):
+                    # The book is unsynced again; keep the events from the
+                    # break onward so the next snapshot can replay them
+                    self._pending.extend(pending[index + 1:])
+                    logger.warning(
+                        f"{self.symbol} buffered events do not connect to snapshot "
+                        f"{snapshot['lastUpdateId']}; keeping {len(self._pending)} for the next one"
+                    )
+                    break
+
+            if self.synced:
+                self._refresh_features()
+                logger.info(f"📚 {self.symbol} order book synced at update {self.last_update_id}")
+            return self.synced
+
+    def apply_diff(self, event: Dict) -> bool:
+        """
+        Apply one diff-depth stream event
+
+        Args:
+            event: ``depthUpdate`` payload with U, u, b, a
+
+        Returns:
+            True if the book is synced after the event
+        """
+        with self._lock:
+            if not self.synced:
+                self._pending.append(event)
+                return False
+            if self._apply(event):
+                self._refresh_features()
+            return self.synced
+
+    def _apply(self, event: Dict) -> bool:
+        """Apply an event under the lock; False (and unsynced) on a sequence gap"""
+        first, last = int(event['U']), int(event['u'])
+        if last <= self.last_update_id:
+            return True  # Already contained in the snapshot
+
+        if first > self.last_update_id + 1:
+            logger.warning(
+                f"{self.symbol} order book gap: expected update {self.last_update_id + 1}, got {first}"
+            )
+            self._desync(event)
+            return False
+
+        self._update_levels(self.bids, self._bid_prices, event['b'])
+        self._update_levels(self.asks, self._ask_prices, event['a'])
+        self.last_update_id = last
+        self.updates += 1
+        self.last_update_time = time.time()
+
+        if self._bid_prices and self._ask_prices and self._bid_prices[-1] >= self._ask_prices[0]:
+            logger.warning(f"{self.symbol} order book crossed, resyncing")
+            self._desync()
+            return False
+        return True
+
+    def _desync(self, event: Optional[Dict] = None) -> None:
+        self.synced = False
+        self.resyncs += 1
+        self._pending.clear()
+        if event is not None:
+            self._pending.append(event)
+        self._features = {}
+
+    @staticmethod
+    def _set_levels(book: Dict[float, float], prices: List[float], levels: Iterable) -> None:
+        for price, qty in levels:
+            qty = float(qty)
+            if qty > 0:
+                book[float(price)] = qty
+        prices[:] = sorted(book)
+
+    @staticmethod
+    def _update_levels(book: Dict[float, float], prices: List[float], levels: Iterable) -> None:
+        for price, qty in levels:
+            price, qty = float(price), float(qty)
+            if qty == 0:
+                if book.pop(price, None) is not None:
+                    del prices[bisect.bisect_left(prices, price)]
+            else:
+                if price not in book:
+                    bisect.insort(prices, price)
+                book[price] = qty
+
+    def _refresh_features(self) -> None:
+        if not self._bid_prices or not self._ask_prices:
+            self._features = {}
+            return
+
+        bid, ask = self._bid_prices[-1], self._ask_prices[0]
+        bid_qty, ask_qty = self.bids[bid], self.asks[ask]
+        mid = (bid + ask) / 2
+
+        bid_depth = sum(self.bids[p] for p in self._bid_prices[-self.top_n:])
+        ask_depth = sum(self.asks[p] for p in self._ask_prices[:self.top_n])
+        depth = bid_depth + ask_depth
+
+        self._features = {
+            'bid': bid,
+            'ask': ask,
+            'bid_qty': bid_qty,
+            'ask_qty': ask_qty,
+            'mid': mid,
+            'spread': ask - bid,
+            'spread_bps': (ask - bid) / mid * 10_000,
+            'book_imbalance': (bid_depth - ask_depth) / depth if depth > 0 else 0.0,
+            # Top-of-book size-weighted price: leans toward the thinner side
+            'microprice': (bid * ask_qty + ask * bid_qty) / (bid_qty + ask_qty),
+            'bid_depth': bid_depth,
+            'ask_depth': ask_depth,
+        }
+
+    def get_features(self) -> Dict:
+        """
+        Latest microstructure features (computed when the book last changed)
+
+        Returns:
+            Dictionary with bid, ask, mid, spread, spread_bps, book_imbalance
+            (top-N, -1..1, positive = bid heavy), microprice and depths;
+            empty while unsynced
+        """
+        return self._features
+
+    def get_status(self) -> Dict:
+        """Sync state and counters"""
+        return {
+            'symbol': self.symbol,
+            'synced': self.synced,
+            'last_update_id': self.last_update_id,
+            'levels': (len(self._bid_prices), len(self._ask_prices)),
+            'updates': self.updates,
+            'resyncs': self.resyncs,
+            'pending': len(self._pending),
+        }
+
+    @classmethod
+    def from_snapshot(cls, symbol: str, snapshot: Dict, top_n: int = ORDER_BOOK_TOP_N) -> 'LocalOrderBook':
+        """Order book loaded from a single REST snapshot (no stream)"""
+        book = cls(symbol, top_n)
+        book.apply_snapshot(snapshot)
+        return book
+
+    @classmethod
+    def replay(cls, symbol: str, snapshot: Dict, events: Iterable[Dict],
+               top_n: int = ORDER_BOOK_TOP_N) -> 'LocalOrderBook':
+        """
+        Rebuild a book offline from a snapshot and recorded diff events
+
+        Args:
+            symbol: Trading pair
+            snapshot: REST depth snapshot
+            events: Recorded ``depthUpdate`` payloads, in arrival order
+
+        Returns:
+            The resulting order book
+        """
+        book = cls.from_snapshot(symbol, snapshot, top_n)
+        for event in events:
+            book.apply_diff(event)  # Events older than the snapshot are skipped
+        return book
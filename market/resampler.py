@@ -0,0 +1,90 @@
+"""
+Resampler Module
+Builds higher-timeframe candles locally from the base (1m) candle series
+"""
+
+from typing import Dict
+
+import numpy as np
+
+from market.ohlcv_buffer import OHLCVBuffer
+
+TIMEFRAME_MS: Dict[str, int] = {
+    '1m': 60_000,
+    '3m': 180_000,
+    '5m': 300_000,
+    '15m': 900_000,
+    '30m': 1_800_000,
+    '1h': 3_600_000,
+    '2h': 7_200_000,
+    '4h': 14_400_000,
+    '1d': 86_400_000,
+}
+
+
+def timeframe_to_ms(timeframe: str) -> int:
+    """
+    Convert a Binance interval string to milliseconds
+
+    Args:
+        timeframe: Interval such as '1m', '15m' or '1h'
+
+    Returns:
+        Interval length in milliseconds
+    """
+    if timeframe not in TIMEFRAME_MS:
+        raise ValueError(f"Unsupported timeframe: {timeframe}")
+    return TIMEFRAME_MS[timeframe]
+
+
+def resample_into(base: Dict[str, np.ndarray], target: OHLCVBuffer, interval_ms: int) -> bool:
+    """
+    Fold base candles into a higher-timeframe buffer
+
+    Only buckets from the target's last candle onward are rebuilt, so each
+    call touches a handful of rows. A bucket is only written when the base
+    window covers it from its first base candle - a partially covered
+    bucket keeps the value it already has.
+
+    Args:
+        base: Base OHLCV window views (see ``OHLCVBuffer.window``), oldest first
+        target: Higher-timeframe buffer, already backfilled over REST
+        interval_ms: Target interval in milliseconds
+
+    Returns:
+        False when the base window no longer reaches the target's last
+        candle (the target must be backfilled again), True otherwise
+    """
+    times = base['open_time']
+    if not len(times) or not len(target):
+        return False
+
+    last_bucket = target.last_open_time
+    first_bucket = int(times[0]) - int(times[0]) % interval_ms
+    if first_bucket > last_bucket + interval_ms:
+        return False
+
+    start = int(np.searchsorted(times, last_bucket))
+    if start == len(times):
+        return True
+
+    times = times[start:]
+    buckets = times - times % interval_ms
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    ends = np.r_[starts[1:], len(times)] - 1
+
+    opens = base['open'][start:][starts]
+    highs = np.maximum.reduceat(base['high'][start:], starts)
+    lows = np.minimum.reduceat(base['low'][start:], starts)
+    closes = base['close'][start:][ends]
+    volumes = np.add.reduceat(base['volume'][start:], starts)
+
+    # The first bucket is only complete if the window holds its first candle
+    covered = int(base['open_time'][0]) <= int(buckets[0])
+
+    for i in range(len(starts)):
+        if i == 0 and not covered:
+            continue
+        target.update((int(buckets[starts[i]]), opens[i], highs[i], lows[i], closes[i], volumes[i]))
+
+    return True
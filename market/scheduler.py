@@ -0,0 +1,166 @@
+"""
+Candle Scheduler Module
+Fires at exchange candle boundaries using a measured server clock offset
+"""
+
+import logging
+import time
+from collections import deque
+from threading import Event
+from typing import Dict, Optional
+
+from market.resampler import timeframe_to_ms
+from market.snapshot import MarketSnapshot
+from config.settings import (
+    TRADING_CONFIG, SCHEDULER_LEAD_SECONDS, SCHEDULER_FRESH_ATTEMPTS,
+    SCHEDULER_FRESH_POLL, SCHEDULER_CLOCK_RESYNC
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _percentile(values, pct: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class CandleScheduler:
+    """Wakes callers right at (or just before) each candle close on the exchange clock"""
+
+    def __init__(self, binance_client, timeframe: Optional[str] = None,
+                 lead_seconds: float = SCHEDULER_LEAD_SECONDS,
+                 fresh_attempts: int = SCHEDULER_FRESH_ATTEMPTS,
+                 fresh_poll: float = SCHEDULER_FRESH_POLL,
+                 resync_seconds: float = SCHEDULER_CLOCK_RESYNC):
+        """
+        Initialize scheduler
+
+        Args:
+            binance_client: Client used for ``get_server_time``
+            timeframe: Candle interval to align to (default: trading timeframe)
+            lead_seconds: Fire this long before the close (0 fires at the close)
+            fresh_attempts: Fetches per close before publishing a stale snapshot
+            fresh_poll: Seconds between those fetches
+            resync_seconds: Seconds between server clock measurements
+        """
+        self.client = binance_client
+        self.timeframe = timeframe or TRADING_CONFIG['timeframe']
+        self.interval_ms = timeframe_to_ms(self.timeframe)
+        self.lead_ms = int(lead_seconds * 1000)
+        self.fresh_attempts = max(1, fresh_attempts)
+        self.fresh_poll = fresh_poll
+        self.resync_seconds = resync_seconds
+
+        self.offset_ms = 0.0  # server clock - local clock
+        self.round_trip_ms = 0.0
+        self._last_sync = 0.0
+
+        # Recent wake-up jitter and close-to-publish latency (ms)
+        self.jitter_ms = deque(maxlen=500)
+        self.publish_latency_ms = deque(maxlen=500)
+
+    def sync_clock(self) -> float:
+        """
+        Measure the exchange clock offset (midpoint of the request round trip)
+
+        Returns:
+            Offset in milliseconds (server - local)
+        """
+        try:
+            sent = time.time() * 1000
+            server_ms = self.client.get_server_time()['serverTime']
+            received = time.time() * 1000
+
+            self.round_trip_ms = received - sent
+            self.offset_ms = server_ms - (sent + received) / 2
+            logger.info(
+                f"⏱️ Exchange clock offset {self.offset_ms:+.0f}ms "
+                f"(round trip {self.round_trip_ms:.0f}ms)"
+            )
+        except Exception as e:
+            logger.warning(f"Could not sync exchange clock, keeping {self.offset_ms:+.0f}ms: {e}")
+
+        self._last_sync = time.time()
+        return self.offset_ms
+
+    def exchange_now_ms(self) -> float:
+        """Current time on the exchange clock (ms)"""
+        return time.time() * 1000 + self.offset_ms
+
+    def next_close_ms(self) -> int:
+        """Exchange time (ms) of the next candle boundary we have not fired for yet"""
+        now = self.exchange_now_ms() + self.lead_ms
+        return int(now - now % self.interval_ms) + self.interval_ms
+
+    def wait_for_next_close(self, stop_event: Optional[Event] = None,
+                            max_wait: Optional[float] = None) -> Optional[int]:
+        """
+        Sleep until the next candle close (minus the configured lead)
+
+        Args:
+            stop_event: Returns early (None) when set
+            max_wait: Give up (None) after this many seconds
+
+        Returns:
+            The candle boundary (exchange ms) that was reached, or None if
+            stopped or ``max_wait`` ran out first
+        """
+        if time.time() - self._last_sync >= self.resync_seconds:
+            self.sync_clock()
+
+        boundary = self.next_close_ms()
+        target = boundary - self.lead_ms
+        stop_event = stop_event or Event()
+        deadline = time.time() + max_wait if max_wait is not None else None
+
+        while True:
+            remaining = (target - self.exchange_now_ms()) / 1000
+            if remaining <= 0:
+                break
+            if deadline is not None:
+                left = deadline - time.time()
+                if left <= 0:
+                    return None
+                remaining = min(remaining, left)
+            if stop_event.wait(remaining):
+                return None
+
+        self.jitter_ms.append(self.exchange_now_ms() - target)
+        return boundary
+
+    def is_fresh(self, market_data: Optional[MarketSnapshot], boundary: int) -> bool:
+        """
+        True if a snapshot already contains the bar that closed at ``boundary``
+
+        With a pre-close lead the bar is still open, so any snapshot counts.
+        """
+        if not market_data:
+            return False
+        if self.lead_ms:
+            return True
+        candles = market_data.candles
+        if candles is None or not len(candles['open_time']):
+            return True
+        # The next candle exists once the bar before it has closed
+        return int(candles['open_time'][-1]) >= boundary
+
+    def record_publish(self, boundary: int) -> None:
+        """Record how long after the close a snapshot reached subscribers"""
+        self.publish_latency_ms.append(self.exchange_now_ms() - boundary)
+
+    def get_stats(self) -> Dict:
+        """Clock offset, wake-up jitter and close-to-publish latency"""
+        return {
+            'timeframe': self.timeframe,
+            'lead_ms': self.lead_ms,
+            'offset_ms': round(self.offset_ms, 1),
+            'round_trip_ms': round(self.round_trip_ms, 1),
+            'jitter_p50_ms': round(_percentile(self.jitter_ms, 50), 2),
+            'jitter_p95_ms': round(_percentile(self.jitter_ms, 95), 2),
+            'jitter_max_ms': round(max(self.jitter_ms, default=0.0), 2),
+            'publish_latency_p50_ms': round(_percentile(self.publish_latency_ms, 50), 1),
+            'publish_latency_p95_ms': round(_percentile(self.publish_latency_ms, 95), 1),
+        }
@@ -0,0 +1,179 @@
+"""
+Market Snapshot Module
+Immutable, slotted market data record passed from the fetcher to every
+engine, analyzer and log
+
+Snapshots cross threads on the market data bus, so their ``candles`` must
+not alias the fetcher's ring buffer: ``replace()`` shares the candle
+arrays between copies, and the fetcher hands out read-only copies.
+"""
+
+import json
+import math
+import struct
+from typing import Dict
+
+# Text fields, in binary layout order
+TEXT_FIELDS = ('symbol', 'timeframe', 'trend', 'timestamp', 'trigger', 'regime')
+
+# Numeric fields (None or float), in binary layout order
+NUMERIC_FIELDS = (
+    'price', 'rsi', 'ema_fast', 'ema_slow', 'atr',
+    'macd', 'macd_signal', 'macd_hist', 'vwap', 'stoch_k', 'stoch_d', 'obv',
+    'sma', 'bb_upper', 'bb_middle', 'bb_lower',
+    'volume', 'avg_volume', 'volume_ratio',
+    'bid', 'ask', 'spread', 'spread_bps', 'book_imbalance', 'microprice',
+    'cvd', 'candle_delta', 'buy_ratio', 'trade_rate', 'activity_ratio',
+)
+
+FIELDS = TEXT_FIELDS + NUMERIC_FIELDS + ('complete', 'candles')
+_FIELD_SET = frozenset(FIELDS)
+
+# Binary layout: numeric presence bitmask, numeric values, complete flag,
+# then length-prefixed UTF-8 text fields
+_NUMERIC_STRUCT = struct.Struct(f'<Q{len(NUMERIC_FIELDS)}d?')
+_LENGTH_STRUCT = struct.Struct('<H')
+
+
+def _check_fields(fields: Dict) -> None:
+    if not _FIELD_SET.issuperset(fields):
+        unknown = sorted(set(fields) - _FIELD_SET)
+        raise TypeError(f"Unknown market snapshot fields: {', '.join(unknown)}")
+
+
+class MarketSnapshot:
+    """Read-only market data and indicators for one symbol/timeframe at one moment"""
+
+    __slots__ = FIELDS
+
+    def __init__(self, **fields):
+        """
+        Initialize snapshot
+
+        Args:
+            **fields: Any of ``FIELDS``; omitted ones are None (``complete``
+                defaults to False). ``candles`` is kept by reference, so
+                only the attributes are immutable; the fetcher passes a
+                read-only copy of its OHLCV window (``frozen_window``),
+                never live views of the ring buffer.
+
+        Raises:
+            TypeError: On an unknown field name
+        """
+        _check_fields(fields)
+        set_field = object.__setattr__
+        get = fields.get
+        for name in FIELDS:
+            set_field(self, name, get(name))
+        if self.complete is None:
+            set_field(self, 'complete', False)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("MarketSnapshot is immutable; use replace()")
+
+    def __delattr__(self, name):
+        raise AttributeError("MarketSnapshot is immutable")
+
+    def __repr__(self) -> str:
+        return (
+            f"MarketSnapshot({self.symbol} {self.timeframe} price={self.price} "
+            f"rsi={self.rsi} trend={self.trend} at {self.timestamp})"
+        )
+
+    def __reduce__(self):
+        return _rebuild, (tuple(getattr(self, name) for name in FIELDS),)
+
+    def replace(self, **changes) -> 'MarketSnapshot':
+        """
+        Copy with some fields changed (candles stay shared)
+
+        Returns:
+            New snapshot
+        """
+        _check_fields(changes)
+        snapshot = object.__new__(MarketSnapshot)
+        set_field = object.__setattr__
+        for name in FIELDS:
+            set_field(snapshot, name, changes[name] if name in changes else getattr(self, name))
+        return snapshot
+
+    def to_dict(self, include_candles: bool = False, json_safe: bool = False) -> Dict:
+        """
+        Plain dictionary of the snapshot
+
+        Args:
+            include_candles: Include the (read-only) candle arrays
+            json_safe: Map NaN (indicator warm-up) to None
+
+        Returns:
+            Field name -> value
+        """
+        data = {name: getattr(self, name) for name in FIELDS if name != 'candles'}
+        if json_safe:
+            for name in NUMERIC_FIELDS:
+                value = data[name]
+                if value is not None and math.isnan(value):
+                    data[name] = None
+        if include_candles:
+            data['candles'] = self.candles
+        return data
+
+    def to_json(self) -> str:
+        """JSON text of every field except the candles"""
+        return json.dumps(self.to_dict(json_safe=True))
+
+    def to_bytes(self) -> bytes:
+        """
+        Compact binary encoding of every field except the candles
+
+        Returns:
+            Bytes readable by ``from_bytes``
+        """
+        mask = 0
+        values = []
+        for i, name in enumerate(NUMERIC_FIELDS):
+            value = getattr(self, name)
+            if value is None:
+                values.append(0.0)
+            else:
+                mask |= 1 << i
+                values.append(value)
+        parts = [_NUMERIC_STRUCT.pack(mask, *values, bool(self.complete))]
+        for name in TEXT_FIELDS:
+            text = (getattr(self, name) or '').encode('utf-8')
+            parts.append(_LENGTH_STRUCT.pack(len(text)))
+            parts.append(text)
+        return b''.join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'MarketSnapshot':
+        """
+        Decode ``to_bytes`` output (candles are not included)
+
+        Args:
+            data: Encoded snapshot
+
+        Returns:
+            Snapshot without candles
+        """
+        mask, *values = _NUMERIC_STRUCT.unpack_from(data)
+        complete = values.pop()
+        fields = {
+            name: value if mask >> i & 1 else None
+            for i, (name, value) in enumerate(zip(NUMERIC_FIELDS, values))
+        }
+        fields['complete'] = complete
+
+        offset = _NUMERIC_STRUCT.size
+        for name in TEXT_FIELDS:
+            (length,) = _LENGTH_STRUCT.unpack_from(data, offset)
+            offset += _LENGTH_STRUCT.size
+            text = data[offset:offset + length].decode('utf-8')
+            offset += length
+            fields[name] = text or None
+        return cls(**fields)
+
+
+def _rebuild(values: tuple) -> MarketSnapshot:
+    return MarketSnapshot(**dict(zip(FIELDS, values)))
+
@@ -0,0 +1,200 @@
+"""
+Market Stream Module
+Persistent Binance WebSocket subscription for klines, best bid/ask and
+(optionally) diff-depth updates and aggregated trades
+"""
+
+import json
+import logging
+import time
+from threading import Thread, Event, Lock
+from typing import Callable, Dict, List, Optional
+
+import websocket
+
+from config.settings import BINANCE_STREAM_URL, STREAM_RECONNECT_DELAY
+
+logger = logging.getLogger(__name__)
+
+
+def kline_event_to_row(kline: Dict) -> List:
+    """
+    Convert a kline stream payload into the REST ``get_klines`` row layout
+
+    Args:
+        kline: The ``k`` object of a kline stream event
+
+    Returns:
+        List in the same order as a REST kline row
+    """
+    return [
+        kline['t'], kline['o'], kline['h'], kline['l'], kline['c'], kline['v'],
+        kline['T'], kline['q'], kline['n'], kline['V'], kline['Q'], kline['B']
+    ]
+
+
+class BinanceMarketStream:
+    """Keeps a combined kline + bookTicker stream open and reconnects on failure"""
+
+    def __init__(self, symbol: str, timeframe: str,
+                 on_kline: Optional[Callable[[List, bool], None]] = None,
+                 on_book_ticker: Optional[Callable[[Dict], None]] = None,
+                 on_depth: Optional[Callable[[Dict], None]] = None,
+                 on_trade: Optional[Callable[[float, float, bool, int], None]] = None,
+                 url: str = BINANCE_STREAM_URL,
+                 reconnect_delay: float = STREAM_RECONNECT_DELAY,
+                 record_path: Optional[str] = None):
+        """
+        Initialize market stream
+
+        Args:
+            symbol: Trading pair (e.g. 'BTCUSDT')
+            timeframe: Kline interval (e.g. '1m')
+            on_kline: Called with (kline_row, is_closed) for every kline frame
+            on_book_ticker: Called with {'bid', 'bid_qty', 'ask', 'ask_qty'}
+            on_depth: Called with each raw ``depthUpdate`` payload; subscribes
+                to the 100ms diff-depth stream when set
+            on_trade: Called with (price, qty, is_buyer_maker, trade_time) for
+                every aggregated trade; subscribes to aggTrade when set
+            url: Combined stream endpoint (point at a local replay server for testing)
+            reconnect_delay: Seconds to wait between reconnect attempts
+            record_path: Optional JSONL file every raw frame is appended to
+        """
+        self.symbol = symbol
+        self.timeframe = timeframe
+        self.on_kline = on_kline
+        self.on_book_ticker = on_book_ticker
+        self.on_depth = on_depth
+        self.on_trade = on_trade
+        self.url = url
+        self.reconnect_delay = reconnect_delay
+        self.record_path = record_path
+
+        self.is_connected = False
+        self.last_message_time = 0.0
+        self.messages_received = 0
+
+        self._ws = None
+        self._thread = None
+        self._stop_event = Event()
+        self._record_lock = Lock()
+
+    @property
+    def stream_url(self) -> str:
+        """Full combined-stream URL for this symbol"""
+        name = self.symbol.lower()
+        streams = f"{name}@kline_{self.timeframe}/{name}@bookTicker"
+        if self.on_depth:
+            streams += f"/{name}@depth@100ms"
+        if self.on_trade:
+            streams += f"/{name}@aggTrade"
+        return f"{self.url}?streams={streams}"
+
+    def start(self) -> None:
+        """Start the stream in a background thread"""
+        if self._thread and self._thread.is_alive():
+            logger.warning("Market stream already running")
+            return
+
+        self._stop_event.clear()
+        self._thread = Thread(target=self._run, daemon=True)
+        self._thread.start()
+        logger.info(f"📡 Market stream started: {self.stream_url}")
+
+    def stop(self) -> None:
+        """Stop the stream and close the socket"""
+        self._stop_event.set()
+        if self._ws:
+            self._ws.close()
+        if self._thread:
+            self._thread.join(timeout=5)
+        self.is_connected = False
+        logger.info("📡 Market stream stopped")
+
+    def seconds_since_last_message(self) -> float:
+        """Seconds since the last frame arrived (inf if none yet)"""
+        if not self.last_message_time:
+            return float('inf')
+        return time.time() - self.last_message_time
+
+    def _run(self) -> None:
+        """Connection loop - reconnects until stopped"""
+        while not self._stop_event.is_set():
+            self._ws = websocket.WebSocketApp(
+                self.stream_url,
+                on_open=self._on_open,
+                on_message=self._on_message,
+                on_error=self._on_error,
+                on_close=self._on_close
+            )
+            try:
+                self._ws.run_forever(ping_interval=60, ping_timeout=10)
+            except Exception as e:
+                logger.error(f"Market stream error: {e}")
+
+            self.is_connected = False
+            if self._stop_event.wait(self.reconnect_delay):
+                break
+            logger.info("🔄 Reconnecting market stream...")
+
+    def _on_open(self, ws) -> None:
+        self.is_connected = True
+        logger.info("✅ Market stream connected")
+
+    def _on_message(self, ws, message: str) -> None:
+        self.handle_message(message)
+
+    def _on_error(self, ws, error) -> None:
+        logger.error(f"Market stream error: {error}")
+
+    def _on_close(self, ws, status_code, reason) -> None:
+        self.is_connected = False
+        logger.warning(f"Market stream closed ({status_code}: {reason})")
+
+    def handle_message(self, message: str) -> None:
+        """
+        Dispatch one raw combined-stream frame
+
+        Args:
+            message: Raw JSON text as received from the socket
+        """
+        self.last_message_time = time.time()
+        self.messages_received += 1
+
+        if self.record_path:
+            self._record(message)
+
+        try:
+            payload = json.loads(message)
+            data = payload.get('data', payload)
+
+            event = data.get('e')
+            if event == 'aggTrade':
+                if self.on_trade:
+                    self.on_trade(float(data['p']), float(data['q']), data['m'], data['T'])
+            elif event == 'kline':
+                if self.on_kline:
+                    kline = data['k']
+                    self.on_kline(kline_event_to_row(kline), bool(kline['x']))
+            elif event == 'depthUpdate':
+                if self.on_depth:
+                    self.on_depth(data)
+            elif 'b' in data and 'a' in data:
+                # bookTicker frames carry no event type
+                if self.on_book_ticker:
+                    self.on_book_ticker({
+                        'bid': float(data['b']),
+                        'bid_qty': float(data['B']),
+                        'ask': float(data['a']),
+                        'ask_qty': float(data['A'])
+                    })
+        except Exception as e:
+            logger.error(f"Error handling stream message: {e}")
+
+    def _record(self, message: str) -> None:
+        """Append a raw frame to the recording file"""
+        try:
+            with self._record_lock, open(self.record_path, 'a') as f:
+                f.write(message.strip() + '\n')
+        except Exception as e:
+            logger.warning(f"Could not record stream frame: {e}")
@@ -0,0 +1,154 @@
+"""
+Stream Replay Module
+Local WebSocket stand-in that replays recorded Binance stream frames
+
+Record frames by passing ``record_path`` to ``BinanceMarketStream``, then
+point a stream at ``ReplayServer.url`` to run it fully offline.
+"""
+
+import base64
+import hashlib
+import logging
+import socket
+import struct
+import time
+from threading import Thread, Event
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+_WS_GUID = '258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+
+
+def load_frames(filepath: str) -> List[str]:
+    """
+    Load recorded frames from a JSONL file
+
+    Args:
+        filepath: File written by ``BinanceMarketStream(record_path=...)``
+
+    Returns:
+        List of raw frame strings
+    """
+    with open(filepath, 'r') as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def _encode_text_frame(text: str) -> bytes:
+    """Encode an unmasked server-to-client text frame"""
+    payload = text.encode('utf-8')
+    length = len(payload)
+
+    if length < 126:
+        header = struct.pack('!BB', 0x81, length)
+    elif length < 65536:
+        header = struct.pack('!BBH', 0x81, 126, length)
+    else:
+        header = struct.pack('!BBQ', 0x81, 127, length)
+
+    return header + payload
+
+
+class ReplayServer:
+    """Minimal single-client WebSocket server that plays back recorded frames"""
+
+    def __init__(self, frames: List[str], host: str = '127.0.0.1', port: int = 0,
+                 interval: float = 0.0, hold_open: bool = True):
+        """
+        Initialize replay server
+
+        Args:
+            frames: Raw frames to send, in order
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+            interval: Delay between frames in seconds
+            hold_open: Keep the connection open after the last frame
+        """
+        self.frames = frames
+        self.interval = interval
+        self.hold_open = hold_open
+        self.frames_sent = 0
+
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._sock.bind((host, port))
+        self._sock.listen(1)
+        self.host, self.port = self._sock.getsockname()
+
+        self._stop_event = Event()
+        self._thread: Optional[Thread] = None
+        self._client: Optional[socket.socket] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL to hand to ``BinanceMarketStream(url=...)``"""
+        return f"ws://{self.host}:{self.port}/stream"
+
+    def start(self) -> 'ReplayServer':
+        """Start serving in a background thread"""
+        self._thread = Thread(target=self._serve, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close sockets"""
+        self._stop_event.set()
+        for sock in (self._client, self._sock):
+            if sock:
+                try:
+                    sock.close()
+                except OSError:
+                    pass
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def _serve(self) -> None:
+        try:
+            self._client, _ = self._sock.accept()
+            self._handshake(self._client)
+
+            for frame in self.frames:
+                if self._stop_event.is_set():
+                    return
+                self._client.sendall(_encode_text_frame(frame))
+                self.frames_sent += 1
+                if self.interval:
+                    time.sleep(self.interval)
+
+            if self.hold_open:
+                self._stop_event.wait()
+        except OSError as e:
+            if not self._stop_event.is_set():
+                logger.error(f"Replay server error: {e}")
+        finally:
+            if self._client:
+                try:
+                    self._client.close()
+                except OSError:
+                    pass
+
+    @staticmethod
+    def _handshake(client: socket.socket) -> None:
+        """Complete the HTTP upgrade handshake"""
+        request = b''
+        while b'\r\n\r\n' not in request:
+            chunk = client.recv(4096)
+            if not chunk:
+                raise OSError("Client closed during handshake")
+            request += chunk
+
+        key = ''
+        for line in request.decode('latin-1').split('\r\n'):
+            if line.lower().startswith('sec-websocket-key:'):
+                key = line.split(':', 1)[1].strip()
+
+        accept = base64.b64encode(
+            hashlib.sha1((key + _WS_GUID).encode()).digest()
+        ).decode()
+
+        client.sendall((
+            'HTTP/1.1 101 Switching Protocols\r\n'
+            'Upgrade: websocket\r\n'
+            'Connection: Upgrade\r\n'
+            f'Sec-WebSocket-Accept: {accept}\r\n\r\n'
+        ).encode())
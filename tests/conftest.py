@@ -0,0 +1,30 @@
+"""
+Shared test fixtures
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from benchmarks.fixtures import synthetic_klines  # noqa: E402
+
+
+@pytest.fixture(scope='session')
+def klines():
+    """Synthetic 1m klines crossing a UTC day boundary, as float columns"""
+    rows = synthetic_klines(600, seed=7, end_ms=1_700_006_400_000 + 300 * 60_000)
+    columns = np.array([[float(v) for v in row[:6]] for row in rows])
+    return {
+        'open_time': columns[:, 0].astype(np.int64),
+        'open': columns[:, 1],
+        'high': columns[:, 2],
+        'low': columns[:, 3],
+        'close': columns[:, 4],
+        'volume': columns[:, 5],
+    }
@@ -0,0 +1,88 @@
+"""
+Conversation memory: bounded window, rolling summary and flat prompt size
+"""
+
+import json
+
+from ai.conversation_memory import ConversationMemory, estimate_tokens
+
+
+def _reply(i: int) -> str:
+    return '```json\n' + json.dumps({
+        'action': 'BUY' if i % 2 else 'HOLD',
+        'confidence': 0.6 + (i % 4) / 10,
+        'reasoning': f"Cycle {i}: RSI and EMA crossover " + 'x' * 40,
+    }) + '\n```'
+
+
+def _prompt(i: int) -> str:
+    return f"Market update {i}: price 30000, RSI 55, trend bullish. " + 'y' * 200
+
+
+def _converse(memory: ConversationMemory, cycles: int) -> None:
+    for i in range(cycles):
+        memory.build_contents(_prompt(i))
+        memory.add('user', _prompt(i))
+        memory.add('ai', _reply(i))
+
+
+def test_window_stays_within_budget_and_turn_limit():
+    memory = ConversationMemory(token_budget=600, max_turns=6, summary_lines=5)
+    for i in range(200):
+        memory.add('user', _prompt(i))
+        memory.add('ai', _reply(i))
+        stats = memory.get_stats()
+        assert stats['turns'] <= 6
+        assert stats['window_tokens'] <= 600
+
+    stats = memory.get_stats()
+    assert stats['summarized_turns'] == 400 - stats['turns']
+    assert stats['summary_lines'] == 5
+
+
+def test_evicted_ai_turns_become_summary_lines():
+    memory = ConversationMemory(token_budget=10_000, max_turns=2, summary_lines=10)
+    memory.add('user', _prompt(0))
+    memory.add('ai', _reply(1))
+    memory.add('user', _prompt(2))
+    memory.add('ai', 'plain text answer')
+    memory.add('user', _prompt(3))
+    memory.add('ai', _reply(4))
+
+    # Only the evicted AI turns are summarized; prompts are dropped
+    lines = list(memory.summary)
+    assert len(lines) == 2
+    assert lines[0].endswith("BUY 70% - Cycle 1: RSI and EMA crossover " + 'x' * 40)
+    assert lines[1].endswith("plain text answer")
+    assert [turn['content'] for turn in memory.get_history()] == [_prompt(3), _reply(4)]
+
+    contents = memory.build_contents('next')
+    assert contents[0]['parts'][0]['text'].startswith("Summary of your earlier decisions:")
+    assert [c['role'] for c in contents] == ['user', 'user', 'model', 'user']
+
+
+def test_prompt_size_stays_flat_once_window_is_full():
+    memory = ConversationMemory(token_budget=800, max_turns=8, summary_lines=4)
+    _converse(memory, 20)
+    full = memory.get_stats()['last_prompt_tokens']
+
+    sizes = []
+    for i in range(20, 300):
+        memory.build_contents(_prompt(i))
+        sizes.append(memory.last_prompt_tokens)
+        memory.add('user', _prompt(i))
+        memory.add('ai', _reply(i))
+
+    budget = 800 + estimate_tokens(_prompt(299))
+    assert max(sizes) <= budget
+    assert max(sizes) - min(sizes) <= 0.2 * full
+    assert memory.get_stats()['max_prompt_tokens'] <= budget
+
+
+def test_clear_resets_window():
+    memory = ConversationMemory(token_budget=600, max_turns=6)
+    _converse(memory, 10)
+    memory.clear()
+    stats = memory.get_stats()
+    assert stats['turns'] == 0 and stats['summary_lines'] == 0 and stats['window_tokens'] == 0
+    assert len(memory.build_contents('hello')) == 1
@@ -0,0 +1,127 @@
+"""
+Decision cache: state keys, expiry, eviction, bypass and reuse
+"""
+
+import pytest
+
+import ai.decision_cache as decision_cache
+from ai.autonomous_trader import AutonomousAITrader
+from ai.decision_cache import DecisionCache
+from market.snapshot import MarketSnapshot
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(decision_cache.time, 'monotonic', clock)
+    return clock
+
+
+def _snapshot(**fields) -> MarketSnapshot:
+    values = dict(symbol='BTCUSDT', timeframe='1m', price=30000.0, atr=40.0, rsi=52.0,
+                  ema_fast=30010.0, ema_slow=29990.0, volume_ratio=1.0, trend='bullish',
+                  regime='normal', trigger='candle_close')
+    values.update(fields)
+    return MarketSnapshot(**values)
+
+
+def _decision(action: str = 'BUY') -> dict:
+    return {'action': action, 'confidence': 0.7, 'entry_price': 30000.0,
+            'stop_loss': 29960.0, 'take_profit': 30080.0, 'reasoning': 'test'}
+
+
+def test_key_quantizes_small_moves_together():
+    cache = DecisionCache(price_atr_fraction=0.25, rsi_band=5, volume_bands=(0.8, 1.5))
+    base = cache.key(_snapshot())
+
+    # Price bucket is 10 (0.25 ATR); RSI band 50-55; volume band 0.8-1.5
+    assert cache.key(_snapshot(price=30005.0, rsi=54.9, volume_ratio=1.4)) == base
+    assert cache.key(_snapshot(price=30010.0)) != base
+    assert cache.key(_snapshot(rsi=55.0)) != base
+    assert cache.key(_snapshot(volume_ratio=1.5)) != base
+    assert cache.key(_snapshot(ema_fast=29980.0)) != base
+    assert cache.key(_snapshot(regime='high')) != base
+
+
+def test_unusable_and_bypassed_snapshots_have_no_key(clock):
+    cache = DecisionCache()
+    assert cache.key(_snapshot(rsi=float('nan'))) is None
+    assert cache.key(_snapshot(atr=0.0)) is None
+    assert cache.key(_snapshot(trigger='trade_burst')) is None
+
+    cache.put(_snapshot(), _decision())
+    assert cache.get(_snapshot(trigger='trade_burst')) is None
+    assert not cache.put(_snapshot(trigger='trade_burst'), _decision())
+    assert cache.get_stats()['bypassed'] == 1
+
+
+def test_hit_shifts_price_levels(clock):
+    cache = DecisionCache()
+    cache.put(_snapshot(), _decision())
+    clock.now += 30
+
+    hit = cache.get(_snapshot(price=30004.0))
+
+    assert hit['cached'] and hit['cache_age'] == 30
+    assert (hit['entry_price'], hit['stop_loss'], hit['take_profit']) == (30004.0, 29964.0, 30084.0)
+    # The stored decision is untouched
+    assert cache.get(_snapshot())['entry_price'] == 30000.0
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = DecisionCache(ttl=120)
+    cache.put(_snapshot(), _decision())
+
+    clock.now += 120
+    assert cache.get(_snapshot()) is not None
+    clock.now += 1
+    assert cache.get(_snapshot()) is None
+
+    stats = cache.get_stats()
+    assert stats['expirations'] == 1 and stats['entries'] == 0
+
+
+def test_least_recently_used_state_is_evicted(clock):
+    cache = DecisionCache(max_entries=2)
+    first, second, third = (_snapshot(price=p) for p in (30000.0, 30100.0, 30200.0))
+    cache.put(first, _decision())
+    cache.put(second, _decision())
+    cache.get(first)  # Now the most recently used
+    cache.put(third, _decision())
+
+    assert cache.get(second) is None
+    assert cache.get(first) is not None and cache.get(third) is not None
+    assert cache.get_stats()['evictions'] == 1
+
+
+def test_hit_and_miss_stats(clock):
+    cache = DecisionCache()
+    cache.get(_snapshot())
+    cache.put(_snapshot(), _decision())
+    cache.get(_snapshot())
+    cache.get(_snapshot())
+
+    stats = cache.get_stats()
+    assert (stats['hits'], stats['misses'], stats['entries']) == (2, 1, 1)
+    assert stats['hit_rate'] == pytest.approx(2 / 3)
+
+
+def test_cached_trade_is_not_executed_again(clock):
+    cache = DecisionCache()
+    trader = AutonomousAITrader('test-key', decision_cache=cache, hedged=False)
+    trader.prefilter = None
+    trader._log_decision = lambda decision, market_data: None
+    cache.put(_snapshot(), {**_decision(), 'final_confidence': 0.7})
+
+    decision = trader.analyze_and_execute(_snapshot(), execute=True)
+
+    assert decision['cached'] and decision['action'] == 'BUY'
+    assert decision['execution']['status'] == 'HOLD_NO_EXECUTION'
@@ -0,0 +1,73 @@
+"""
+Fast mode equivalence: one model call with local risk rules against the
+analyse / refine / validate conversation, on recorded model responses
+"""
+
+import json
+import os
+
+import pytest
+
+from ai.autonomous_trader import AutonomousAITrader
+from market.snapshot import MarketSnapshot
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures', 'ai_responses.json')
+
+with open(FIXTURES, 'r') as f:
+    CASES = json.load(f)
+
+
+class RecordedResponse:
+    def __init__(self, text: str):
+        self.text = text
+
+
+class RecordedModels:
+    """Replays recorded replies in order and counts the calls"""
+
+    def __init__(self, replies):
+        self.replies = list(replies)
+        self.calls = 0
+
+    def generate_content(self, model, contents):
+        self.calls += 1
+        return RecordedResponse(self.replies.pop(0))
+
+
+class RecordedClient:
+    def __init__(self, replies):
+        self.models = RecordedModels(replies)
+
+
+def _decide(case, fast_mode: bool):
+    trader = AutonomousAITrader('test-key', fast_mode=fast_mode, hedged=False)
+    replies = case['fast'] if fast_mode else case['three_call']
+    trader.primary_client = RecordedClient(replies)
+    decision = trader._model_decision(MarketSnapshot(**case['market']))
+    return decision, trader.primary_client.models.calls
+
+
+@pytest.mark.parametrize('case', CASES, ids=[case['name'] for case in CASES])
+def test_fast_mode_matches_three_call_path(case):
+    fast, fast_calls = _decide(case, fast_mode=True)
+    full, full_calls = _decide(case, fast_mode=False)
+
+    assert (fast_calls, full_calls) == (1, 3)
+    assert fast['action'] == full['action']
+    assert fast['stop_loss'] == full['stop_loss']
+    assert fast['take_profit'] == full['take_profit']
+    assert fast['approval_status'] == full['approval_status']
+    assert fast['risk_validated'] == full['risk_validated']
+
+
+@pytest.mark.parametrize('case', CASES, ids=[case['name'] for case in CASES])
+def test_local_risk_rules_match_recorded_validation(case):
+    trader = AutonomousAITrader('test-key', fast_mode=True, hedged=False)
+    analysis = trader._parse_response(case['fast'][0])
+    analysis = trader._merge_refinement(analysis, analysis)
+    validation = trader._parse_response(case['three_call'][2], ('approval',))
+
+    checked = trader._check_risk_rules(analysis)
+
+    assert checked['approval_status'] == validation['approval']
+    assert checked['risk_validated'] == validation['is_compliant']
@@ -0,0 +1,80 @@
+"""
+Hedged AI requests: opt-in flag, latency-derived delay, bounded workers
+"""
+
+import time
+
+from ai.backup_services import BackupAIService
+from config.settings import AI_HEDGE_DEFAULT_DELAY, AI_HEDGE_MAX_WORKERS, AI_HEDGE_MIN_SAMPLES
+from market.snapshot import MarketSnapshot
+
+SNAPSHOT = MarketSnapshot(symbol='BTCUSDT', price=30000.0, rsi=55.0, ema_fast=30010.0,
+                          ema_slow=29990.0, atr=50.0, volume_ratio=1.2, trend='bullish')
+
+
+def _decision(source: str = None) -> dict:
+    decision = {'action': 'HOLD', 'confidence': 0.5, 'entry_price': 30000.0,
+                'stop_loss': 29950.0, 'take_profit': 30100.0, 'reasoning': 'test'}
+    if source:
+        decision['source'] = source
+    return decision
+
+
+def _service(hedged: bool, **kwargs) -> BackupAIService:
+    service = BackupAIService(hedged=hedged, **kwargs)
+    service.prefilter = None
+    service.add_service('backup', 'key', 'openai')
+    service._dispatch = lambda spec, market_data, prompt=None: _decision('backup')
+    return service
+
+
+def test_hedging_is_injected_not_read_from_settings():
+    serial = _service(hedged=False)
+    assert serial.get_analysis(SNAPSHOT)['source'] == 'backup'
+    assert serial.get_hedge_stats()['requests'] == 0
+
+    hedged = _service(hedged=True)
+    assert hedged.get_analysis(SNAPSHOT)['source'] == 'backup'
+    assert hedged.get_hedge_stats()['requests'] == 1
+
+
+def test_hedge_delay_follows_observed_latency():
+    service = _service(hedged=True)
+    assert service.latency_p95('gemini') == AI_HEDGE_DEFAULT_DELAY
+
+    for i in range(AI_HEDGE_MIN_SAMPLES * 2):
+        service._in_flight += 1
+        service._run_provider('gemini', lambda: (time.sleep(0.001 * (i % 4)), _decision())[1])
+
+    assert 0.0 < service.latency_p95('gemini') < 0.1
+    assert service._in_flight == 0
+
+
+def test_slow_primary_is_hedged_after_fixed_delay():
+    service = _service(hedged=True, hedge_delay=0.05)
+
+    def slow_gemini():
+        time.sleep(0.5)
+        return _decision()
+
+    decision = service.get_hedged_analysis(SNAPSHOT, primary=slow_gemini)
+
+    assert decision['source'] == 'backup'
+    stats = service.get_hedge_stats()
+    assert stats['hedged'] == 1 and stats['abandoned'] == 1
+
+
+def test_no_hedge_while_workers_are_busy():
+    service = _service(hedged=True, hedge_delay=0.02)
+    service._in_flight = AI_HEDGE_MAX_WORKERS  # Stragglers from earlier requests
+
+    def slow_gemini():
+        time.sleep(0.2)
+        return _decision()
+
+    decision = service.get_hedged_analysis(SNAPSHOT, primary=slow_gemini)
+
+    assert decision['source'] == 'gemini'
+    stats = service.get_hedge_stats()
+    assert stats['hedged'] == 0 and stats['hedges_skipped_busy'] > 0
+    assert service._in_flight == AI_HEDGE_MAX_WORKERS
@@ -0,0 +1,54 @@
+"""
+Indicator graph: shared per-bar results are cached once and read-only
+"""
+
+import numpy as np
+import pytest
+
+from indicators import series
+from indicators.graph import IndicatorGraph
+
+
+def _window(klines, count: int = 200):
+    return {name: klines[name][:count] for name in ('open_time', 'high', 'low', 'close', 'volume')}
+
+
+def test_memo_result_is_cached_and_read_only(klines):
+    graph = IndicatorGraph()
+    candles = _window(klines)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {'rsi': 55.0, 'bands': np.array([1.0, 2.0])}
+
+    first = graph.memo('BTCUSDT', '1m', candles, 'streaming', compute)
+    second = graph.memo('BTCUSDT', '1m', candles, 'streaming', compute)
+    assert len(calls) == 1
+    assert second['rsi'] == 55.0
+
+    with pytest.raises(TypeError):
+        first['rsi'] = 0.0
+    with pytest.raises(ValueError):
+        first['bands'][0] = 0.0
+    assert graph.memo('BTCUSDT', '1m', candles, 'streaming', compute)['rsi'] == 55.0
+
+
+def test_new_bar_recomputes(klines):
+    graph = IndicatorGraph()
+    results = iter([{'n': 1}, {'n': 2}])
+    assert graph.memo('BTCUSDT', '1m', _window(klines, 200), 'streaming', lambda: next(results))['n'] == 1
+    assert graph.memo('BTCUSDT', '1m', _window(klines, 201), 'streaming', lambda: next(results))['n'] == 2
+
+
+def test_nodes_share_intermediates(klines):
+    graph = IndicatorGraph()
+    candles = _window(klines)
+    sma = graph.evaluate('BTCUSDT', '1m', candles, 'sma', period=20)
+    misses = graph.get_stats()['misses']
+
+    upper, middle, lower = graph.evaluate('BTCUSDT', '1m', candles, 'bollinger', period=20, std_dev=2)
+    assert middle is sma
+    assert graph.get_stats()['misses'] == misses + 2  # bollinger and rolling_std only
+    np.testing.assert_allclose(upper, series.bollinger_series(candles['close'], 20, 2)[0])
+    assert not upper.flags.writeable
@@ -0,0 +1,94 @@
+"""
+Parity tests: the NumPy kernels in ``indicators`` against the pandas
+reference implementations
+"""
+
+import math
+
+import pandas as pd
+import pytest
+
+import indicators
+from indicators import reference
+
+REL = 1e-9
+
+# Every length up to well past the longest period, so the NaN warm-up
+# prefix and the first valid values are checked as well as a long series
+LENGTHS = list(range(1, 60)) + [599, 600]
+
+
+def assert_close(actual, expected, rel=REL):
+    if math.isnan(expected):
+        assert math.isnan(actual)
+    else:
+        assert actual == pytest.approx(expected, rel=rel, abs=1e-9)
+
+
+@pytest.mark.parametrize('period', [7, 14])
+def test_rsi_matches_reference(klines, period):
+    close = klines['close']
+    for n in LENGTHS:
+        assert_close(indicators.calculate_rsi(close[:n], period),
+                     reference.calculate_rsi(close[:n], period), rel=1e-7)
+
+
+@pytest.mark.parametrize('period', [9, 21, 50])
+def test_ema_matches_reference(klines, period):
+    close = klines['close']
+    for n in LENGTHS:
+        assert_close(indicators.calculate_ema(close[:n], period),
+                     reference.calculate_ema(close[:n], period))
+
+
+def test_atr_matches_reference(klines):
+    high, low, close = klines['high'], klines['low'], klines['close']
+    for n in LENGTHS:
+        assert_close(indicators.calculate_atr(high[:n], low[:n], close[:n], 14),
+                     reference.calculate_atr(high[:n], low[:n], close[:n], 14))
+
+
+def test_sma_matches_reference(klines):
+    close = klines['close']
+    for n in LENGTHS:
+        assert_close(indicators.calculate_sma(close[:n], 20), reference.calculate_sma(close[:n], 20))
+
+
+def test_bollinger_matches_reference(klines):
+    close = klines['close']
+    for n in LENGTHS:
+        actual = indicators.calculate_bollinger_bands(close[:n], 20, 2)
+        expected = reference.calculate_bollinger_bands(close[:n], 20, 2)
+        for value, reference_value in zip(actual, expected):
+            assert_close(value, reference_value, rel=1e-7)
+
+
+def test_macd_line_matches_pandas(klines):
+    close = klines['close']
+    series = pd.Series(close)
+    macd = series.ewm(span=12, adjust=False).mean() - series.ewm(span=26, adjust=False).mean()
+    for n in LENGTHS:
+        line = indicators.calculate_ema(close[:n], 12) - indicators.calculate_ema(close[:n], 26)
+        assert_close(line, macd.iloc[n - 1], rel=1e-7)
+
+
+def test_list_input_matches_array_input(klines):
+    close = klines['close']
+    as_list = close.tolist()
+    assert_close(indicators.calculate_rsi(as_list), indicators.calculate_rsi(close))
+    assert_close(indicators.calculate_ema(as_list, 21), indicators.calculate_ema(close, 21))
+    for value, expected in zip(indicators.calculate_bollinger_bands(as_list),
+                               indicators.calculate_bollinger_bands(close)):
+        assert_close(value, expected)
+
+
+def test_empty_input_is_nan():
+    assert math.isnan(indicators.calculate_ema([], 9))
+    assert math.isnan(indicators.calculate_rsi([], 14))
+    assert all(math.isnan(v) for v in indicators.calculate_bollinger_bands([], 20))
+
+
+def test_detect_trend():
+    assert indicators.detect_trend(2.0, 1.0) == 'bullish'
+    assert indicators.detect_trend(1.0, 2.0) == 'bearish'
+    assert indicators.detect_trend(1.0, 1.0) == 'neutral'
@@ -0,0 +1,59 @@
+"""
+Kline store: appends, gap inserts, and backfills reaching the disk
+"""
+
+import numpy as np
+
+from benchmarks.fixtures import ReplayClient, synthetic_klines
+from config.settings import KLINE_HISTORY_LIMIT
+from market.data_fetcher import MarketDataFetcher
+from market.kline_store import KlineStore
+from indicators.graph import IndicatorGraph
+
+# Last candle opens mid-day so the series spans two day files
+END_MS = 1_700_006_400_000 + 120 * 60_000
+
+
+def test_append_skips_stored_candles(tmp_path):
+    rows = synthetic_klines(300, end_ms=END_MS)
+    store = KlineStore(str(tmp_path))
+
+    assert store.append('BTCUSDT', '1m', rows[:200]) == 200
+    assert store.append('BTCUSDT', '1m', rows[150:]) == 100
+    assert store.append('BTCUSDT', '1m', rows) == 0
+
+    stored = store.read_range('BTCUSDT', '1m')
+    assert list(stored['open_time']) == [r[0] for r in rows]
+    assert len(store.days('BTCUSDT', '1m')) == 2
+
+
+def test_append_inserts_older_candles_into_their_day(tmp_path):
+    rows = synthetic_klines(300, end_ms=END_MS)
+    gap = slice(100, 220)  # Crosses the day boundary
+    store = KlineStore(str(tmp_path))
+    store.append('BTCUSDT', '1m', rows[:gap.start] + rows[gap.stop:])
+
+    assert store.append('BTCUSDT', '1m', rows[gap]) == 120
+
+    stored = store.read_range('BTCUSDT', '1m')
+    assert list(stored['open_time']) == [r[0] for r in rows]
+    assert np.allclose(stored['close'], [float(r[4]) for r in rows])
+    assert store.last_open_time('BTCUSDT', '1m') == rows[-1][0]
+
+
+def test_backfilled_gap_is_persisted(tmp_path):
+    rows = synthetic_klines(KLINE_HISTORY_LIMIT, end_ms=END_MS)
+    holed = rows[:50] + rows[60:]
+    client = ReplayClient({'BTCUSDT': rows}, visible=len(rows))
+    store = KlineStore(str(tmp_path))
+    fetcher = MarketDataFetcher(client, streaming=False, symbols=['BTCUSDT'],
+                                store=store, graph=IndicatorGraph(), order_book=False)
+
+    # The series and the store both miss 10 candles, e.g. after a stream outage
+    fetcher.buffer.load(holed)
+    store.append('BTCUSDT', '1m', holed[:-1])
+
+    assert fetcher._ensure_complete('BTCUSDT', '1m')
+    stored = store.read_range('BTCUSDT', '1m')
+    assert list(stored['open_time']) == [r[0] for r in rows[:-1]]
+    fetcher.close()
@@ -0,0 +1,55 @@
+"""
+Market data bus: regime cadence keeps publishing for exit monitoring
+"""
+
+from market.bus import MarketDataBus, TRIGGER_MONITOR
+from market.snapshot import MarketSnapshot
+
+
+class FixedRegime:
+    def __init__(self, regime: str):
+        self.regime = regime
+
+    def ingest(self, candles) -> str:
+        return self.regime
+
+
+def _snapshot() -> MarketSnapshot:
+    return MarketSnapshot(symbol='BTCUSDT', price=30000.0, candles={})
+
+
+def test_dead_regime_publishes_every_cycle_as_monitor():
+    bus = MarketDataBus(None, interval=60, regime=FixedRegime('dead'),
+                        cadence={'dead': 300, 'normal': None, 'high': 15})
+    subscription = bus.subscribe('exits', maxsize=10)
+
+    analysed = [bus._publish_regime_aware(_snapshot(), 'interval', scheduled=True) for _ in range(4)]
+
+    triggers = [subscription.get(timeout=0).trigger for _ in range(4)]
+    assert analysed == [True, False, False, False]
+    assert triggers == ['interval', TRIGGER_MONITOR, TRIGGER_MONITOR, TRIGGER_MONITOR]
+    assert bus.snapshots_published == 4
+    assert bus.skipped_cycles == 3
+
+
+def test_normal_regime_analyses_every_cycle():
+    bus = MarketDataBus(None, interval=60, regime=FixedRegime('normal'),
+                        cadence={'dead': 300, 'normal': None, 'high': 15})
+    subscription = bus.subscribe('exits', maxsize=10)
+
+    for _ in range(3):
+        bus._publish_regime_aware(_snapshot(), 'interval', scheduled=True)
+
+    assert [subscription.get(timeout=0).trigger for _ in range(3)] == ['interval'] * 3
+    assert bus.skipped_cycles == 0
+
+
+def test_triggered_snapshot_is_analysed_in_dead_regime():
+    bus = MarketDataBus(None, interval=60, regime=FixedRegime('dead'),
+                        cadence={'dead': 300, 'normal': None, 'high': 15})
+    subscription = bus.subscribe('exits', maxsize=10)
+
+    bus._publish_regime_aware(_snapshot(), 'interval', scheduled=True)
+    bus._publish_regime_aware(_snapshot(), 'trade_burst', scheduled=False)
+
+    assert [subscription.get(timeout=0).trigger for _ in range(2)] == ['interval', 'trade_burst']
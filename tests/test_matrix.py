@@ -0,0 +1,51 @@
+"""
+Watchlist matrix: vectorized features against the per-symbol functions
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+import indicators
+from config.settings import TRADING_CONFIG
+from indicators.matrix import WatchlistMatrix
+
+
+def _window(klines, count: int):
+    return {name: klines[name][-count:] for name in ('open_time', 'high', 'low', 'close', 'volume')}
+
+
+def test_features_match_per_symbol_functions(klines):
+    matrix = WatchlistMatrix(['FULL', 'SHORT', 'NONE'], 200)
+    matrix.set_row('FULL', _window(klines, 300))
+    matrix.set_row('SHORT', _window(klines, 10))
+    matrix.set_row('NONE', None)
+    features = matrix.features()
+
+    full = features[0]
+    close, high, low = klines['close'][-200:], klines['high'][-200:], klines['low'][-200:]
+    assert full['rsi'] == pytest.approx(indicators.calculate_rsi(close, TRADING_CONFIG['rsi_period']))
+    assert full['ema_fast'] == pytest.approx(indicators.calculate_ema(close, TRADING_CONFIG['ema_fast']))
+    assert full['atr'] == pytest.approx(
+        indicators.calculate_atr(high, low, close, TRADING_CONFIG['atr_period']))
+    volume = klines['volume']
+    assert full['volume_ratio'] == pytest.approx(volume[-1] / (volume[-20:].sum() / 20))
+
+    # Ten bars cannot cover the RSI, ATR or the 20-bar volume average
+    short = features[1]
+    assert math.isnan(short['rsi']) and math.isnan(short['atr'])
+    assert math.isnan(short['volume_ratio'])
+    assert short['price'] == klines['close'][-1]
+
+    empty = features[2]
+    assert empty['open_time'] == 0
+    assert all(math.isnan(empty[field]) for field in ('price', 'rsi', 'ema_fast', 'atr', 'volume_ratio'))
+
+
+def test_zero_volume_ratio_is_one(klines):
+    window = _window(klines, 50)
+    window['volume'] = np.zeros(50)
+    matrix = WatchlistMatrix(['QUIET'], 50)
+    matrix.set_row('QUIET', window)
+    assert matrix.features()[0]['volume_ratio'] == 1.0
@@ -0,0 +1,114 @@
+"""
+OHLCV ring buffer: load, live updates, wrap-around, merges and gaps
+"""
+
+import numpy as np
+import pytest
+
+from benchmarks.fixtures import synthetic_klines
+from market.ohlcv_buffer import OHLCVBuffer
+
+MINUTE_MS = 60_000
+END_MS = 1_700_006_400_000
+
+
+def _closes(rows):
+    return [float(r[4]) for r in rows]
+
+
+def test_load_and_window():
+    rows = synthetic_klines(30, end_ms=END_MS)
+    buffer = OHLCVBuffer(50)
+    buffer.load(rows)
+
+    assert len(buffer) == 30
+    assert buffer.last_open_time == END_MS
+    assert list(buffer.closes) == _closes(rows)
+
+    window = buffer.window(5)
+    assert list(window['open_time']) == [r[0] for r in rows[-5:]]
+    assert list(window['high']) == [float(r[2]) for r in rows[-5:]]
+    assert buffer.to_rows()[0] == [rows[0][0], *map(float, rows[0][1:6])]
+
+
+def test_update_overwrites_open_candle_and_ignores_stale_rows():
+    rows = synthetic_klines(10, end_ms=END_MS)
+    buffer = OHLCVBuffer(20)
+    buffer.load(rows)
+
+    tick = list(rows[-1])
+    tick[4] = '12345.0'
+    buffer.update(tick)
+    assert len(buffer) == 10 and buffer.closes[-1] == 12345.0
+
+    buffer.update(rows[3])  # Older than the last candle
+    assert len(buffer) == 10 and buffer.closes[-1] == 12345.0
+
+    new = [END_MS + MINUTE_MS, '1', '2', '0.5', '1.5', '10']
+    buffer.update(new)
+    assert len(buffer) == 11
+    assert buffer.last_open_time == END_MS + MINUTE_MS
+
+
+def test_wrap_keeps_newest_candles_contiguous():
+    rows = synthetic_klines(37, end_ms=END_MS)
+    buffer = OHLCVBuffer(10)
+    for row in rows:
+        buffer.update(row)
+
+    assert len(buffer) == 10
+    assert list(buffer.open_times) == [r[0] for r in rows[-10:]]
+    assert list(buffer.closes) == _closes(rows[-10:])
+    # Views are single slices of the mirrored storage, not copies
+    assert buffer.window()['close'].base is not None
+    assert buffer.window(3)['close'].flags['C_CONTIGUOUS']
+
+
+def test_window_views_follow_updates():
+    rows = synthetic_klines(5, end_ms=END_MS)
+    buffer = OHLCVBuffer(5)
+    buffer.load(rows)
+    view = buffer.window()['close']
+
+    tick = list(rows[-1])
+    tick[4] = '1.0'
+    buffer.update(tick)
+    assert view[-1] == 1.0
+
+
+def test_merge_inserts_backfill_and_keeps_existing():
+    rows = synthetic_klines(40, end_ms=END_MS)
+    buffer = OHLCVBuffer(35)
+    buffer.load(rows[:10] + rows[20:])
+    assert buffer.find_gaps(MINUTE_MS) == [(rows[10][0], rows[19][0])]
+
+    stale = list(rows[25])
+    stale[4] = '1.0'
+    buffer.merge(rows[10:20] + [stale])
+
+    assert buffer.find_gaps(MINUTE_MS) == []
+    # Only the newest ``capacity`` candles survive; existing rows win
+    assert list(buffer.open_times) == [r[0] for r in rows[-35:]]
+    assert list(buffer.closes) == _closes(rows[-35:])
+
+
+def test_find_gaps_reports_each_hole():
+    rows = synthetic_klines(20, end_ms=END_MS)
+    buffer = OHLCVBuffer(20)
+    buffer.load(rows[:5] + rows[6:12] + rows[15:])
+    assert buffer.find_gaps(MINUTE_MS) == [(rows[5][0], rows[5][0]), (rows[12][0], rows[14][0])]
+
+
+def test_empty_buffer():
+    buffer = OHLCVBuffer(5)
+    assert len(buffer) == 0
+    assert buffer.find_gaps(MINUTE_MS) == []
+    assert all(len(column) == 0 for column in buffer.window().values())
+    with pytest.raises(IndexError):
+        buffer.last_open_time
+    with pytest.raises(ValueError):
+        OHLCVBuffer(0)
+
+    buffer.load(synthetic_klines(3, end_ms=END_MS))
+    buffer.clear()
+    assert len(buffer) == 0 and np.size(buffer.closes) == 0
@@ -0,0 +1,53 @@
+"""
+Local order book: snapshot sync and buffered event replay
+"""
+
+from market.order_book import LocalOrderBook
+
+
+def _event(first: int, last: int, bids=(), asks=()) -> dict:
+    return {'e': 'depthUpdate', 's': 'BTCUSDT', 'U': first, 'u': last,
+            'b': [list(level) for level in bids], 'a': [list(level) for level in asks]}
+
+
+def _snapshot(update_id: int) -> dict:
+    return {'lastUpdateId': update_id,
+            'bids': [['100.0', '1.0'], ['99.0', '2.0']],
+            'asks': [['101.0', '1.5'], ['102.0', '3.0']]}
+
+
+def test_buffered_events_replay_on_snapshot():
+    book = LocalOrderBook('BTCUSDT')
+    for event in (_event(90, 100), _event(101, 105, bids=[('100.5', '0.5')]), _event(106, 110)):
+        assert not book.apply_diff(event)
+
+    assert book.apply_snapshot(_snapshot(103))
+    assert book.last_update_id == 110
+    assert book.get_features()['bid'] == 100.5
+
+
+def test_gap_during_replay_keeps_events_for_next_snapshot():
+    book = LocalOrderBook('BTCUSDT')
+    events = [_event(101, 105), _event(108, 112, asks=[('100.8', '1.0')]), _event(113, 120)]
+    for event in events:
+        book.apply_diff(event)
+
+    # 106-107 are missing after the first event: the book must not sync
+    assert not book.apply_snapshot(_snapshot(100))
+    assert book.needs_snapshot
+    assert book.get_features() == {}
+    assert list(book._pending) == events[1:]
+
+    # A later snapshot connects to the kept events
+    assert book.apply_snapshot(_snapshot(110))
+    assert book.last_update_id == 120
+    assert book.get_features()['ask'] == 100.8
+
+
+def test_gap_on_live_stream_unsyncs():
+    book = LocalOrderBook('BTCUSDT')
+    book.apply_snapshot(_snapshot(100))
+
+    assert book.apply_diff(_event(101, 102))
+    assert not book.apply_diff(_event(110, 111))
+    assert book.needs_snapshot and book.resyncs == 1
@@ -0,0 +1,62 @@
+"""
+Pre-filter: which snapshots reach the model at the default threshold
+"""
+
+import math
+
+import pytest
+
+from ai.prefilter import PreFilter
+from config.settings import PREFILTER_MIN_SCORE
+from market.snapshot import MarketSnapshot
+from trading.auto_engine import score_setup
+
+
+def _snapshot(trend: str, volume_ratio: float, rsi: float, **fields) -> MarketSnapshot:
+    ema_fast, ema_slow, price = {
+        'bullish': (30010.0, 29990.0, 30020.0),
+        'bearish': (29990.0, 30010.0, 29980.0),
+        'mixed': (30010.0, 29990.0, 29980.0),  # Fast EMA up, price under slow EMA
+    }[trend]
+    values = dict(price=price, ema_fast=ema_fast, ema_slow=ema_slow, rsi=rsi, atr=40.0,
+                  volume=100.0 * volume_ratio, avg_volume=100.0, volume_ratio=volume_ratio)
+    values.update(fields)
+    return MarketSnapshot(**values)
+
+
+@pytest.mark.parametrize('trend, volume_ratio, rsi, reaches_model', [
+    # Aligned trend with above-average volume: the setups worth a model call
+    ('bullish', 1.6, 55, True),
+    ('bullish', 1.1, 55, True),
+    ('bearish', 1.3, 45, True),
+    ('bearish', 1.1, 45, True),
+    ('bullish', 1.1, 75, True),   # Overbought needs at least some volume
+    ('bearish', 1.3, 25, True),
+    # No volume confirmation, extremes without volume, or no trend
+    ('bullish', 0.8, 55, False),  # Strong trend alone no longer passes
+    ('bearish', 0.9, 45, False),
+    ('bearish', 1.1, 25, False),
+    ('mixed', 1.6, 55, False),
+    ('mixed', 0.8, 55, False),
+])
+def test_default_threshold(trend, volume_ratio, rsi, reaches_model):
+    prefilter = PreFilter()
+    decision = prefilter.screen(_snapshot(trend, volume_ratio, rsi))
+
+    assert (decision is None) == reaches_model
+    if decision is not None:
+        assert decision['action'] == 'HOLD' and decision['prefiltered']
+        assert decision['setup_score'] < PREFILTER_MIN_SCORE
+
+
+def test_signal_excludes_fixed_placeholders():
+    scores = score_setup(_snapshot('bullish', 0.8, 55))
+    assert scores['rr'] + scores['news'] == 25
+    assert scores['signal'] == scores['total'] - 25 == 50
+
+
+def test_warmup_and_pass_triggers():
+    prefilter = PreFilter()
+    assert prefilter.screen(_snapshot('bullish', 1.6, math.nan))['reasoning'].startswith('Pre-filter: indicators')
+    assert prefilter.screen(_snapshot('mixed', 0.5, 55, trigger='trade_burst')) is None
+    assert prefilter.get_stats()['skip_reasons'] == {'warmup': 1}
@@ -0,0 +1,121 @@
+"""
+Candle scheduler: exchange clock alignment, waiting and freshness polling
+"""
+
+import time
+from threading import Event, Thread
+
+from market.bus import MarketDataBus
+from market.scheduler import CandleScheduler
+from market.snapshot import MarketSnapshot
+
+MINUTE_MS = 60_000
+
+
+class _ServerClock:
+    """``get_server_time`` running ``offset_ms`` ahead of the local clock"""
+
+    def __init__(self, offset_ms: float):
+        self.offset_ms = offset_ms
+
+    def get_server_time(self):
+        return {'serverTime': int(time.time() * 1000 + self.offset_ms)}
+
+
+def _offset_to_close(seconds_before: float) -> float:
+    """Clock offset that puts the exchange ``seconds_before`` ahead of a minute close"""
+    now_ms = time.time() * 1000
+    target = now_ms - now_ms % MINUTE_MS + 2 * MINUTE_MS - seconds_before * 1000
+    return target - now_ms
+
+
+def test_boundary_follows_the_server_clock():
+    offset = _offset_to_close(20)
+    scheduler = CandleScheduler(_ServerClock(offset), timeframe='1m')
+    scheduler.sync_clock()
+    assert abs(scheduler.offset_ms - offset) < 50
+
+    boundary = scheduler.next_close_ms()
+    assert boundary % MINUTE_MS == 0
+    assert 19_900 < boundary - scheduler.exchange_now_ms() <= 20_000
+
+    # The local clock alone would pick a different close
+    local_ms = time.time() * 1000
+    assert boundary != int(local_ms - local_ms % MINUTE_MS) + MINUTE_MS
+
+
+def test_lead_fires_before_the_close():
+    scheduler = CandleScheduler(_ServerClock(_offset_to_close(20)), timeframe='1m', lead_seconds=25)
+    scheduler.sync_clock()
+    # Inside the lead window the scheduler has already fired for this close
+    assert scheduler.next_close_ms() - scheduler.exchange_now_ms() > MINUTE_MS - 10_000
+
+
+def test_wait_returns_at_the_boundary():
+    scheduler = CandleScheduler(_ServerClock(_offset_to_close(0.2)), timeframe='1m')
+    started = time.time()
+    boundary = scheduler.wait_for_next_close()
+    elapsed = time.time() - started
+
+    assert boundary is not None and boundary % MINUTE_MS == 0
+    assert 0.1 < elapsed < 1.0
+    assert scheduler.exchange_now_ms() >= boundary
+    assert len(scheduler.jitter_ms) == 1 and 0 <= scheduler.jitter_ms[0] < 100
+
+
+def test_wait_gives_up_after_max_wait():
+    scheduler = CandleScheduler(_ServerClock(_offset_to_close(30)), timeframe='1m')
+    started = time.time()
+    assert scheduler.wait_for_next_close(max_wait=0.2) is None
+    assert 0.15 < time.time() - started < 1.0
+    assert not scheduler.jitter_ms
+
+
+def test_wait_returns_none_when_stopped():
+    scheduler = CandleScheduler(_ServerClock(_offset_to_close(30)), timeframe='1m')
+    stop = Event()
+    Thread(target=lambda: (time.sleep(0.1), stop.set()), daemon=True).start()
+    started = time.time()
+    assert scheduler.wait_for_next_close(stop) is None
+    assert time.time() - started < 1.0
+
+
+class _StaleFetcher:
+    def __init__(self):
+        self.calls = 0
+
+    def get_market_data(self):
+        self.calls += 1
+        return MarketSnapshot(symbol='BTCUSDT', price=30000.0,
+                              candles={'open_time': [0]})
+
+
+class _OneCloseScheduler(CandleScheduler):
+    """Reaches one close immediately, then stops the bus"""
+
+    def __init__(self, bus_stop: Event, **kwargs):
+        super().__init__(_ServerClock(0), timeframe='1m', **kwargs)
+        self.bus_stop = bus_stop
+        self.closes = 0
+
+    def wait_for_next_close(self, stop_event=None, max_wait=None):
+        self.closes += 1
+        if self.closes > 1:
+            self.bus_stop.set()
+            return None
+        return 60 * MINUTE_MS
+
+
+def test_stale_bar_is_fetched_a_bounded_number_of_times():
+    fetcher = _StaleFetcher()
+    bus = MarketDataBus(fetcher)
+    bus.scheduler = _OneCloseScheduler(bus._stop_event, fresh_attempts=3, fresh_poll=0.05)
+    subscription = bus.subscribe('analysis')
+
+    started = time.time()
+    bus._produce_on_candle_close()
+
+    assert fetcher.calls == 3
+    assert 0.09 < time.time() - started < 1.0
+    # The stale snapshot is still published rather than dropping the close
+    assert subscription.get(timeout=0).trigger == 'candle_close'
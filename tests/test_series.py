@@ -0,0 +1,129 @@
+"""
+Parity tests: full-series indicator functions against the pandas reference
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.fixtures import synthetic_klines
+from indicators import series
+
+RTOL = 1e-9
+
+
+def assert_series_close(actual, expected, rtol=RTOL):
+    expected = np.asarray(expected, dtype=np.float64)
+    assert actual.shape == expected.shape
+    np.testing.assert_array_equal(np.isnan(actual), np.isnan(expected))
+    np.testing.assert_allclose(actual, expected, rtol=rtol, atol=1e-9, equal_nan=True)
+
+
+@pytest.fixture(scope='module')
+def long_close():
+    """Closes spanning several ``_EMA_BLOCK`` blocks plus a partial one"""
+    rows = synthetic_klines(series._EMA_BLOCK * 5 + 37, seed=11)
+    return np.array([float(row[4]) for row in rows])
+
+
+@pytest.mark.parametrize('period', [9, 21, 200])
+def test_ema_crosses_block_boundaries(long_close, period):
+    expected = pd.Series(long_close).ewm(span=period, adjust=False).mean()
+    assert_series_close(series.ema_series(long_close, period), expected, rtol=1e-8)
+
+
+@pytest.mark.parametrize('n', [1, 2, series._EMA_BLOCK - 1, series._EMA_BLOCK, series._EMA_BLOCK + 1])
+def test_ema_around_block_size(long_close, n):
+    close = long_close[:n]
+    expected = pd.Series(close).ewm(span=21, adjust=False).mean()
+    assert_series_close(series.ema_series(close, 21), expected, rtol=1e-8)
+
+
+def test_sma_matches_pandas(klines):
+    close = klines['close']
+    assert_series_close(series.sma_series(close, 20), pd.Series(close).rolling(20).mean())
+
+
+def test_rsi_matches_pandas(klines):
+    deltas = pd.Series(klines['close']).diff()
+    gain = deltas.where(deltas > 0, 0).rolling(14).mean()
+    loss = (-deltas.where(deltas < 0, 0)).rolling(14).mean()
+    expected = 100 - 100 / (1 + gain / loss)
+    assert_series_close(series.rsi_series(klines['close'], 14), expected, rtol=1e-7)
+
+
+def test_atr_matches_pandas(klines):
+    df = pd.DataFrame(klines)
+    true_range = pd.concat([
+        df['high'] - df['low'],
+        (df['high'] - df['close'].shift()).abs(),
+        (df['low'] - df['close'].shift()).abs()
+    ], axis=1).max(axis=1)
+    assert_series_close(series.true_range_series(df['high'], df['low'], df['close']), true_range)
+    assert_series_close(series.atr_series(df['high'], df['low'], df['close'], 14),
+                        true_range.rolling(14).mean())
+
+
+def test_bollinger_matches_pandas(klines):
+    close = pd.Series(klines['close'])
+    middle = close.rolling(20).mean()
+    std = close.rolling(20).std()
+    upper, mid, lower = series.bollinger_series(close, 20, 2)
+    assert_series_close(mid, middle)
+    assert_series_close(upper, middle + 2 * std, rtol=1e-8)
+    assert_series_close(lower, middle - 2 * std, rtol=1e-8)
+
+
+def test_macd_matches_pandas(long_close):
+    close = pd.Series(long_close)
+    macd = close.ewm(span=12, adjust=False).mean() - close.ewm(span=26, adjust=False).mean()
+    signal = macd.ewm(span=9, adjust=False).mean()
+    line, signal_line, hist = series.macd_series(long_close)
+    assert_series_close(line, macd, rtol=1e-6)
+    assert_series_close(signal_line, signal, rtol=1e-6)
+    np.testing.assert_allclose(hist, macd - signal, atol=1e-6)
+
+
+def test_vwap_resets_each_session(klines):
+    df = pd.DataFrame(klines)
+    df['session'] = df['open_time'] - df['open_time'] % 86_400_000
+    df['pv'] = (df['high'] + df['low'] + df['close']) / 3 * df['volume']
+    grouped = df.groupby('session')
+    expected = grouped['pv'].cumsum() / grouped['volume'].cumsum()
+    assert df['session'].nunique() == 2
+
+    actual = series.vwap_series(df['open_time'], df['high'], df['low'], df['close'], df['volume'])
+    assert_series_close(actual, expected)
+
+
+def test_stochastic_matches_pandas(klines):
+    df = pd.DataFrame(klines)
+    highest = df['high'].rolling(14).max()
+    lowest = df['low'].rolling(14).min()
+    k = 100 * (df['close'] - lowest) / (highest - lowest)
+    d = k.rolling(3).mean()
+
+    value_k, value_d = series.stochastic_series(df['high'], df['low'], df['close'], 14, 3)
+    assert_series_close(value_k, k)
+    assert_series_close(value_d, d, rtol=1e-7)
+
+
+def test_stochastic_flat_range_is_fifty():
+    flat = np.full(20, 100.0)
+    value_k, _ = series.stochastic_series(flat, flat, flat, 14, 3)
+    assert np.isnan(value_k[:13]).all()
+    assert (value_k[13:] == 50.0).all()
+
+
+def test_obv_matches_pandas(klines):
+    df = pd.DataFrame(klines)
+    expected = (np.sign(df['close'].diff()).fillna(0) * df['volume']).cumsum()
+    assert_series_close(series.obv_series(df['close'], df['volume']), expected, rtol=1e-7)
+
+
+def test_short_and_empty_inputs():
+    assert series.ema_series([], 9).shape == (0,)
+    assert series.vwap_series([], [], [], [], []).shape == (0,)
+    assert series.obv_series([], []).shape == (0,)
+    assert np.isnan(series.sma_series([1.0, 2.0], 5)).all()
+    assert np.isnan(series.rolling_std_series([1.0, 2.0], 5)).all()
@@ -0,0 +1,70 @@
+"""
+Market snapshots: immutability, encoding and candles detached from the buffer
+"""
+
+import math
+import pickle
+
+import numpy as np
+import pytest
+
+from benchmarks.fixtures import ReplayClient, synthetic_klines
+from config.settings import KLINE_HISTORY_LIMIT
+from indicators.graph import IndicatorGraph
+from market.data_fetcher import MarketDataFetcher
+from market.kline_store import KlineStore
+from market.ohlcv_buffer import OHLCVBuffer
+from market.snapshot import MarketSnapshot
+
+
+def test_fields_are_read_only_and_replace_copies():
+    snapshot = MarketSnapshot(symbol='BTCUSDT', price=30000.0, rsi=55.0)
+    with pytest.raises(AttributeError):
+        snapshot.price = 1.0
+    with pytest.raises(TypeError):
+        MarketSnapshot(unknown=1)
+
+    tagged = snapshot.replace(trigger='trade_burst')
+    assert tagged.trigger == 'trade_burst' and snapshot.trigger is None
+    assert tagged.price == snapshot.price
+
+
+def test_bytes_and_pickle_round_trip():
+    snapshot = MarketSnapshot(symbol='BTCUSDT', timeframe='1m', price=30000.0, rsi=math.nan,
+                              complete=True, regime='dead')
+    decoded = MarketSnapshot.from_bytes(snapshot.to_bytes())
+    assert decoded.to_dict(json_safe=True) == snapshot.to_dict(json_safe=True)
+    assert decoded.atr is None and math.isnan(decoded.rsi)
+    assert pickle.loads(pickle.dumps(snapshot)).to_bytes() == snapshot.to_bytes()
+
+
+def test_frozen_window_is_a_read_only_copy():
+    rows = synthetic_klines(10, end_ms=1_700_000_000_000)
+    buffer = OHLCVBuffer(8)
+    buffer.load(rows[:8])
+
+    frozen = buffer.frozen_window()
+    close = frozen['close'].copy()
+    buffer.update(rows[8])
+
+    assert np.array_equal(frozen['close'], close)
+    assert not np.array_equal(buffer.window()['close'], close)
+    with pytest.raises(ValueError):
+        frozen['close'][0] = 0.0
+
+
+def test_published_candles_do_not_follow_the_buffer(tmp_path):
+    rows = synthetic_klines(KLINE_HISTORY_LIMIT + 1)
+    client = ReplayClient({'BTCUSDT': rows}, visible=KLINE_HISTORY_LIMIT)
+    fetcher = MarketDataFetcher(client, streaming=False, symbols=['BTCUSDT'],
+                                store=KlineStore(str(tmp_path)), graph=IndicatorGraph(),
+                                order_book=False)
+
+    first = fetcher.get_market_data()
+    closes = first.candles['close'].copy()
+    client.advance()
+    second = fetcher.get_market_data()
+
+    assert np.array_equal(first.candles['close'], closes)
+    assert second.candles['open_time'][-1] > first.candles['open_time'][-1]
+    fetcher.close()
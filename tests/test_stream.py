@@ -0,0 +1,118 @@
+"""
+Market stream against the local replay server
+"""
+
+import json
+import time
+from threading import Event
+
+from market.stream import BinanceMarketStream
+from market.stream_replay import ReplayServer, load_frames
+
+
+def _kline(open_time: int, close: str, closed: bool) -> str:
+    return json.dumps({'stream': 'btcusdt@kline_1m', 'data': {
+        'e': 'kline', 's': 'BTCUSDT', 'k': {
+            't': open_time, 'o': '100.0', 'h': '101.0', 'l': '99.0',
+            'c': close, 'v': '12.5', 'T': open_time + 59_999, 'q': '1250.0',
+            'n': 40, 'V': '6.0', 'Q': '600.0', 'B': '0', 'x': closed}}})
+
+
+def _book_ticker(bid: str, ask: str) -> str:
+    return json.dumps({'stream': 'btcusdt@bookTicker', 'data': {
+        'u': 1, 's': 'BTCUSDT', 'b': bid, 'B': '1.0', 'a': ask, 'A': '2.0'}})
+
+
+def _depth(first: int, last: int) -> str:
+    return json.dumps({'stream': 'btcusdt@depth@100ms', 'data': {
+        'e': 'depthUpdate', 's': 'BTCUSDT', 'U': first, 'u': last,
+        'b': [['100.0', '1.0']], 'a': [['101.0', '1.0']]}})
+
+
+FRAMES = [
+    _kline(1_700_000_000_000, '100.5', False),
+    _book_ticker('100.4', '100.6'),
+    _depth(1, 5),
+    _kline(1_700_000_000_000, '100.7', True),
+]
+
+
+class _Collector:
+    def __init__(self, expected: int):
+        self.klines, self.tickers, self.depth = [], [], []
+        self.expected = expected
+        self.done = Event()
+
+    def _tick(self):
+        if len(self.klines) + len(self.tickers) + len(self.depth) >= self.expected:
+            self.done.set()
+
+    def on_kline(self, row, is_closed):
+        self.klines.append((row, is_closed))
+        self._tick()
+
+    def on_book_ticker(self, ticker):
+        self.tickers.append(ticker)
+        self._tick()
+
+    def on_depth(self, event):
+        self.depth.append(event)
+        self._tick()
+
+
+def _stream(server: ReplayServer, collector: _Collector, **kwargs) -> BinanceMarketStream:
+    return BinanceMarketStream('BTCUSDT', '1m',
+                               on_kline=collector.on_kline,
+                               on_book_ticker=collector.on_book_ticker,
+                               on_depth=collector.on_depth,
+                               url=server.url, **kwargs)
+
+
+def test_replayed_frames_reach_every_callback(tmp_path):
+    record_path = str(tmp_path / 'frames.jsonl')
+    collector = _Collector(len(FRAMES))
+    server = ReplayServer(FRAMES).start()
+    stream = _stream(server, collector, reconnect_delay=0.1, record_path=record_path)
+    stream.start()
+    try:
+        assert collector.done.wait(5)
+    finally:
+        server.stop()
+        stream.stop()
+
+    assert [closed for _, closed in collector.klines] == [False, True]
+    assert collector.klines[-1][0][0] == 1_700_000_000_000
+    assert collector.klines[-1][0][4] == '100.7'
+    assert collector.tickers == [{'bid': 100.4, 'bid_qty': 1.0, 'ask': 100.6, 'ask_qty': 2.0}]
+    assert collector.depth[0]['U'] == 1 and collector.depth[0]['u'] == 5
+
+    # The recording replays to the same frames
+    assert load_frames(record_path) == FRAMES
+
+
+def test_stream_reconnects_after_server_drops():
+    second = [_kline(1_700_000_060_000, '101.2', True)]
+    collector = _Collector(len(FRAMES) + len(second))
+
+    first_server = ReplayServer(FRAMES, hold_open=False).start()
+    port = first_server.port
+    # The delay gives the first server time to close its listener before the retry
+    stream = _stream(first_server, collector, reconnect_delay=0.5)
+    stream.start()
+    try:
+        deadline = time.time() + 5
+        while len(collector.klines) < 2 and time.time() < deadline:
+            time.sleep(0.01)
+        first_server.stop()
+
+        second_server = ReplayServer(second, port=port).start()
+        try:
+            assert collector.done.wait(5)
+            assert stream.is_connected
+        finally:
+            second_server.stop()
+    finally:
+        stream.stop()
+
+    assert collector.klines[-1][0][0] == 1_700_000_060_000
+    assert stream.messages_received == len(FRAMES) + len(second)
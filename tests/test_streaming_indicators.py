@@ -0,0 +1,141 @@
+"""
+Parity tests: streaming indicators fed bar by bar against the pandas
+reference implementations
+"""
+
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from indicators import reference
+from indicators.streaming import (
+    StreamingATR, StreamingEMA, StreamingIndicatorSet, StreamingMACD, StreamingOBV,
+    StreamingRSI, StreamingStochastic, StreamingVWAP
+)
+from config.settings import TRADING_CONFIG
+
+REL = 1e-9
+
+
+def assert_close(actual, expected, rel=REL):
+    if math.isnan(expected):
+        assert math.isnan(actual)
+    else:
+        assert actual == pytest.approx(expected, rel=rel, abs=1e-9)
+
+
+@pytest.mark.parametrize('period', [9, 21])
+def test_ema_matches_reference(klines, period):
+    close = klines['close']
+    ema = StreamingEMA(period)
+    for i in range(len(close)):
+        assert_close(ema.update(close[i]), reference.calculate_ema(close[:i + 1], period))
+
+
+def test_rsi_matches_reference(klines):
+    close = klines['close']
+    rsi = StreamingRSI(14)
+    for i in range(len(close)):
+        value = rsi.update(close[i])
+        if i + 1 >= 14:
+            assert_close(value, reference.calculate_rsi(close[:i + 1], 14), rel=1e-7)
+        else:
+            assert math.isnan(value)
+
+
+def test_atr_matches_reference(klines):
+    high, low, close = klines['high'], klines['low'], klines['close']
+    atr = StreamingATR(14)
+    for i in range(len(close)):
+        expected = reference.calculate_atr(high[:i + 1], low[:i + 1], close[:i + 1], 14)
+        assert_close(atr.update(high[i], low[i], close[i]), expected, rel=1e-7)
+
+
+def test_macd_matches_pandas(klines):
+    close = pd.Series(klines['close'])
+    macd_line = close.ewm(span=12, adjust=False).mean() - close.ewm(span=26, adjust=False).mean()
+    signal = macd_line.ewm(span=9, adjust=False).mean()
+
+    macd = StreamingMACD(12, 26, 9)
+    for i, price in enumerate(klines['close']):
+        line, sig, hist = macd.update(price)
+        assert_close(line, macd_line.iloc[i], rel=1e-7)
+        assert_close(sig, signal.iloc[i], rel=1e-7)
+        assert_close(hist, macd_line.iloc[i] - signal.iloc[i], rel=1e-6)
+
+
+def test_vwap_matches_pandas(klines):
+    df = pd.DataFrame(klines)
+    df['session'] = df['open_time'] - df['open_time'] % 86_400_000
+    df['pv'] = (df['high'] + df['low'] + df['close']) / 3 * df['volume']
+    grouped = df.groupby('session')
+    expected = grouped['pv'].cumsum() / grouped['volume'].cumsum()
+    assert df['session'].nunique() == 2
+
+    vwap = StreamingVWAP()
+    for i, row in df.iterrows():
+        value = vwap.update(int(row['open_time']), row['high'], row['low'], row['close'], row['volume'])
+        assert_close(value, expected.iloc[i])
+
+
+def test_stochastic_matches_pandas(klines):
+    df = pd.DataFrame(klines)
+    highest = df['high'].rolling(14).max()
+    lowest = df['low'].rolling(14).min()
+    k = 100 * (df['close'] - lowest) / (highest - lowest)
+    d = k.rolling(3).mean()
+
+    stochastic = StreamingStochastic(14, 3)
+    for i, row in df.iterrows():
+        value_k, value_d = stochastic.update(row['high'], row['low'], row['close'])
+        assert_close(value_k, k.iloc[i])
+        assert_close(value_d, d.iloc[i], rel=1e-7)
+
+
+def test_obv_matches_pandas(klines):
+    df = pd.DataFrame(klines)
+    direction = np.sign(df['close'].diff()).fillna(0)
+    expected = (direction * df['volume']).cumsum()
+
+    obv = StreamingOBV()
+    for i, row in df.iterrows():
+        assert_close(obv.update(row['close'], row['volume']), expected.iloc[i], rel=1e-7)
+
+
+def test_open_candle_does_not_commit(klines):
+    indicators = StreamingIndicatorSet(TRADING_CONFIG)
+    committed = StreamingIndicatorSet(TRADING_CONFIG)
+    columns = [klines[name] for name in ('open_time', 'high', 'low', 'close', 'volume')]
+    for open_time, high, low, close, volume in zip(*columns):
+        # A tick on the unfinished candle is the value the closed candle gets
+        live = indicators.update(open_time, high * 1.001, low, close * 1.0005, volume, closed=False)
+        assert indicators.snapshot() == committed.snapshot()
+        expected = committed.update(open_time, high * 1.001, low, close * 1.0005, volume)
+        for name, value in live.items():
+            assert_close(value, expected[name])
+
+        indicators.update(open_time, high, low, close, volume)
+        committed.restore(indicators.snapshot())
+
+
+def test_snapshot_restore_round_trip(klines):
+    columns = list(zip(*(klines[name] for name in ('open_time', 'high', 'low', 'close', 'volume'))))
+    half = len(columns) // 2
+
+    original = StreamingIndicatorSet(TRADING_CONFIG)
+    for row in columns[:half]:
+        original.update(*row)
+
+    state = original.snapshot()
+    restored = StreamingIndicatorSet(TRADING_CONFIG)
+    restored.restore(state)
+    assert restored.snapshot() == state
+
+    for row in columns[half:]:
+        expected = original.update(*row)
+        values = restored.update(*row)
+        for name, value in values.items():
+            assert_close(value, expected[name])
+    assert restored.snapshot() == original.snapshot()
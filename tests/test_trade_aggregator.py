@@ -0,0 +1,110 @@
+"""
+Trade aggregator: tick bars, volume bars, CVD and burst detection
+"""
+
+import pytest
+
+from market.trade_aggregator import TradeAggregator
+
+T0 = 1_700_000_000_000
+
+
+def _aggregator(**kwargs) -> TradeAggregator:
+    params = dict(tick_bar_size=3, volume_bar_size=2.0, history=10,
+                  burst_window=2, burst_baseline=10, burst_multiplier=3.0,
+                  burst_min_trades=5, burst_cooldown=5)
+    params.update(kwargs)
+    return TradeAggregator('BTCUSDT', **params)
+
+
+def test_tick_bars_close_every_n_trades():
+    agg = _aggregator()
+    trades = [(100.0, 0.1, False), (102.0, 0.2, True), (99.0, 0.3, False),
+              (101.0, 0.1, False), (103.0, 0.1, True)]
+    for i, (price, qty, maker) in enumerate(trades):
+        agg.add_trade(price, qty, maker, T0 + i)
+
+    bars = agg.tick_bars.bars.window()
+    assert len(agg.tick_bars.bars) == 1
+    assert bars['open_time'][0] == T0 and bars['close_time'][0] == T0 + 2
+    assert (bars['open'][0], bars['high'][0], bars['low'][0], bars['close'][0]) == (100.0, 102.0, 99.0, 99.0)
+    assert bars['volume'][0] == pytest.approx(0.6)
+    assert bars['buy_volume'][0] == pytest.approx(0.4)
+    assert bars['delta'][0] == pytest.approx(0.2)
+    assert bars['trades'][0] == 3
+    # The next bar is still open with two trades
+    assert agg.tick_bars.trades == 2 and agg.tick_bars.open == 101.0
+
+
+def test_volume_bar_splits_oversized_trade_but_counts_it_once():
+    agg = _aggregator()
+    agg.add_trade(100.0, 1.5, False, T0)     # Aggressive buy
+    agg.add_trade(101.0, 3.0, True, T0 + 1)  # Aggressive sell: fills bar 1, all of bar 2, half of bar 3
+
+    bars = agg.volume_bars.bars.window()
+    assert list(bars['volume']) == [2.0, 2.0]
+    assert list(bars['trades']) == [2, 0]
+    assert list(bars['delta']) == [pytest.approx(1.0), pytest.approx(-2.0)]
+    assert bars['open'][1] == 101.0 and bars['open_time'][1] == T0 + 1
+
+    builder = agg.volume_bars
+    assert builder.volume == pytest.approx(0.5)
+    assert builder.trades == 0 and builder.open == 101.0
+
+    # A later trade extends the open bar rather than reopening it
+    agg.add_trade(99.0, 1.5, False, T0 + 2)
+    assert builder.volume == 0.0
+    last = agg.volume_bars.bars.window(1)
+    assert (last['open'][0], last['low'][0], last['trades'][0]) == (101.0, 99.0, 1)
+    assert sum(agg.volume_bars.bars.window()['volume']) == pytest.approx(6.0)
+
+
+def test_cvd_and_candle_delta():
+    agg = _aggregator(interval_ms=60_000)
+    agg.add_trade(100.0, 2.0, False, T0)        # Aggressive buy
+    agg.add_trade(100.0, 0.5, True, T0 + 1000)  # Aggressive sell
+    features = agg.get_features()
+    assert features['cvd'] == pytest.approx(1.5)
+    assert features['candle_delta'] == pytest.approx(1.5)
+    assert features['buy_ratio'] == pytest.approx(0.8)
+
+    # A new candle resets the per-candle delta but not the running CVD
+    agg.add_trade(100.0, 1.0, True, T0 + 60_000)
+    features = agg.get_features()
+    assert features['cvd'] == pytest.approx(0.5)
+    assert features['candle_delta'] == pytest.approx(-1.0)
+    assert features['buy_ratio'] == 0.0
+
+
+def test_burst_fires_once_and_respects_cooldown():
+    bursts = []
+    agg = _aggregator(on_burst=bursts.append)
+
+    # Quiet baseline: one trade per second
+    for second in range(12):
+        agg.add_trade(100.0, 0.1, False, T0 + second * 1000)
+    assert agg.activity_ratio() is not None
+    assert not bursts
+
+    # Twenty trades inside one second
+    burst_start = T0 + 12 * 1000
+    for i in range(20):
+        agg.add_trade(101.0, 0.1, False, burst_start + i * 10)
+    assert len(bursts) == 1
+    assert bursts[0]['symbol'] == 'BTCUSDT'
+    assert bursts[0]['trades'] >= 5
+    assert agg.get_features()['last_burst_time'] == bursts[0]['time']
+
+    # Still inside the cooldown: no second trigger
+    for i in range(20):
+        agg.add_trade(101.0, 0.1, False, burst_start + 1000 + i * 10)
+    assert len(bursts) == 1
+    assert agg.get_status()['bursts'] == 1
+
+
+def test_no_burst_without_baseline():
+    agg = _aggregator()
+    for i in range(50):
+        agg.add_trade(100.0, 0.1, False, T0 + i)
+    assert agg.bursts == 0
+    assert agg.activity_ratio() is None
@@ -0,0 +1,100 @@
+"""
+Concurrent watchlist mode: per-symbol snapshots, staleness and failures
+"""
+
+import math
+import time
+from threading import Lock
+
+from benchmarks.fixtures import ReplayClient, synthetic_klines
+from config.settings import KLINE_HISTORY_LIMIT
+from indicators.graph import IndicatorGraph
+from market.data_fetcher import MarketDataFetcher
+from market.kline_store import KlineStore
+
+SYMBOLS = ['AAAUSDT', 'BBBUSDT', 'CCCUSDT', 'DDDUSDT']
+
+
+class _SlowClient(ReplayClient):
+    """Replay client that takes a while per request and can fail symbols"""
+
+    def __init__(self, *args, delay: float = 0.05, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.delay = delay
+        self.failing = set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = Lock()
+
+    def get_klines(self, symbol, *args, **kwargs):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            if symbol in self.failing:
+                raise ConnectionError(f"{symbol} unavailable")
+            return super().get_klines(symbol, *args, **kwargs)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+def _fetcher(store_dir, symbols=SYMBOLS):
+    series = {symbol: synthetic_klines(KLINE_HISTORY_LIMIT + 5, seed=i) for i, symbol in enumerate(SYMBOLS)}
+    client = _SlowClient(series, visible=KLINE_HISTORY_LIMIT)
+    fetcher = MarketDataFetcher(client, streaming=False, symbols=symbols,
+                                store=KlineStore(str(store_dir)), graph=IndicatorGraph(),
+                                order_book=False)
+    return fetcher, client
+
+
+def test_snapshot_fetches_symbols_concurrently(tmp_path):
+    fetcher, client = _fetcher(tmp_path)
+    try:
+        result = fetcher.get_watchlist_snapshot()
+    finally:
+        fetcher.close()
+
+    assert result['failed'] == []
+    assert list(result['markets']) == SYMBOLS
+    for symbol, market in result['markets'].items():
+        assert market.symbol == symbol
+        assert market.price == float(client.series[symbol][KLINE_HISTORY_LIMIT - 1][4])
+        assert 0 <= result['staleness'][symbol] < 1.0
+    assert client.max_in_flight > 1
+
+
+def test_failed_symbol_is_reported_and_goes_stale(tmp_path):
+    fetcher, client = _fetcher(tmp_path)
+    try:
+        fetcher.get_watchlist_snapshot()
+        client.failing.add('CCCUSDT')
+        time.sleep(0.2)
+        client.advance()
+        result = fetcher.get_watchlist_snapshot()
+    finally:
+        fetcher.close()
+
+    assert result['failed'] == ['CCCUSDT']
+    assert result['markets']['CCCUSDT'] is None
+    assert result['staleness']['CCCUSDT'] >= 0.2
+    assert all(result['staleness'][s] < 0.2 for s in SYMBOLS if s != 'CCCUSDT')
+    assert result['markets']['DDDUSDT'].price == float(client.series['DDDUSDT'][KLINE_HISTORY_LIMIT][4])
+
+
+def test_never_refreshed_symbol_has_no_staleness(tmp_path):
+    fetcher, client = _fetcher(tmp_path)
+    client.failing.add('BBBUSDT')
+    try:
+        result = fetcher.get_watchlist_snapshot()
+        features = fetcher.get_watchlist_features()
+    finally:
+        fetcher.close()
+
+    assert result['failed'] == ['BBBUSDT']
+    assert result['staleness']['BBBUSDT'] is None
+
+    by_symbol = {record['symbol']: record for record in features}
+    assert math.isnan(by_symbol['BBBUSDT']['rsi'])
+    assert not math.isnan(by_symbol['AAAUSDT']['rsi'])
@@ -0,0 +1,143 @@
+"""
+Request weight budget: priorities, queueing and used-weight header sync
+"""
+
+import time
+from threading import Thread
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+from utils import weight_budget
+from utils.weight_budget import (
+    PRIORITY_MARKET, PRIORITY_ORDER, USED_WEIGHT_HEADER, BudgetedClient, RequestWeightBudget
+)
+
+
+@pytest.fixture(autouse=True)
+def window_clock(monkeypatch):
+    """Start every test just after a window boundary so no window rolls mid-test"""
+    started = time.monotonic()
+    clock = SimpleNamespace(time=lambda: 1_700_000_040.0 + time.monotonic() - started)
+    monkeypatch.setattr(weight_budget, 'time', clock)
+
+
+def _budget(limit: int = 10) -> RequestWeightBudget:
+    # With limit 10: capacity 10, of which market traffic may use 8
+    return RequestWeightBudget(limit=limit, safety=1.0, order_reserve=0.2)
+
+
+def _response(used_weight: int, status: int = 200, headers=None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response.headers[USED_WEIGHT_HEADER] = str(used_weight)
+    response.headers.update(headers or {})
+    return response
+
+
+class _FakeClient:
+    """Stands in for python-binance: responses go through the session hooks"""
+
+    def __init__(self):
+        self.session = requests.Session()
+        self.response = None
+
+    def _respond(self, response: requests.Response) -> None:
+        for hook in self.session.hooks['response']:
+            hook(response)
+        self.response = response
+
+    def get_klines(self, used_weight: int, stale_weight: int = None):
+        self._respond(_response(used_weight))
+        if stale_weight is not None:
+            # Another thread's call finished in between and replaced .response
+            self.response = _response(stale_weight)
+        return []
+
+    def get_order(self):
+        error = requests.HTTPError('429')
+        error.response = _response(10, status=429, headers={'Retry-After': '0.2'})
+        raise error
+
+
+def _wait_until_queued(budget: RequestWeightBudget, priority: int, count: int = 1) -> None:
+    deadline = time.time() + 2
+    while budget.get_stats()['queued'][priority] < count:
+        assert time.time() < deadline, "request never queued"
+        time.sleep(0.005)
+
+
+def test_order_traffic_may_use_the_reserve():
+    budget = _budget()
+    assert budget.acquire(8, PRIORITY_MARKET)
+    assert not budget.acquire(1, PRIORITY_MARKET, timeout=0.05)
+    assert budget.acquire(2, PRIORITY_ORDER, timeout=0)
+    assert budget.get_stats()['used'] == 10
+
+
+def test_exhausted_budget_queues_until_released():
+    budget = _budget()
+    assert budget.acquire(8)
+    results = []
+    waiter = Thread(target=lambda: results.append(budget.acquire(3, timeout=2)))
+    waiter.start()
+    _wait_until_queued(budget, PRIORITY_MARKET)
+    assert not results
+
+    # Simulate the next window opening
+    with budget._cond:
+        budget.used = 0
+        budget._cond.notify_all()
+    waiter.join(timeout=2)
+
+    assert results == [True]
+    stats = budget.get_stats()
+    assert stats['used'] == 3 and stats['waits'] == 1
+
+
+def test_waiting_order_is_served_before_market():
+    budget = _budget()
+    assert budget.acquire(10, PRIORITY_ORDER)
+    results = {}
+    order = Thread(target=lambda: results.setdefault('order', budget.acquire(10, PRIORITY_ORDER, timeout=2)))
+    market = Thread(target=lambda: results.setdefault('market', budget.acquire(1, PRIORITY_MARKET, timeout=0.5)))
+    order.start()
+    _wait_until_queued(budget, PRIORITY_ORDER)
+    market.start()
+    _wait_until_queued(budget, PRIORITY_MARKET)
+
+    with budget._cond:
+        budget.used = 0
+        budget._cond.notify_all()
+    order.join(timeout=2)
+    market.join(timeout=2)
+
+    assert results == {'order': True, 'market': False}
+
+
+def test_header_sync_uses_each_calls_own_response():
+    budget = _budget(limit=100)
+    client = BudgetedClient(_FakeClient(), budget)
+    BudgetedClient(client._client, budget, PRIORITY_ORDER)  # Second proxy: hook added once
+    assert client._client.session.hooks['response'].count(budget._response_hook) == 1
+
+    client.get_klines(7, stale_weight=9)
+    assert budget.get_stats()['used'] == 7
+
+    # The header never lowers the local count
+    client.get_klines(1)
+    assert budget.get_stats()['used'] == 9
+
+
+def test_rate_limit_error_pauses_traffic():
+    budget = _budget()
+    client = BudgetedClient(_FakeClient(), budget, PRIORITY_ORDER)
+    try:
+        client.get_order()
+    except requests.HTTPError:
+        pass
+    stats = budget.get_stats()
+    assert stats['backoffs'] == 1 and stats['used'] == 10
+    assert 0 < stats['blocked_for'] <= 0.2
+    assert not budget.acquire(1, PRIORITY_ORDER, timeout=0.05)
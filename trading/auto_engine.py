@@ -7,15 +7,99 @@ import logging
 import time
 from datetime import datetime
 from typing import Dict, Optional
+from market.bus import TRIGGER_MONITOR
+from market.snapshot import MarketSnapshot
 from config.settings import TRADING_CONFIG
 
 logger = logging.getLogger(__name__)
 
 
+def score_setup(market_data: MarketSnapshot) -> Dict[str, int]:
+    """
+    Rule-based setup score and its components
+    
+    Score = Trend (0-30) + Volume (0-25) + Sentiment (0-15) + RR (0-20) + News (0-10)
+    
+    RR and News have no inputs yet and always add a fixed 25, so ``signal``
+    (Trend + Volume + Sentiment, 25-70) is the part that reflects the market.
+    
+    Args:
+        market_data: Market snapshot
+        
+    Returns:
+        Dictionary with trend, volume, sentiment, rr, news, signal and total (0-100)
+    """
+    # 1. Trend Strength (0-30)
+    ema_fast = market_data.ema_fast
+    ema_slow = market_data.ema_slow
+    current_price = market_data.price
+    
+    if ema_fast > ema_slow and current_price > ema_slow:
+        trend_score = 30  # Strong bullish
+    elif ema_fast < ema_slow and current_price < ema_slow:
+        trend_score = 25  # Strong bearish
+    else:
+        trend_score = 10  # Weak signal
+    
+    # 2. Volume (0-25)
+    avg_volume = market_data.avg_volume
+    current_volume = market_data.volume
+    volume_ratio = current_volume / avg_volume if avg_volume > 0 else 1
+    
+    if volume_ratio > 1.5:
+        volume_score = 25
+    elif volume_ratio > 1.2:
+        volume_score = 20
+    elif volume_ratio > 1.0:
+        volume_score = 15
+    else:
+        volume_score = 5
+    
+    # 3. Market Sentiment (0-15)
+    rsi = market_data.rsi
+    
+    if 30 < rsi < 70:
+        sentiment_score = 15  # Healthy range
+    elif rsi < 30 or rsi > 70:
+        sentiment_score = 10  # Extreme (caution)
+    else:
+        sentiment_score = 5  # Neutral
+    
+    # 4. Risk:Reward (0-20) - Not in market data; assume a good setup
+    rr_ratio = 1.5
+    
+    if rr_ratio >= 2.5:
+        rr_score = 20
+    elif rr_ratio >= 2.0:
+        rr_score = 18
+    elif rr_ratio >= 1.5:
+        rr_score = 15
+    elif rr_ratio >= 1.0:
+        rr_score = 10
+    else:
+        rr_score = 0
+    
+    # 5. News Risk (0-10) - No news feed yet
+    has_major_event = False
+    news_score = 0 if has_major_event else 10
+    
+    total_score = trend_score + volume_score + sentiment_score + rr_score + news_score
+    
+    return {
+        'trend': trend_score,
+        'volume': volume_score,
+        'sentiment': sentiment_score,
+        'rr': rr_score,
+        'news': news_score,
+        'signal': trend_score + volume_score + sentiment_score,
+        'total': min(total_score, 100),
+    }
+
+
 class AutoTradingEngine:
     """Automated trading execution engine"""
     
-    def __init__(self, data_fetcher, ai_analyzer, trade_executor):
+    def __init__(self, data_fetcher, ai_analyzer, trade_executor, market_bus=None):
         """
         Initialize auto trading engine
         
@@ -23,8 +107,11 @@ class AutoTradingEngine:
             data_fetcher: Market data fetcher
             ai_analyzer: AI analyzer for predictions
             trade_executor: Trade executor
+            market_bus: Optional MarketDataBus to consume snapshots from
+                instead of fetching on our own timer
         """
         self.data_fetcher = data_fetcher
+        self.market_bus = market_bus
         self.ai_analyzer = ai_analyzer
         self.trade_executor = trade_executor
         self.is_running = False
@@ -32,7 +119,7 @@ class AutoTradingEngine:
         self.trades_today = 0
         self.loss_today = 0
     
-    def calculate_ai_score(self, market_data: Dict) -> float:
+    def calculate_ai_score(self, market_data: MarketSnapshot) -> float:
         """
         Calculate AI trading score (0-100)
         
@@ -45,68 +132,14 @@ class AutoTradingEngine:
             AI score (0-100)
         """
         try:
-            score = 0
-            
-            # 1. Trend Strength (0-30)
-            ema_fast = market_data.get('ema_fast', 0)
-            ema_slow = market_data.get('ema_slow', 0)
-            current_price = market_data.get('current_price', 0)
-            
-            if ema_fast > ema_slow and current_price > ema_slow:
-                trend_score = 30  # Strong bullish
-            elif ema_fast < ema_slow and current_price < ema_slow:
-                trend_score = 25  # Strong bearish
-            else:
-                trend_score = 10  # Weak signal
-            
-            # 2. Volume (0-25)
-            avg_volume = market_data.get('avg_volume', 1)
-            current_volume = market_data.get('volume', 1)
-            volume_ratio = current_volume / avg_volume if avg_volume > 0 else 1
-            
-            if volume_ratio > 1.5:
-                volume_score = 25
-            elif volume_ratio > 1.2:
-                volume_score = 20
-            elif volume_ratio > 1.0:
-                volume_score = 15
-            else:
-                volume_score = 5
-            
-            # 3. Market Sentiment (0-15)
-            rsi = market_data.get('rsi', 50)
-            
-            if 30 < rsi < 70:
-                sentiment_score = 15  # Healthy range
-            elif rsi < 30 or rsi > 70:
-                sentiment_score = 10  # Extreme (caution)
-            else:
-                sentiment_score = 5  # Neutral
+            scores = score_setup(market_data)
             
-            # 4. Risk:Reward (0-20) - Assume good setup
-            rr_ratio = market_data.get('rr_ratio', 1.5)
+            logger.info(
+                f"AI Score: {scores['total']}/100 (Trend:{scores['trend']} Vol:{scores['volume']} "
+                f"Sent:{scores['sentiment']} RR:{scores['rr']} News:{scores['news']})"
+            )
             
-            if rr_ratio >= 2.5:
-                rr_score = 20
-            elif rr_ratio >= 2.0:
-                rr_score = 18
-            elif rr_ratio >= 1.5:
-                rr_score = 15
-            elif rr_ratio >= 1.0:
-                rr_score = 10
-            else:
-                rr_score = 0
-            
-            # 5. News Risk (0-10)
-            has_major_event = market_data.get('has_major_event', False)
-            news_score = 0 if has_major_event else 10
-            
-            # Total AI Score
-            total_score = trend_score + volume_score + sentiment_score + rr_score + news_score
-            
-            logger.info(f"AI Score: {total_score}/100 (Trend:{trend_score} Vol:{volume_score} Sent:{sentiment_score} RR:{rr_score} News:{news_score})")
-            
-            return min(total_score, 100)
+            return scores['total']
         
         except Exception as e:
             logger.error(f"AI score calculation error: {e}")
@@ -148,7 +181,7 @@ class AutoTradingEngine:
             logger.error(f"Risk check error: {e}")
             return False
     
-    def generate_trade_signal(self, market_data: Dict) -> Optional[Dict]:
+    def generate_trade_signal(self, market_data: MarketSnapshot) -> Optional[Dict]:
         """
         Generate trading signal based on analysis
         
@@ -167,9 +200,9 @@ class AutoTradingEngine:
                 return None
             
             # Determine trade direction
-            ema_fast = market_data.get('ema_fast', 0)
-            ema_slow = market_data.get('ema_slow', 0)
-            current_price = market_data.get('current_price', 0)
+            ema_fast = market_data.ema_fast
+            ema_slow = market_data.ema_slow
+            current_price = market_data.price
             
             if ema_fast > ema_slow and current_price > ema_slow:
                 trade_type = 'BUY'
@@ -182,7 +215,7 @@ class AutoTradingEngine:
                 return None
             
             # Calculate position
-            atr = market_data.get('atr', 10)
+            atr = market_data.atr
             stop_loss = current_price - atr if trade_type == 'BUY' else current_price + atr
             take_profit = current_price + (atr * 2) if trade_type == 'BUY' else current_price - (atr * 2)
             
@@ -254,14 +287,26 @@ class AutoTradingEngine:
         logger.info("🤖 Auto-Trading Engine Started")
         self.is_running = True
         
+        check_interval = TRADING_CONFIG.get('check_interval', 60)
+        subscription = self.market_bus.subscribe('auto_engine') if self.market_bus else None
+        
         while self.is_running:
             try:
-                # Fetch market data
-                market_data = self.data_fetcher.get_market_data()
+                if subscription:
+                    # Wait for the shared snapshot (latest only)
+                    market_data = subscription.get(timeout=check_interval * 2)
+                else:
+                    # Fetch market data
+                    market_data = self.data_fetcher.get_market_data()
                 
                 if not market_data:
                     logger.debug("No market data")
-                    time.sleep(TRADING_CONFIG.get('check_interval', 60))
+                    if not subscription:
+                        time.sleep(check_interval)
+                    continue
+                
+                # Dead market cadence: no analysis this cycle
+                if market_data.trigger == TRIGGER_MONITOR:
                     continue
                 
                 # Generate signal
@@ -271,12 +316,16 @@ class AutoTradingEngine:
                     # Execute trade
                     self.execute_trade_auto(signal)
                 
-                # Sleep before next check
-                time.sleep(TRADING_CONFIG.get('check_interval', 60))
+                # Sleep before next check (the bus paces subscribers itself)
+                if not subscription:
+                    time.sleep(check_interval)
             
             except Exception as e:
                 logger.error(f"Market monitoring error: {e}")
-                time.sleep(TRADING_CONFIG.get('check_interval', 60))
+                time.sleep(check_interval)
+        
+        if subscription:
+            self.market_bus.unsubscribe(subscription)
     
     def start(self) -> None:
         """Start automatic trading"""
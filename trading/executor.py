@@ -7,6 +7,7 @@ import logging
 from typing import Dict, Optional
 from binance.client import Client
 from binance.enums import SIDE_BUY, SIDE_SELL, ORDER_TYPE_MARKET
+from market.snapshot import MarketSnapshot
 from config.settings import TRADING_CONFIG
 
 logger = logging.getLogger(__name__)
@@ -30,7 +31,7 @@ class TradeExecutor:
         self.current_price = 0
         self.bot_running = False
     
-    def execute_trade(self, ai_decision: Dict, market_data: Dict) -> Dict:
+    def execute_trade(self, ai_decision: Dict, market_data: MarketSnapshot) -> Dict:
         """
         Execute a trade based on AI decision
         
@@ -62,6 +63,12 @@ class TradeExecutor:
             if action == 'HOLD':
                 return {"status": "hold"}
             
+            # Check spread (only known when order book data is available)
+            spread_bps = market_data.spread_bps
+            if spread_bps is not None and spread_bps > TRADING_CONFIG['max_spread_bps']:
+                logger.info(f"Spread too wide: {spread_bps:.1f} bps")
+                return {"status": "skipped", "reason": "Spread too wide"}
+            
             # Calculate position size
             position_info = self._calculate_position_size(ai_decision)
             if not position_info:
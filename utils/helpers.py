@@ -5,6 +5,8 @@ Utility functions for the trading bot
 import json
 import logging
 import os
+import time
+from collections import deque
 from typing import Dict, List
 from datetime import datetime
 
@@ -149,7 +151,7 @@ def validate_trading_pair(symbol: str) -> bool:
 
 
 class RateLimiter:
-    """Simple rate limiter for API calls"""
+    """Simple sliding-window rate limiter (Binance REST uses utils.weight_budget)"""
     
     def __init__(self, max_calls: int, time_window: int):
         """
@@ -161,7 +163,7 @@ class RateLimiter:
         """
         self.max_calls = max_calls
         self.time_window = time_window
-        self.calls = []
+        self.calls = deque()
     
     def is_allowed(self) -> bool:
         """
@@ -170,13 +172,12 @@ class RateLimiter:
         Returns:
             True if call is allowed, False if rate limit exceeded
         """
-        from datetime import datetime, timedelta
+        now = time.monotonic()
+        cutoff = now - self.time_window
         
-        now = datetime.now()
-        cutoff = now - timedelta(seconds=self.time_window)
-        
-        # Remove old calls outside time window
-        self.calls = [call for call in self.calls if call > cutoff]
+        # Drop calls that left the time window (oldest first)
+        while self.calls and self.calls[0] <= cutoff:
+            self.calls.popleft()
         
         if len(self.calls) < self.max_calls:
             self.calls.append(now)
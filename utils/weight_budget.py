@@ -0,0 +1,297 @@
+"""
+Request Weight Budget Module
+Shared Binance REST request-weight accounting for every component that
+talks to the exchange
+
+Binance counts request weight per IP in fixed one-minute windows and
+reports the running total in the ``X-MBX-USED-WEIGHT-1M`` response header.
+Going over the limit returns 429; ignoring 429s gets the IP banned (418).
+"""
+
+import logging
+import time
+from threading import Condition
+from typing import Callable, Dict, Optional, Union
+
+from config.settings import (
+    EXCHANGE_WEIGHT_LIMIT, EXCHANGE_WEIGHT_SAFETY, EXCHANGE_WEIGHT_ORDER_RESERVE
+)
+
+logger = logging.getLogger(__name__)
+
+# Lower value = served first
+PRIORITY_ORDER = 0   # Order placement, exits, account checks
+PRIORITY_MARKET = 1  # Market data polling
+
+USED_WEIGHT_HEADER = 'X-MBX-USED-WEIGHT-1M'
+_WINDOW_SECONDS = 60
+
+
+def _depth_weight(kwargs: Dict) -> int:
+    limit = int(kwargs.get('limit', 100))
+    if limit <= 100:
+        return 5
+    if limit <= 500:
+        return 25
+    if limit <= 1000:
+        return 50
+    return 250
+
+
+# Spot REST weights per python-binance client method (unlisted methods pass through)
+ENDPOINT_WEIGHTS: Dict[str, Union[int, Callable[[Dict], int]]] = {
+    'ping': 1,
+    'get_server_time': 1,
+    'get_exchange_info': 20,
+    'get_symbol_info': 20,
+    'get_klines': 2,
+    'get_historical_klines': 2,
+    'get_symbol_ticker': 2,
+    'get_orderbook_ticker': 2,
+    'get_ticker': 2,
+    'get_order_book': _depth_weight,
+    'get_recent_trades': 25,
+    'get_aggregate_trades': 4,
+    'get_account': 20,
+    'get_asset_balance': 20,
+    'get_open_orders': 6,
+    'get_order': 4,
+    'get_my_trades': 20,
+    'create_order': 1,
+    'order_market_buy': 1,
+    'order_market_sell': 1,
+    'cancel_order': 1,
+}
+
+
+def endpoint_weight(method: str, kwargs: Optional[Dict] = None) -> Optional[int]:
+    """
+    Request weight of a client method call
+
+    Args:
+        method: python-binance client method name
+        kwargs: Call arguments (some weights depend on ``limit``)
+
+    Returns:
+        Weight, or None if the method is not a weighted REST call
+    """
+    weight = ENDPOINT_WEIGHTS.get(method)
+    if callable(weight):
+        return weight(kwargs or {})
+    return weight
+
+
+class RequestWeightBudget:
+    """Per-minute request-weight budget that queues callers instead of failing"""
+
+    def __init__(self, limit: int = EXCHANGE_WEIGHT_LIMIT,
+                 safety: float = EXCHANGE_WEIGHT_SAFETY,
+                 order_reserve: float = EXCHANGE_WEIGHT_ORDER_RESERVE):
+        """
+        Initialize budget
+
+        Args:
+            limit: Exchange REQUEST_WEIGHT limit per minute
+            safety: Fraction of the limit this process allows itself
+            order_reserve: Fraction of the budget only order traffic may use
+        """
+        self.capacity = int(limit * safety)
+        self.market_capacity = int(self.capacity * (1 - order_reserve))
+
+        self.used = 0
+        self.window_start = self._window(time.time())
+        self.blocked_until = 0.0
+
+        self.requests = 0
+        self.waits = 0
+        self.wait_seconds = 0.0
+        self.backoffs = 0
+
+        self._waiting = {PRIORITY_ORDER: 0, PRIORITY_MARKET: 0}
+        self._cond = Condition()
+
+    @staticmethod
+    def _window(now: float) -> float:
+        return now - now % _WINDOW_SECONDS
+
+    def _roll(self, now: float) -> None:
+        window = self._window(now)
+        if window > self.window_start:
+            self.window_start = window
+            self.used = 0
+
+    def _fits(self, weight: int, priority: int) -> bool:
+        if priority != PRIORITY_ORDER and self._waiting[PRIORITY_ORDER]:
+            return False
+        ceiling = self.capacity if priority == PRIORITY_ORDER else self.market_capacity
+        # A single request heavier than the ceiling still goes out in an empty window
+        return self.used + weight <= ceiling or self.used == 0
+
+    def acquire(self, weight: int, priority: int = PRIORITY_MARKET,
+                timeout: Optional[float] = None) -> bool:
+        """
+        Reserve weight, waiting for the next window if the budget is spent
+
+        Order traffic may dip into the reserve and is served before any
+        waiting market-data request.
+
+        Args:
+            weight: Request weight
+            priority: PRIORITY_ORDER or PRIORITY_MARKET
+            timeout: Seconds to wait at most (None waits as long as needed)
+
+        Returns:
+            True once the weight is reserved, False on timeout
+        """
+        started = time.time()
+        deadline = None if timeout is None else started + timeout
+        waited = False
+
+        with self._cond:
+            self._waiting[priority] += 1
+            try:
+                while True:
+                    now = time.time()
+                    self._roll(now)
+                    if now >= self.blocked_until and self._fits(weight, priority):
+                        self.used += weight
+                        self.requests += 1
+                        if waited:
+                            self.waits += 1
+                            self.wait_seconds += now - started
+                        return True
+
+                    wake = max(self.blocked_until, self.window_start + _WINDOW_SECONDS)
+                    if deadline is not None:
+                        if now >= deadline:
+                            return False
+                        wake = min(wake, deadline)
+                    waited = True
+                    self._cond.wait(max(0.0, wake - now))
+            finally:
+                self._waiting[priority] -= 1
+                self._cond.notify_all()
+
+    def sync(self, used_weight: int) -> None:
+        """
+        Adopt the exchange's count from ``X-MBX-USED-WEIGHT-1M``
+
+        The header only raises the local count - other processes on the
+        same IP spend from the same budget, while weight reserved for
+        in-flight requests is not in the header yet.
+        """
+        with self._cond:
+            self._roll(time.time())
+            if used_weight > self.used:
+                self.used = used_weight
+
+    def sync_from_response(self, response) -> None:
+        """Sync from a ``requests`` response (ignored if the header is absent)"""
+        headers = getattr(response, 'headers', None) or {}
+        value = headers.get(USED_WEIGHT_HEADER)
+        if value is not None:
+            try:
+                self.sync(int(value))
+            except ValueError:
+                pass
+
+    def attach(self, session) -> None:
+        """
+        Sync from every response a ``requests`` session receives
+
+        The hook runs in the thread that made the call with that call's own
+        response, so concurrent requests on a shared client cannot hand
+        each other's headers to the budget.
+        """
+        hooks = session.hooks.setdefault('response', [])
+        if self._response_hook not in hooks:
+            hooks.append(self._response_hook)
+
+    def _response_hook(self, response, *args, **kwargs) -> None:
+        self.sync_from_response(response)
+
+    def back_off(self, seconds: float) -> None:
+        """
+        Stop all traffic for a while after a 429/418 from the exchange
+
+        Args:
+            seconds: Retry-After value (or our own estimate)
+        """
+        with self._cond:
+            self.blocked_until = max(self.blocked_until, time.time() + seconds)
+            self.backoffs += 1
+            self._cond.notify_all()
+        logger.warning(f"⛔ Exchange rate limit hit, pausing REST requests for {seconds:.0f}s")
+
+    def get_stats(self) -> Dict:
+        """Current window usage and wait statistics"""
+        with self._cond:
+            self._roll(time.time())
+            return {
+                'used': self.used,
+                'capacity': self.capacity,
+                'market_capacity': self.market_capacity,
+                'requests': self.requests,
+                'waits': self.waits,
+                'wait_seconds': round(self.wait_seconds, 2),
+                'backoffs': self.backoffs,
+                'blocked_for': round(max(0.0, self.blocked_until - time.time()), 1),
+                'queued': dict(self._waiting),
+            }
+
+
+class BudgetedClient:
+    """
+    Binance client proxy that spends weight from a shared budget
+
+    Weighted REST methods wait for budget before the call; the used-weight
+    header is synced from the client's HTTP session as each response
+    arrives. Everything else is passed through.
+    """
+
+    def __init__(self, binance_client, budget: RequestWeightBudget,
+                 priority: int = PRIORITY_MARKET):
+        """
+        Initialize proxy
+
+        Args:
+            binance_client: Underlying python-binance client (may be shared)
+            budget: Budget shared by every proxy over the same IP
+            priority: Priority of this proxy's requests
+        """
+        self._client = binance_client
+        self.budget = budget
+        self.priority = priority
+
+        session = getattr(binance_client, 'session', None)
+        if session is not None:
+            budget.attach(session)
+
+    def __getattr__(self, name):
+        attr = getattr(self._client, name)
+        if name not in ENDPOINT_WEIGHTS or not callable(attr):
+            return attr
+
+        def call(*args, **kwargs):
+            self.budget.acquire(endpoint_weight(name, kwargs), self.priority)
+            try:
+                result = attr(*args, **kwargs)
+            except Exception as e:
+                self._handle_error(e)
+                raise
+            return result
+
+        return call
+
+    def _handle_error(self, error: Exception) -> None:
+        response = getattr(error, 'response', None)
+        status = getattr(error, 'status_code', None) or getattr(response, 'status_code', None)
+        if response is not None:
+            self.budget.sync_from_response(response)
+        if status in (418, 429):
+            headers = getattr(response, 'headers', None) or {}
+            try:
+                retry_after = float(headers.get('Retry-After', _WINDOW_SECONDS))
+            except ValueError:
+                retry_after = _WINDOW_SECONDS
+            self.budget.back_off(retry_after)